@@ -42,22 +42,21 @@ PROVIDER="cloudflare"
 #
 PROVIDER_CREDENTIALS=("--auth-username=MY_USERNAME" "--auth-token=MY_API_KEY")
 #
-# PROVIDER_UPDATE_DELAY:
-#   How many seconds to wait after updating your DNS records. This may be required,
-#   depending on how slow your DNS host is to begin serving new DNS records after updating
-#   them via the API. 30 seconds is a safe default, but some providers can be very slow 
-#   (e.g. Linode).
+# PROVIDER_PROPAGATION_TIMEOUT:
+#   After updating your DNS records, Lexicon waits until every authoritative nameserver
+#   of your domain serves them (this requires the dnspython library, installed with
+#   lexicon[localzone]). This is the maximum number of seconds to wait: some providers
+#   can be very slow (e.g. Linode).
 #
-#   Defaults to 30 seconds.
+#   Defaults to 120 seconds.
 #
-PROVIDER_UPDATE_DELAY=30
+PROVIDER_PROPAGATION_TIMEOUT=120
 
 # To be invoked via Certbot's --manual-auth-hook
 function auth {
     lexicon "${PROVIDER}" "${PROVIDER_CREDENTIALS[@]}" \
-    create "${CERTBOT_DOMAIN}" TXT --name "_acme-challenge.${CERTBOT_DOMAIN}" --content "${CERTBOT_VALIDATION}"
-
-    sleep "${PROVIDER_UPDATE_DELAY}"
+    create "${CERTBOT_DOMAIN}" TXT --name "_acme-challenge.${CERTBOT_DOMAIN}" --content "${CERTBOT_VALIDATION}" \
+    --wait-propagation --propagation-timeout "${PROVIDER_PROPAGATION_TIMEOUT}"
 }
 
 # To be invoked via Certbot's --manual-cleanup-hook
@@ -6,7 +6,7 @@ set -e
 set -u
 set -o pipefail
 
-export PROVIDER_UPDATE_DELAY=${PROVIDER_UPDATE_DELAY:-"30"}
+export PROVIDER_PROPAGATION_TIMEOUT=${PROVIDER_PROPAGATION_TIMEOUT:-"120"}
 export PROVIDER=${PROVIDER:-"cloudflare"}
 
 function deploy_challenge {
@@ -17,14 +17,8 @@ function deploy_challenge {
         echo "deploy_challenge called: ${DOMAIN}, ${TOKEN_FILENAME}, ${TOKEN_VALUE}"
 
         lexicon $PROVIDER create ${DOMAIN} TXT --name="_acme-challenge.${DOMAIN}." \
-        --content="${TOKEN_VALUE}"
-    done
-
-    local DELAY_COUNTDOWN=$PROVIDER_UPDATE_DELAY
-    while [ $DELAY_COUNTDOWN -gt 0 ]; do
-        echo -ne "${DELAY_COUNTDOWN}\033[0K\r"
-        sleep 1
-        : $((DELAY_COUNTDOWN--))
+        --content="${TOKEN_VALUE}" \
+        --wait-propagation --propagation-timeout="${PROVIDER_PROPAGATION_TIMEOUT}"
     done
 
     # This hook is called once for every domain chain that needs to be
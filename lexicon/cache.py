@@ -0,0 +1,109 @@
+"""
+This module handles the persistent cache of Lexicon: small JSON documents stored
+in a cache directory, that allow to reuse between two invocations of Lexicon some data
+that is costly to compute or to retrieve.
+
+The cache directory is '~/.cache/lexicon' by default, and can be changed using the
+LEXICON_CACHE_DIR environment variable. The cache is purely an optimization: any error
+while reading or writing a cache file is logged and ignored.
+"""
+import errno
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR_DEFAULT = os.path.join("~", ".cache", "lexicon")
+
+
+def cache_dir():
+    """Return the path of the directory where Lexicon cache files are stored"""
+    return os.path.expanduser(os.environ.get("LEXICON_CACHE_DIR", CACHE_DIR_DEFAULT))
+
+
+def load(name):
+    """
+    Load the content of the cache file with the given name.
+    None is returned if the cache file does not exist or cannot be read.
+    """
+    path = os.path.join(cache_dir(), "{0}.json".format(name))
+    try:
+        with open(path, "r") as stream:
+            return json.load(stream)
+    except (IOError, OSError, ValueError) as error:
+        if getattr(error, "errno", None) != errno.ENOENT:
+            LOGGER.debug("Could not read cache file %s: %s", path, error)
+        return None
+
+
+def dump(name, content):
+    """
+    Store the given JSON serializable content in the cache file with the given name.
+    File is written atomically, and is readable only by its owner.
+    """
+    directory = cache_dir()
+    path = os.path.join(directory, "{0}.json".format(name))
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "w") as stream:
+                json.dump(content, stream)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except (IOError, OSError, TypeError, ValueError) as error:
+        LOGGER.debug("Could not write cache file %s: %s", path, error)
+
+
+_ENTRIES_LOCK = threading.Lock()
+
+
+def get_entry(name, key, margin=0):
+    """
+    Return the value of the entry with the given key in the cache file with the given
+    name, or None if missing or expiring in less than margin seconds.
+    """
+    entry = _load_entries(name).get(key)
+    if entry and entry["expires_at"] > time.time() + margin:
+        return entry["value"]
+    return None
+
+
+def set_entry(name, key, value, expires_at):
+    """
+    Store the given value with the given key in the cache file with the given name,
+    until the given epoch time. Expired entries of the file are removed.
+    """
+    with _ENTRIES_LOCK:
+        entries = _load_entries(name)
+        entries[key] = {"value": value, "expires_at": expires_at}
+        dump(name, entries)
+
+
+def delete_entry(name, key):
+    """Remove the entry with the given key from the cache file with the given name"""
+    with _ENTRIES_LOCK:
+        entries = _load_entries(name)
+        if entries.pop(key, None):
+            dump(name, entries)
+
+
+def _load_entries(name):
+    entries = load(name)
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("expires_at"), (int, float))
+        and entry["expires_at"] > now
+    }
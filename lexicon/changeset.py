@@ -0,0 +1,176 @@
+"""
+Change sets: lists of record creations, updates and deletions applied together to a
+DNS zone by Provider.apply_changes().
+
+Each change is a dict holding the action ("create", "update" or "delete") and its
+parameters, with the same keys as the operations of a batch:
+    {'action': 'create', 'type': 'TXT', 'name': '_acme-challenge', 'content': 'token'}
+
+Providers having a bulk API list with touched_records() the records that the changes
+may modify, compute with plan() these records once all changes are applied, then submit
+the difference in one request (see diff() and changed_rrsets()).
+"""
+from collections import OrderedDict
+
+ACTIONS = ("create", "update", "delete")
+
+
+def normalize(change):
+    """
+    Return the given change with all its keys, or raise ValueError if it is invalid.
+    The record type can also be given with the "rtype" key.
+    """
+    action = change.get("action")
+    if action not in ACTIONS:
+        raise ValueError("Invalid action statement: {0}".format(action))
+
+    change = {
+        "action": action,
+        "type": change.get("type", change.get("rtype")),
+        "name": change.get("name"),
+        "content": change.get("content"),
+        "identifier": change.get("identifier"),
+    }
+    if action == "create" and not (
+        change["type"] and change["name"] and change["content"]
+    ):
+        raise ValueError("Type, name and content are required to create a record")
+    if action == "update" and not (
+        change["identifier"] or (change["type"] and change["name"])
+    ):
+        raise ValueError("Identifier or type and name are required to update a record")
+    return change
+
+
+def touched_records(changes, list_records):
+    """
+    Return the records of the zone that the given normalized changes may modify, calling
+    list_records(rtype, name) only for the record sets targeted by the changes, so that
+    providers can use their filtered lookups. The whole zone is listed with
+    list_records(None, None) if a change targets a record by its identifier, or has
+    no name.
+    """
+    if any(change["identifier"] or not change["name"] for change in changes):
+        return list_records(None, None)
+
+    records = []
+    keys = set()
+    for rtype, name in OrderedDict.fromkeys(
+        (change["type"], change["name"]) for change in changes
+    ):
+        for record in list_records(rtype, name):
+            if _key(record) not in keys:
+                keys.add(_key(record))
+                records.append(record)
+    return records
+
+
+def plan(records, changes, full_name):
+    """
+    Apply the given normalized changes to the given records of a zone, without sending
+    anything to the provider, and return the records of the zone after these changes
+    with the result of each change. Changes have the semantic of the Provider API:
+      - create does nothing if the record already exists,
+      - update replaces the record with the given identifier, or the first record with
+        the given type and name, and raises ValueError if there is no such record,
+      - delete removes the record with the given identifier, or every record matching
+        the given type, name and content, and does nothing if there is no such record.
+    full_name converts the names of the changes to the full names used by the records.
+    """
+    records = [dict(record) for record in records]
+    results = []
+    for change in changes:
+        name = full_name(change["name"]) if change["name"] else None
+
+        if change["action"] == "create":
+            if not _matching(records, change["type"], name, change["content"]):
+                records.append(
+                    {"type": change["type"], "name": name, "content": change["content"]}
+                )
+
+        elif change["action"] == "update":
+            if change["identifier"]:
+                targets = [r for r in records if r.get("id") == change["identifier"]]
+            else:
+                targets = _matching(records, change["type"], name)
+            if not targets:
+                raise ValueError(
+                    "No record found to update: {0}".format(
+                        change["identifier"] or "{0} {1}".format(change["type"], name)
+                    )
+                )
+            index = records.index(targets[0])
+            records[index] = {
+                "type": change["type"] or targets[0]["type"],
+                "name": name or targets[0]["name"],
+                "content": change["content"] or targets[0]["content"],
+            }
+
+        else:
+            if change["identifier"]:
+                targets = [r for r in records if r.get("id") == change["identifier"]]
+                targets = targets[:1]
+            else:
+                targets = _matching(records, change["type"], name, change["content"])
+            records = [record for record in records if record not in targets]
+
+        results.append(True)
+
+    return records, results
+
+
+def diff(original, final):
+    """
+    Return the records to add and the records to delete to go from the original records
+    of a zone to the final ones, records being compared by type, name and content.
+    """
+    original_keys = {_key(record) for record in original}
+    final_keys = {_key(record) for record in final}
+    additions = [record for record in final if _key(record) not in original_keys]
+    deletions = [record for record in original if _key(record) not in final_keys]
+    return additions, deletions
+
+
+def changed_rrsets(original, final):
+    """
+    Return the record sets (records sharing the same type and name) that differ between
+    the original records of a zone and the final ones, as tuples:
+        (type, name, original records, final records)
+    A record set created has no original records, a record set deleted has no final ones.
+    """
+    original_rrsets = _rrsets(original)
+    final_rrsets = _rrsets(final)
+    changed = []
+    for rrset_key in OrderedDict.fromkeys(list(original_rrsets) + list(final_rrsets)):
+        before = original_rrsets.get(rrset_key, [])
+        after = final_rrsets.get(rrset_key, [])
+        if sorted(map(_key, before)) != sorted(map(_key, after)):
+            rtype, name = (before or after)[0]["type"], (before or after)[0]["name"]
+            changed.append((rtype, name, before, after))
+    return changed
+
+
+def _matching(records, rtype=None, name=None, content=None):
+    return [
+        record
+        for record in records
+        if (not rtype or record["type"] == rtype)
+        and (not name or _normalize_name(record["name"]) == _normalize_name(name))
+        and (not content or record["content"] == content)
+    ]
+
+
+def _rrsets(records):
+    rrsets = OrderedDict()
+    for record in records:
+        rrset_key = (record["type"], _normalize_name(record["name"]))
+        rrsets.setdefault(rrset_key, []).append(record)
+    return rrsets
+
+
+def _key(record):
+    return (record["type"], _normalize_name(record["name"]), record["content"])
+
+
+def _normalize_name(name):
+    return name.rstrip(".").lower()
@@ -7,7 +7,7 @@ import logging
 import os
 import sys
 
-from lexicon.client import Client
+from lexicon.client import Client, load_operations
 from lexicon.config import ConfigResolver
 from lexicon.parser import generate_cli_main_parser
 
@@ -103,6 +103,74 @@ def handle_output(results, output_type, action):
             )
 
 
+def execute_batch(parsed_args):
+    """Execute the operations provided to the batch command, and print their results"""
+    config = ConfigResolver()
+    if parsed_args.delegated:
+        config.with_dict({"delegated": parsed_args.delegated})
+    config.with_env().with_config_dir(parsed_args.config_dir)
+
+    if parsed_args.file == "-":
+        operations = load_operations(sys.stdin)
+    else:
+        with open(parsed_args.file, "r") as stream:
+            operations = load_operations(stream)
+
+    if parsed_args.max_workers:
+        outcomes = Client.execute_many(
+            operations,
+            config,
+            max_workers=parsed_args.max_workers,
+            per_provider_limit=parsed_args.per_provider_limit,
+            per_account_limit=parsed_args.per_account_limit,
+            transaction=parsed_args.transaction,
+        )
+        if parsed_args.output == "JSON":
+            for outcome in outcomes:
+                handle_output(outcome, "JSON", None)
+        if any("error" in outcome for outcome in outcomes):
+            sys.exit(1)
+        return
+
+    results = Client.execute_batch(
+        operations, config, transaction=parsed_args.transaction
+    )
+
+    if parsed_args.output == "JSON":
+        for result in results:
+            handle_output(result, "JSON", None)
+
+
+def serve(parsed_args):
+    """Run the Lexicon server until it is interrupted"""
+    # Server module is imported only when needed, to keep the CLI startup fast.
+    from lexicon.server import create_server
+
+    config = ConfigResolver()
+    if parsed_args.delegated:
+        config.with_dict({"delegated": parsed_args.delegated})
+    config.with_env().with_config_dir(parsed_args.config_dir)
+
+    server = create_server(
+        config,
+        host=parsed_args.host,
+        port=parsed_args.port,
+        socket_path=parsed_args.socket,
+        token=parsed_args.token,
+        idle_timeout=parsed_args.idle_timeout,
+    )
+    logger.info(
+        "Lexicon server listening on %s",
+        parsed_args.socket or "{0}:{1}".format(*server.server_address),
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 def main():
     """Main function of Lexicon."""
     # Dynamically determine all the providers available and gather command line arguments.
@@ -112,6 +180,14 @@ def main():
     logging.basicConfig(stream=sys.stdout, level=log_level, format="%(message)s")
     logger.debug("Arguments: %s", parsed_args)
 
+    if parsed_args.provider_name == "batch":
+        execute_batch(parsed_args)
+        return
+
+    if parsed_args.provider_name == "serve":
+        serve(parsed_args)
+        return
+
     # In the CLI context, will get configuration interactively:
     #   * from the command line
     #   * from the environment variables
@@ -121,7 +197,10 @@ def main():
 
     client = Client(config)
 
-    results = client.execute()
+    try:
+        results = client.execute()
+    finally:
+        client.provider.close()
 
     handle_output(results, parsed_args.output, config.resolve("lexicon:action"))
 
@@ -1,18 +1,34 @@
 """Main module of Lexicon. Defines the Client class, that holds all Lexicon logic."""
 from __future__ import absolute_import
 
+import functools
 import importlib
+import json
+import logging
 import os
+import threading
+from collections import OrderedDict, deque
+from concurrent import futures
 
 import tldextract
+import yaml
 
+from lexicon import changeset
 from lexicon import config as helper_config
-from lexicon import discovery
+from lexicon import discovery, propagation
 
 TLDEXTRACT_CACHE_FILE_DEFAULT = os.path.join("~", ".lexicon_tld_set")
 TLDEXTRACT_CACHE_FILE = os.path.expanduser(
     os.environ.get("LEXICON_TLDEXTRACT_CACHE", TLDEXTRACT_CACHE_FILE_DEFAULT)
 )
+# If true, the public suffix list is never fetched: the cache file is used if it exists,
+# otherwise the snapshot bundled with tldextract.
+TLDEXTRACT_OFFLINE = os.environ.get("LEXICON_TLDEXTRACT_OFFLINE", "false") == "true"
+
+_TLD_EXTRACTOR = None
+_TLD_EXTRACTOR_LOCK = threading.Lock()
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ProviderNotAvailableError(Exception):
@@ -39,29 +55,7 @@ class Client(object):
         # Validate configuration
         self._validate_config()
 
-        runtime_config = {}
-
-        # Process domain, strip subdomain
-        domain_extractor = tldextract.TLDExtract(
-            cache_file=TLDEXTRACT_CACHE_FILE, include_psl_private_domains=True
-        )
-        domain_parts = domain_extractor(self.config.resolve("lexicon:domain"))
-        runtime_config["domain"] = "{0}.{1}".format(
-            domain_parts.domain, domain_parts.suffix
-        )
-
-        if self.config.resolve("lexicon:delegated"):
-            # handle delegated domain
-            delegated = self.config.resolve("lexicon:delegated").rstrip(".")
-            if delegated != runtime_config.get("domain"):
-                # convert to relative name
-                if delegated.endswith(runtime_config.get("domain")):
-                    delegated = delegated[: -len(runtime_config.get("domain"))]
-                    delegated = delegated.rstrip(".")
-                # update domain
-                runtime_config["domain"] = "{0}.{1}".format(
-                    delegated, runtime_config.get("domain")
-                )
+        runtime_config = {"domain": _resolve_domain(self.config)}
 
         self.action = self.config.resolve("lexicon:action")
         self.provider_name = self.config.resolve(
@@ -79,48 +73,454 @@ class Client(object):
     def execute(self):
         """Execute provided configuration in class constructor to the DNS records"""
         self.provider.authenticate()
+        return self._execute_action(self.action)
+
+    @classmethod
+    def execute_batch(cls, operations, config=None, transaction=False):
+        """
+        Execute the given operations, and return their results in the same order.
+        Each operation is a dict of Lexicon parameters, in the same form as the one
+        given to ConfigResolver.with_dict(), for instance:
+            {
+                'provider_name': 'cloudflare',
+                'action': 'create',
+                'domain': 'www.example.com',
+                'type': 'TXT',
+                'name': '_acme-challenge',
+                'content': 'challenge',
+                'cloudflare': {'auth_token': 'SECRET_TOKEN'}
+            }
+        Parameters not defined by an operation are resolved from the given config,
+        which is by default the non-interactive configuration (see Client constructor).
+
+        Operations are grouped by provider, domain and provider specific parameters.
+        Each group is executed with one provider instance, authenticated only once.
+        If an operation fails, the error is raised and remaining operations are skipped.
+
+        With transaction, the consecutive record changes of a group are applied together
+        with Provider.apply_changes(): providers having a bulk API then submit them in
+        one request, so that none of them is applied if one fails.
+        """
+        if not config:
+            config = helper_config.non_interactive_config_resolver()
+
+        groups = OrderedDict()
+        for index, operation in enumerate(operations):
+            group_key = operation_group_key(config, operation)
+            groups.setdefault(group_key, []).append((index, operation))
+
+        results = {}
+        for group in groups.values():
+            session = ProviderSession(config, group[0][1], cls)
+            try:
+                if transaction:
+                    group_results = session.execute_transaction(
+                        [operation for _, operation in group]
+                    )
+                    for (index, _), result in zip(group, group_results):
+                        results[index] = result
+                else:
+                    for index, operation in group:
+                        results[index] = session.execute(operation)
+            finally:
+                session.close()
+
+        return [results[index] for index in sorted(results)]
+
+    @classmethod
+    def execute_many(
+        cls,
+        operations,
+        config=None,
+        max_workers=10,
+        per_provider_limit=None,
+        per_account_limit=None,
+        transaction=False,
+    ):
+        """
+        Execute concurrently the given operations, in the same format than for
+        execute_batch(), and return their outcomes in the same order. Each outcome is
+        a dict holding either the result of the operation under the "result" key,
+        or the error raised by the operation under the "error" and "error_type" keys:
+            [{'result': True}, {'error': 'No domain found', 'error_type': 'Exception'}]
+
+        Operations are grouped like with execute_batch(), each group being executed
+        sequentially by one provider instance. Up to max_workers groups are executed
+        at the same time, at most per_provider_limit of them for the same provider
+        (whatever the account), and at most per_account_limit of them for the same
+        provider and account (ie. the same provider specific parameters), to respect
+        API quotas.
+
+        With transaction, groups are executed like with execute_batch(): if applying
+        the record changes of a group fails, every operation of the group gets the error.
+        """
+        if not config:
+            config = helper_config.non_interactive_config_resolver()
+        per_provider_limit = per_provider_limit or max_workers
+        per_account_limit = per_account_limit or max_workers
+
+        outcomes = [None] * len(operations)
+        groups = OrderedDict()
+        for index, operation in enumerate(operations):
+            try:
+                group_key = operation_group_key(config, operation)
+            except Exception as error:  # pylint: disable=broad-except
+                outcomes[index] = _error_outcome(operation, error)
+            else:
+                groups.setdefault(group_key, []).append((index, operation))
+
+        def execute_group(group):
+            try:
+                session = ProviderSession(config, group[0][1], cls)
+            except Exception as error:  # pylint: disable=broad-except
+                for index, operation in group:
+                    outcomes[index] = _error_outcome(operation, error)
+                return
+
+            try:
+                _execute_session_group(session, group, outcomes, transaction)
+            finally:
+                # Closing may apply deferred work (eg. a zone refresh): if it fails,
+                # the operations of the group are not fully applied.
+                try:
+                    session.close()
+                except Exception as error:  # pylint: disable=broad-except
+                    for index, operation in group:
+                        if "error" not in outcomes[index]:
+                            outcomes[index] = _error_outcome(operation, error)
+
+        # Groups are submitted only when their provider and their provider account have
+        # a free slot, so that workers are never blocked by the limit of one provider
+        # while others could run.
+        pending = deque(groups.items())
+        running = {}
+        provider_slots = {}
+        account_slots = {}
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                for _ in range(len(pending)):
+                    group_key, group = pending.popleft()
+                    provider_key = group_key[0]
+                    account_key = (group_key[0], group_key[2])
+                    if (
+                        provider_slots.get(provider_key, 0) >= per_provider_limit
+                        or account_slots.get(account_key, 0) >= per_account_limit
+                    ):
+                        pending.append((group_key, group))
+                        continue
+                    provider_slots[provider_key] = (
+                        provider_slots.get(provider_key, 0) + 1
+                    )
+                    account_slots[account_key] = account_slots.get(account_key, 0) + 1
+                    running[executor.submit(execute_group, group)] = (
+                        provider_key,
+                        account_key,
+                    )
+
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    provider_key, account_key = running.pop(future)
+                    provider_slots[provider_key] -= 1
+                    account_slots[account_key] -= 1
+                    future.result()
+
+        return outcomes
+
+    def _execute_action(self, action):
         identifier = self.config.resolve("lexicon:identifier")
         record_type = self.config.resolve("lexicon:type")
         name = self.config.resolve("lexicon:name")
         content = self.config.resolve("lexicon:content")
 
-        if self.action == "create":
-            return self.provider.create_record(record_type, name, content)
+        if action == "create":
+            result = self.provider.create_record(record_type, name, content)
+            self._wait_propagation_if_enabled(record_type, name, content, True)
+            return result
 
-        if self.action == "list":
+        if action == "list":
             return self.provider.list_records(record_type, name, content)
 
-        if self.action == "update":
-            return self.provider.update_record(identifier, record_type, name, content)
+        if action == "update":
+            result = self.provider.update_record(identifier, record_type, name, content)
+            self._wait_propagation_if_enabled(record_type, name, content, True)
+            return result
+
+        if action == "delete":
+            result = self.provider.delete_record(identifier, record_type, name, content)
+            self._wait_propagation_if_enabled(record_type, name, content, False)
+            return result
 
-        if self.action == "delete":
-            return self.provider.delete_record(identifier, record_type, name, content)
+        raise ValueError("Invalid action statement: {0}".format(action))
 
-        raise ValueError("Invalid action statement: {0}".format(self.action))
+    def wait_for_propagation(
+        self, record_type, name, content=None, present=True, timeout=None
+    ):
+        """
+        Wait until the given record is visible (or not visible anymore if present is
+        false) on every authoritative nameserver of the domain, querying them all at
+        the same time, and raise propagation.PropagationTimeoutError if it takes more
+        than timeout seconds. If not given, timeout is resolved from the
+        propagation_timeout parameter (default: 120 seconds).
+        """
+        if not propagation.is_available():
+            raise ProviderNotAvailableError(
+                "Waiting for propagation requires the dnspython library, "
+                "install lexicon[localzone] first."
+            )
+        if timeout is None:
+            timeout = self.config.resolve("lexicon:propagation_timeout")
+        return propagation.wait_for_propagation(
+            self.provider.domain,
+            record_type,
+            self.provider._full_name(name) if name else self.provider.domain,
+            content,
+            present,
+            float(timeout) if timeout is not None else None,
+        )
+
+    def _wait_propagation_if_enabled(self, record_type, name, content, present):
+        if str(self.config.resolve("lexicon:wait_propagation")).lower() != "true":
+            return
+        if not name:
+            # Records changed by identifier only cannot be looked up in the DNS.
+            LOGGER.warning("Record name unknown, cannot wait for its propagation.")
+            return
+        self.wait_for_propagation(record_type, name, content, present)
 
     def _validate_config(self):
-        provider_name = self.config.resolve("lexicon:provider_name")
-        if not self.config.resolve("lexicon:provider_name"):
-            raise AttributeError("provider_name")
+        _validate_config(self.config)
+
+
+class _OperationConfigSource(helper_config.DictConfigSource):
+    """
+    ConfigSource holding the parameters of one operation of a batch. It is reloaded
+    with the parameters of each operation executed by the same provider instance.
+    """
+
+    def load(self, operation):
+        """Replace current parameters by the ones of the given operation"""
+        self._parameters = operation
+
+
+class ProviderSession(object):
+    """
+    Provider instance authenticated once, then reused to execute several operations
+    targeting the same provider and domain with the same provider specific parameters
+    (see Client.execute_batch() for the operation format). Operations are resolved
+    against the given config for parameters they do not define.
+    A session must not be used by several threads at the same time.
+    """
+
+    def __init__(self, config, operation, client_class=None):
+        self._operation_source = _OperationConfigSource(operation)
+        self.client = (client_class or Client)(
+            _batch_config(config, self._operation_source)
+        )
+        self.client.provider.authenticate()
+
+    def execute(self, operation):
+        """Execute the given operation with the authenticated provider"""
+        self._operation_source.load(operation)
+        self.client._validate_config()
+        return self.client._execute_action(self.client.config.resolve("lexicon:action"))
+
+    def execute_transaction(self, operations):
+        """
+        Execute the given operations with the authenticated provider, and return their
+        results in the same order. Consecutive record changes are applied together with
+        Provider.apply_changes(), list operations being executed once the changes
+        preceding them are applied.
+        """
+        results = []
+        changes = []
+        for operation in operations:
+            self._operation_source.load(operation)
+            self.client._validate_config()
+            action = self.client.config.resolve("lexicon:action")
+            if action in changeset.ACTIONS:
+                changes.append(
+                    {
+                        "action": action,
+                        "type": self.client.config.resolve("lexicon:type"),
+                        "name": self.client.config.resolve("lexicon:name"),
+                        "content": self.client.config.resolve("lexicon:content"),
+                        "identifier": self.client.config.resolve("lexicon:identifier"),
+                    }
+                )
+                continue
+            if changes:
+                results.extend(self.client.provider.apply_changes(changes))
+                changes = []
+            results.append(self.client._execute_action(action))
+        if changes:
+            results.extend(self.client.provider.apply_changes(changes))
+        return results
+
+    def close(self):
+        """Release the resources (eg. HTTP connections) of the provider of this session"""
+        self.client.provider.close()
 
+
+def operation_group_key(config, operation):
+    """
+    Return a key identifying the provider session able to execute the given operation:
+    operations with the same key share the same provider, domain and provider parameters.
+    """
+    operation_config = _batch_config(config, _OperationConfigSource(operation))
+    provider_name = operation_config.resolve(
+        "lexicon:provider_name"
+    ) or operation_config.resolve("lexicon:provider")
+    return (
+        provider_name,
+        _resolve_domain(operation_config),
+        json.dumps(operation.get(provider_name), sort_keys=True, default=str),
+    )
+
+
+def validate_operation(config, operation):
+    """
+    Check that the given operation, completed by config, can be executed by Lexicon.
+    AttributeError or ProviderNotAvailableError is raised if a parameter is missing
+    or the provider is not available, and ValueError if the action is unknown.
+    """
+    operation_config = _batch_config(config, _OperationConfigSource(operation))
+    _validate_config(operation_config)
+
+    action = operation_config.resolve("lexicon:action")
+    if action not in ("create", "list", "update", "delete"):
+        raise ValueError("Invalid action statement: {0}".format(action))
+
+
+def load_operations(stream):
+    """
+    Load the operations to execute with Client.execute_batch() from the given stream.
+    Operations are either in JSON Lines (one JSON object per line), or in YAML (one
+    operation per document, or documents containing a list of operations).
+    """
+    content = stream.read()
+
+    try:
+        operations = [json.loads(line) for line in content.splitlines() if line.strip()]
+    except ValueError:
+        operations = None
+    if operations is not None and all(
+        isinstance(operation, dict) for operation in operations
+    ):
+        return operations
+
+    operations = []
+    for document in yaml.load_all(content, Loader=yaml.SafeLoader):
+        if isinstance(document, list):
+            operations.extend(document)
+        elif document is not None:
+            operations.append(document)
+
+    return operations
+
+
+def _execute_session_group(session, group, outcomes, transaction):
+    if transaction:
         try:
-            available = discovery.find_providers()[
-                self.config.resolve("lexicon:provider_name")
-            ]
-        except KeyError:
-            raise ProviderNotAvailableError(
-                "This provider ({0}) is not supported by Lexicon.".format(provider_name)
+            group_results = session.execute_transaction(
+                [operation for _, operation in group]
             )
+        except Exception as error:  # pylint: disable=broad-except
+            for index, operation in group:
+                outcomes[index] = _error_outcome(operation, error)
         else:
-            if not available:
-                raise ProviderNotAvailableError(
-                    "This provider ({0}) has required dependencies that are missing. "
-                    "Please install lexicon[{0}] first.".format(provider_name)
-                )
+            for (index, _), result in zip(group, group_results):
+                outcomes[index] = {"result": result}
+        return
+
+    for index, operation in group:
+        try:
+            outcomes[index] = {"result": session.execute(operation)}
+        except Exception as error:  # pylint: disable=broad-except
+            outcomes[index] = _error_outcome(operation, error)
+
 
-        if not self.config.resolve("lexicon:action"):
-            raise AttributeError("action")
-        if not self.config.resolve("lexicon:domain"):
-            raise AttributeError("domain")
-        if not self.config.resolve("lexicon:type"):
-            raise AttributeError("type")
+def _error_outcome(operation, error):
+    LOGGER.debug("Operation %s failed.", operation, exc_info=True)
+    return {"error": str(error), "error_type": error.__class__.__name__}
+
+
+def _validate_config(config):
+    provider_name = config.resolve("lexicon:provider_name")
+    if not config.resolve("lexicon:provider_name"):
+        raise AttributeError("provider_name")
+
+    try:
+        available = discovery.find_providers()[config.resolve("lexicon:provider_name")]
+    except KeyError:
+        raise ProviderNotAvailableError(
+            "This provider ({0}) is not supported by Lexicon.".format(provider_name)
+        )
+    else:
+        if not available:
+            raise ProviderNotAvailableError(
+                "This provider ({0}) has required dependencies that are missing. "
+                "Please install lexicon[{0}] first.".format(provider_name)
+            )
+
+    if not config.resolve("lexicon:action"):
+        raise AttributeError("action")
+    if not config.resolve("lexicon:domain"):
+        raise AttributeError("domain")
+    if not config.resolve("lexicon:type"):
+        raise AttributeError("type")
+
+
+def _batch_config(config, operation_source):
+    batch_config = helper_config.ConfigResolver()
+    batch_config.with_config_source(operation_source)
+    for config_source in config._config_sources:
+        batch_config.with_config_source(config_source)
+
+    return batch_config
+
+
+def _resolve_domain(config):
+    domain = config.resolve("lexicon:domain")
+    if not domain:
+        return None
+
+    # Process domain, strip subdomain
+    domain = get_registered_domain(domain)
+
+    if config.resolve("lexicon:delegated"):
+        # handle delegated domain
+        delegated = config.resolve("lexicon:delegated").rstrip(".")
+        if delegated != domain:
+            # convert to relative name
+            if delegated.endswith(domain):
+                delegated = delegated[: -len(domain)]
+                delegated = delegated.rstrip(".")
+            # update domain
+            domain = "{0}.{1}".format(delegated, domain)
+
+    return domain
+
+
+@functools.lru_cache(maxsize=4096)
+def get_registered_domain(domain):
+    """
+    Return the registered domain of the given FQDN (eg. 'domain.net' for 'www.domain.net'),
+    using the TLDExtract instance shared by the whole process.
+    """
+    domain_parts = _get_tld_extractor()(domain)
+    return "{0}.{1}".format(domain_parts.domain, domain_parts.suffix)
+
+
+def _get_tld_extractor():
+    global _TLD_EXTRACTOR
+    with _TLD_EXTRACTOR_LOCK:
+        if _TLD_EXTRACTOR is None:
+            _TLD_EXTRACTOR = tldextract.TLDExtract(
+                cache_file=TLDEXTRACT_CACHE_FILE,
+                include_psl_private_domains=True,
+                suffix_list_urls=()
+                if TLDEXTRACT_OFFLINE
+                else tldextract.tldextract.PUBLIC_SUFFIX_LIST_URLS,
+                fallback_to_snapshot=True,
+            )
+    return _TLD_EXTRACTOR
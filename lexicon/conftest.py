@@ -13,6 +13,12 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    """Store the persistent cache of Lexicon (eg. access tokens) in a test directory"""
+    monkeypatch.setenv("LEXICON_CACHE_DIR", str(tmp_path / "lexicon-cache"))
+
+
 def pytest_runtest_setup(item):
     """Standard pytest hook invoked before each test execution"""
     try:
@@ -1,13 +1,37 @@
 """
 This module takes care of finding information about the runtime of Lexicon:
 * what are the providers installed, and available
+* what are the nameserver domains declared by the providers
 * what is the version of Lexicon
 """
+import ast
+import importlib
+import logging
+import os
 import pkgutil
+import re
 
-import pkg_resources
+from lexicon import cache, providers
 
-from lexicon import providers
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    # Python < 3.8: extras availability is resolved with the slower pkg_resources.
+    importlib_metadata = None
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    # Without packaging, only the presence of the extras requirements is checked.
+    Requirement = None
+
+LOGGER = logging.getLogger(__name__)
+
+AVAILABILITY_CACHE = "providers_availability"
+
+_NAMESERVER_DOMAINS_PATTERN = re.compile(r"^NAMESERVER_DOMAINS\s*=\s*\[", re.MULTILINE)
+
+_AVAILABILITY_INDEX = None
 
 
 def find_providers():
@@ -20,41 +44,233 @@ def find_providers():
         }
     )
 
-    try:
-        distribution = pkg_resources.get_distribution("dns-lexicon")
-    except pkg_resources.DistributionNotFound:
+    extras = _get_availability_index()
+    if extras is None:
         return {provider: True for provider in providers_list}
-    else:
-        return {
-            provider: _resolve_requirements(provider, distribution)
-            for provider in providers_list
-        }
+
+    # A provider without extra does not have optional dependencies, so it is available.
+    return {provider: extras.get(provider, True) for provider in providers_list}
+
+
+def find_nameserver_domains():
+    """
+    Find the nameserver domains (NAMESERVER_DOMAINS) declared by each available provider.
+    Plain domains are returned as strings, and regular expressions as compiled patterns.
+    Declarations are read from the providers source code when possible,
+    in order to avoid importing every provider module.
+    """
+    nameserver_domains = {}
+    for provider, available in find_providers().items():
+        if provider == "auto" or not available:
+            continue
+
+        try:
+            nameserver_domains[provider] = _read_nameserver_domains(provider)
+        except ImportError:
+            LOGGER.warning(
+                "Warning, the provider %s cannot be loaded due "
+                "to missing optional dependencies.",
+                provider,
+            )
+
+    return nameserver_domains
 
 
 def lexicon_version():
     """Retrieve current Lexicon version"""
+    if importlib_metadata is None:
+        import pkg_resources
+
+        try:
+            return pkg_resources.get_distribution("dns-lexicon").version
+        except pkg_resources.DistributionNotFound:
+            return "unknown"
+
     try:
-        return pkg_resources.get_distribution("dns-lexicon").version
-    except pkg_resources.DistributionNotFound:
+        return importlib_metadata.version("dns-lexicon")
+    except importlib_metadata.PackageNotFoundError:
         return "unknown"
 
 
-def _resolve_requirements(provider, distribution):
-    try:
-        requirements = distribution.requires([provider])
-    except pkg_resources.UnknownExtra:
-        # No extra for this provider
-        return True
+def _get_availability_index():
+    """
+    Return a dict giving for each extra of Lexicon if its requirements are installed,
+    or None if Lexicon is not installed as a distribution. The index is computed once
+    per installed version of Lexicon and state of its site-packages, then reused from
+    the persistent cache.
+    """
+    global _AVAILABILITY_INDEX
+    if _AVAILABILITY_INDEX is not None:
+        return _AVAILABILITY_INDEX or None
+
+    if importlib_metadata is None:
+        extras = _resolve_extras_legacy()
     else:
-        # Extra is defined
         try:
-            for requirement in requirements:
-                if hasattr(requirement, "name"):
-                    pkg_resources.get_distribution(requirement.name)
-                else:
-                    pkg_resources.get_distribution(requirement)
+            distribution = importlib_metadata.distribution("dns-lexicon")
+        except importlib_metadata.PackageNotFoundError:
+            extras = None
+        else:
+            extras = _load_or_resolve_extras(distribution)
+
+    # An empty index means that Lexicon is not installed as a distribution.
+    _AVAILABILITY_INDEX = extras if extras is not None else {}
+    return extras
+
+
+def _load_or_resolve_extras(distribution):
+    try:
+        site_packages_mtime = os.path.getmtime(str(distribution.locate_file("")))
+    except OSError:
+        site_packages_mtime = None
+    key = {"version": distribution.version, "mtime": site_packages_mtime}
+
+    index = cache.load(AVAILABILITY_CACHE)
+    if index and index.get("key") == key:
+        return index["extras"]
+
+    extras = _resolve_extras(distribution)
+    cache.dump(AVAILABILITY_CACHE, {"key": key, "extras": extras})
+
+    return extras
+
+
+def _resolve_extras(distribution):
+    extras = {
+        extra: True for extra in distribution.metadata.get_all("Provides-Extra") or []
+    }
+
+    for requirement in distribution.requires or []:
+        name, requirement_extras, specifier = _parse_requirement(requirement, extras)
+        if not name or not requirement_extras:
+            continue
+
+        try:
+            installed = importlib_metadata.distribution(name)
+        except importlib_metadata.PackageNotFoundError:
+            installed = None
+
+        if not installed or (
+            specifier and not specifier.contains(installed.version, prereleases=True)
+        ):
+            # At least one extra requirement is not fulfilled
+            for extra in requirement_extras:
+                extras[extra] = False
+
+    return extras
+
+
+def _parse_requirement(requirement, extras):
+    # Requirement looks like: 'boto3 (>=1,<2); extra == "route53" or extra == "full"'
+    # Return its name, the extras needing it in the current environment, and its
+    # version specifier if it can be checked.
+    if Requirement is None:
+        name = re.match(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+        requirement_extras = re.findall(
+            r"extra\s*==\s*[\"']([^\"']+)[\"']", requirement
+        )
+        return name.group(1) if name else None, requirement_extras, None
+
+    try:
+        parsed = Requirement(requirement)
+    except InvalidRequirement:
+        return None, [], None
+    if not parsed.marker or parsed.marker.evaluate({"extra": ""}):
+        # Not specific to an extra
+        return parsed.name, [], parsed.specifier
+
+    # Other markers (eg. python_version or sys_platform) are evaluated against the
+    # current environment, so requirements not needed here are ignored.
+    requirement_extras = [
+        extra for extra in extras if parsed.marker.evaluate({"extra": extra})
+    ]
+    return parsed.name, requirement_extras, parsed.specifier
+
+
+def _resolve_extras_legacy():
+    import pkg_resources
+
+    try:
+        distribution = pkg_resources.get_distribution("dns-lexicon")
+    except pkg_resources.DistributionNotFound:
+        return None
+
+    extras = {}
+    for extra in distribution.extras:
+        try:
+            for requirement in distribution.requires([extra]):
+                pkg_resources.get_distribution(requirement.name)
         except (pkg_resources.DistributionNotFound, pkg_resources.VersionConflict):
             # At least one extra requirement is not fulfilled
-            return False
+            extras[extra] = False
+        else:
+            extras[extra] = True
+
+    return extras
+
+
+def _read_nameserver_domains(provider):
+    path = os.path.join(providers.__path__[0], "{0}.py".format(provider))
+    try:
+        with open(path, "r") as stream:
+            source = stream.read()
+    except (IOError, OSError):
+        source = ""
+
+    declaration = _NAMESERVER_DOMAINS_PATTERN.search(source)
+    if declaration:
+        # The declaration ends at one of the next closing brackets:
+        # try each one until the statement can be parsed.
+        end = declaration.end()
+        while True:
+            end = source.find("]", end) + 1
+            if not end:
+                break
+            try:
+                statement = ast.parse(source[declaration.start() : end])
+            except SyntaxError:
+                continue
+            nameserver_domains = _evaluate_nameserver_domains(statement.body[0].value)
+            if nameserver_domains is not None:
+                return nameserver_domains
+            break
+
+    # Declaration is not a plain list of strings and regexes: let Python evaluate it.
+    provider_module = importlib.import_module("lexicon.providers." + provider)
+    return provider_module.NAMESERVER_DOMAINS
+
+
+def _evaluate_nameserver_domains(node):
+    nameserver_domains = []
+    for element in node.elts:
+        if isinstance(element, ast.Call):
+            # Only calls in the form of re.compile("pattern") are supported.
+            function = element.func
+            if (
+                not isinstance(function, ast.Attribute)
+                or not isinstance(function.value, ast.Name)
+                or (function.value.id, function.attr) != ("re", "compile")
+                or len(element.args) != 1
+                or element.keywords
+            ):
+                return None
+            pattern = _evaluate_string(element.args[0])
+            if pattern is None:
+                return None
+            nameserver_domains.append(re.compile(pattern))
+        else:
+            domain = _evaluate_string(element)
+            if domain is None:
+                return None
+            nameserver_domains.append(domain)
+
+    return nameserver_domains
+
+
+def _evaluate_string(node):
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return None
 
-    return True
+    return value if isinstance(value, str) else None
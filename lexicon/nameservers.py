@@ -0,0 +1,77 @@
+"""
+In-process resolution of the nameservers of a domain, based on the dnspython library.
+Resolved nameservers are stored in the persistent cache of Lexicon, and reused until
+the TTL of the NS records expires.
+
+The dnspython library is an optional dependency (it is installed with the localzone
+extra for instance): use is_available() to check if this module can be used.
+"""
+import logging
+import time
+
+from lexicon import cache
+
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
+LOGGER = logging.getLogger(__name__)
+
+NAMESERVERS_CACHE = "nameservers"
+
+
+def is_available():
+    """Check if the in-process resolution of nameservers can be used"""
+    return dns is not None
+
+
+def get_nameservers(domain, resolver=None):
+    """
+    Return the hostnames of the nameservers declared for the given domain, either from
+    the persistent cache if the NS records TTL is not expired, or using a DNS query.
+    A custom dns.resolver.Resolver instance can be provided to choose the servers queried.
+    """
+    domain = domain.rstrip(".").lower()
+    now = time.time()
+
+    entries = cache.load(NAMESERVERS_CACHE) or {}
+    entry = entries.get(domain)
+    if entry and entry["expiration"] > now:
+        LOGGER.debug("Nameservers for domain %s found in cache.", domain)
+        return entry["nameservers"]
+
+    nameservers, ttl = _query_nameservers(domain, resolver)
+
+    # Expired entries are dropped while the cache file is updated.
+    entries = {
+        key: value for key, value in entries.items() if value["expiration"] > now
+    }
+    entries[domain] = {"nameservers": nameservers, "expiration": now + ttl}
+    cache.dump(NAMESERVERS_CACHE, entries)
+
+    return nameservers
+
+
+def _query_nameservers(domain, resolver):
+    if not resolver:
+        resolver = dns.resolver.Resolver()
+    # dnspython 2.x renamed the method query() into resolve().
+    query = getattr(resolver, "resolve", None) or resolver.query
+
+    try:
+        answer = query(domain + ".", "NS")
+    except dns.resolver.NXDOMAIN:
+        raise ValueError("Error, domain {0} could not be resolved.".format(domain))
+    except dns.exception.DNSException:
+        raise ValueError(
+            "Error, could not find ns entries for domain {0}. "
+            "Does this domain is correctly configured ?".format(domain)
+        )
+
+    nameservers = [
+        rdata.target.to_text(omit_final_dot=True).lower() for rdata in answer
+    ]
+
+    return nameservers, answer.rrset.ttl
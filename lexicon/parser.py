@@ -32,6 +32,19 @@ def generate_base_provider_parser():
     parser.add_argument(
         "--identifier", help="specify the record for update or delete actions"
     )
+    parser.add_argument(
+        "--wait-propagation",
+        action="store_true",
+        help="after a create, update or delete action, wait until the change is "
+        "visible on every authoritative nameserver of the domain",
+    )
+    parser.add_argument(
+        "--propagation-timeout",
+        type=int,
+        default=120,
+        help="with --wait-propagation, specify after how many seconds a change not "
+        "visible everywhere is an error (default: 120)",
+    )
     parser.add_argument(
         "--log_level",
         help="specify the log level",
@@ -72,20 +85,20 @@ def generate_cli_main_parser():
         "(default: current directory).",
     )
     subparsers = parser.add_subparsers(
-        dest="provider_name", help="specify the DNS provider to use"
+        dest="provider_name",
+        help="specify the DNS provider to use",
+        action=_ProviderSubParsersAction,
     )
     subparsers.required = True
 
+    # Provider modules are not imported here: their specific arguments are added
+    # by _ProviderSubParsersAction once the provider has been selected.
     for provider, available in discovery.find_providers().items():
-        provider_module = importlib.import_module("lexicon.providers." + provider)
-        provider_parser = getattr(provider_module, "provider_parser")
-
-        subparser = subparsers.add_parser(
+        subparser = subparsers.add_provider_parser(
             provider,
             help="{0} provider".format(provider),
             parents=[generate_base_provider_parser()],
         )
-        provider_parser(subparser)
 
         if not available:
             subparser.epilog = (
@@ -95,4 +108,147 @@ def generate_cli_main_parser():
                 )
             )
 
+    generate_cli_batch_parser(
+        subparsers.add_parser(
+            "batch",
+            help="execute a stream of operations on any provider",
+        )
+    )
+
+    generate_cli_serve_parser(
+        subparsers.add_parser(
+            "serve",
+            help="run a server executing operations received through a JSON API",
+        )
+    )
+
     return parser
+
+
+def generate_cli_batch_parser(subparser):
+    """Configure the parser of the batch command, that executes a stream of operations"""
+    subparser.description = """
+        Execute every operation read from the given file (or from the standard input).
+        Operations are provided in JSON Lines or YAML, each one being a mapping of
+        Lexicon parameters: provider_name, action, domain, type, name, content, ...
+        Operations targeting the same provider and domain share one authentication.
+        """
+    subparser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="specify the file containing the operations (default: standard input)",
+    )
+    subparser.add_argument(
+        "--log_level",
+        help="specify the log level",
+        default="ERROR",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"],
+    )
+    subparser.add_argument(
+        "--output",
+        help=(
+            "specify the type of output: by default the result of each operation "
+            "as a JSON string on its own line (JSON), or no output (QUIET)"
+        ),
+        default="JSON",
+        choices=["JSON", "QUIET"],
+    )
+    subparser.add_argument(
+        "--max-workers",
+        type=int,
+        help="execute concurrently up to this number of provider and domain groups "
+        "of operations; the outcome of each operation is then printed as a JSON "
+        "object holding either its result or its error (default: sequential execution)",
+    )
+    subparser.add_argument(
+        "--per-provider-limit",
+        type=int,
+        help="with --max-workers, limit the number of groups executed concurrently "
+        "for the same provider, whatever the account (default: no limit)",
+    )
+    subparser.add_argument(
+        "--per-account-limit",
+        type=int,
+        help="with --max-workers, limit the number of groups executed concurrently "
+        "for the same provider account (default: no limit)",
+    )
+    subparser.add_argument(
+        "--transaction",
+        action="store_true",
+        help="send together the consecutive record changes of each group, with one "
+        "request when the provider supports it, so that none is applied if one fails",
+    )
+
+
+def generate_cli_serve_parser(subparser):
+    """Configure the parser of the serve command, that runs the Lexicon server"""
+    subparser.description = """
+        Run a server executing the operations received through a JSON API over HTTP:
+        each POST request body is one operation, in the same format as for the batch
+        command. Authenticated providers are kept between requests, until they stay
+        unused for more than the idle timeout.
+        """
+    subparser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="specify the address to listen on (default: 127.0.0.1)",
+    )
+    subparser.add_argument(
+        "--port",
+        type=int,
+        default=8053,
+        help="specify the TCP port to listen on (default: 8053)",
+    )
+    subparser.add_argument(
+        "--socket",
+        help="specify the path of a Unix socket to listen on, instead of a TCP port",
+    )
+    subparser.add_argument(
+        "--token",
+        default=os.environ.get("LEXICON_SERVER_TOKEN"),
+        help="specify the token that requests must provide in an "
+        "'Authorization: Bearer' header, required on a TCP port "
+        "(default: LEXICON_SERVER_TOKEN environment variable)",
+    )
+    subparser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=300,
+        help="specify after how many seconds an unused provider is evicted "
+        "(default: 300)",
+    )
+    subparser.add_argument(
+        "--log_level",
+        help="specify the log level",
+        default="INFO",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"],
+    )
+
+
+class _ProviderSubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that imports the module of the selected provider only,
+    and configures its specific arguments just before the subparser is invoked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_ProviderSubParsersAction, self).__init__(*args, **kwargs)
+        self._unconfigured_providers = set()
+
+    def add_provider_parser(self, provider, **kwargs):
+        """Add the subparser of a provider, that will be configured only if selected"""
+        self._unconfigured_providers.add(provider)
+        return self.add_parser(provider, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        provider = values[0]
+        if provider in self._unconfigured_providers:
+            provider_module = importlib.import_module("lexicon.providers." + provider)
+            provider_parser = getattr(provider_module, "provider_parser")
+            provider_parser(self._name_parser_map[provider])
+            self._unconfigured_providers.discard(provider)
+
+        super(_ProviderSubParsersAction, self).__call__(
+            parser, namespace, values, option_string
+        )
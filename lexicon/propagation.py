@@ -0,0 +1,188 @@
+"""
+Wait for DNS records changes to be visible on the authoritative nameservers of a zone,
+based on the dnspython library.
+
+Every authoritative nameserver of the zone is queried directly, all of them at the same
+time, until each one answers with the expected state of the record. Nameservers that
+already answered as expected are not queried again. A nameserver is queried on its
+IPv4 and IPv6 addresses in turn, until one of them gives a valid answer.
+
+The dnspython library is an optional dependency (it is installed with the localzone
+extra for instance): use is_available() to check if this module can be used.
+"""
+import logging
+import time
+from collections import OrderedDict
+from concurrent import futures
+
+from lexicon import nameservers
+
+try:
+    import dns.exception
+    import dns.flags
+    import dns.message
+    import dns.query
+    import dns.rcode
+    import dns.rdatatype
+    import dns.resolver
+except ImportError:
+    dns = None
+
+LOGGER = logging.getLogger(__name__)
+
+# Default number of seconds after which a change not visible everywhere is an error
+DEFAULT_TIMEOUT = 120
+
+# Nameservers are queried again after this delay, doubled after each try up to
+# MAX_POLL_INTERVAL
+INITIAL_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 5
+
+# Number of seconds to wait for the answer of one nameserver to one query
+QUERY_TIMEOUT = 2
+
+
+class PropagationTimeoutError(Exception):
+    """
+    Custom exception to raise when a record change is still not visible on every
+    authoritative nameserver of the zone once the timeout is reached
+    """
+
+
+def is_available():
+    """Check if waiting for the propagation of records changes can be used"""
+    return dns is not None
+
+
+def wait_for_propagation(
+    domain, rtype, name, content=None, present=True, timeout=None, resolver=None
+):
+    """
+    Wait until the given record is visible (or not visible anymore if present is false)
+    on every authoritative nameserver of the zone of the given domain. If content is
+    not given, any record of the given type and name is considered.
+    The nameservers of the zone are found with the given dns.resolver.Resolver
+    instance, and queried on the same port as it.
+    Raise PropagationTimeoutError if timeout seconds (see DEFAULT_TIMEOUT) elapse first.
+    """
+    if not resolver:
+        resolver = dns.resolver.Resolver()
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUT
+    deadline = time.monotonic() + timeout
+
+    qname = "{0}.".format(name.rstrip(".")).lower()
+    addresses = _get_nameservers_addresses(domain, resolver)
+    if not addresses:
+        raise ValueError("Error, no nameserver found for zone {0}.".format(domain))
+
+    interval = INITIAL_POLL_INTERVAL
+    pending = list(addresses)
+    with futures.ThreadPoolExecutor(
+        max_workers=len(addresses), thread_name_prefix="lexicon-propagation"
+    ) as executor:
+        while True:
+            states = executor.map(
+                lambda nameserver: _is_propagated(
+                    addresses[nameserver],
+                    resolver.port,
+                    qname,
+                    rtype,
+                    content,
+                    present,
+                ),
+                pending,
+            )
+            pending = [
+                nameserver
+                for nameserver, propagated in zip(pending, list(states))
+                if not propagated
+            ]
+            remaining = deadline - time.monotonic()
+            if not pending:
+                LOGGER.debug(
+                    "Record %s %s propagated to %s", rtype, qname, list(addresses)
+                )
+                return True
+            if remaining <= 0:
+                raise PropagationTimeoutError(
+                    "Record {0} {1} not propagated after {2} seconds to: {3}".format(
+                        rtype, qname, timeout, ", ".join(pending)
+                    )
+                )
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+def _get_nameservers_addresses(domain, resolver):
+    # dnspython 2.x renamed the method query() into resolve().
+    query = getattr(resolver, "resolve", None) or resolver.query
+
+    addresses = OrderedDict()
+    for nameserver in nameservers.get_nameservers(domain, resolver):
+        nameserver_addresses = []
+        for rdtype in ("A", "AAAA"):
+            try:
+                answer = query(nameserver + ".", rdtype)
+            except dns.exception.DNSException:
+                continue
+            nameserver_addresses.extend(rdata.address for rdata in answer)
+        if not nameserver_addresses:
+            LOGGER.warning("Could not resolve nameserver %s", nameserver)
+            continue
+        addresses[nameserver] = nameserver_addresses
+
+    return addresses
+
+
+def _is_propagated(addresses, port, qname, rtype, content, present):
+    response = None
+    for address in addresses:
+        response = _query(address, port, qname, rtype)
+        if response is not None:
+            break
+    if response is None:
+        return False
+
+    rdtype = dns.rdatatype.from_text(rtype)
+    contents = [
+        _rdata_content(rdata)
+        for rrset in response.answer
+        if rrset.rdtype == rdtype
+        for rdata in rrset
+    ]
+    if content is None:
+        return bool(contents) == present
+    return (_normalize_content(content) in contents) == present
+
+
+def _query(address, port, qname, rtype):
+    # Only complete answers are considered: truncated ones are queried again over
+    # TCP, and errors (eg. SERVFAIL or REFUSED) do not tell the state of the record.
+    query = dns.message.make_query(qname, rtype)
+    try:
+        response = dns.query.udp(query, address, timeout=QUERY_TIMEOUT, port=port)
+        if response.flags & dns.flags.TC:
+            response = dns.query.tcp(query, address, timeout=QUERY_TIMEOUT, port=port)
+    except (dns.exception.DNSException, OSError) as error:
+        LOGGER.debug("Nameserver %s did not answer: %s", address, error)
+        return None
+
+    if response.rcode() not in (dns.rcode.NOERROR, dns.rcode.NXDOMAIN):
+        LOGGER.debug(
+            "Nameserver %s answered %s", address, dns.rcode.to_text(response.rcode())
+        )
+        return None
+    return response
+
+
+def _rdata_content(rdata):
+    if rdata.rdtype == dns.rdatatype.TXT:
+        return _normalize_content(
+            b"".join(rdata.strings).decode("utf-8", errors="replace")
+        )
+    return _normalize_content(rdata.to_text())
+
+
+def _normalize_content(content):
+    return content.strip('"').rstrip(".").lower()
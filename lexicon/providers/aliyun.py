@@ -10,7 +10,6 @@ import sys
 import time
 from hashlib import sha1
 
-import requests
 from six.moves import urllib
 
 from lexicon.providers.base import Provider as BaseProvider
@@ -160,7 +159,9 @@ class Provider(BaseProvider):
         return True
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
-        response = requests.request("GET", ALIYUN_DNS_API_ENDPOINT, params=query_params)
+        response = self._get_http_session().request(
+            "GET", ALIYUN_DNS_API_ENDPOINT, params=query_params
+        )
         response.raise_for_status()
 
         try:
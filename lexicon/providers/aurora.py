@@ -8,8 +8,6 @@ import hmac
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -150,7 +148,7 @@ class Provider(BaseProvider):
         timestamp = time.strftime("%Y%m%dT%H%M%SZ")
         authorization_header = self._generate_auth_header(action, url, timestamp)
 
-        request = requests.request(
+        request = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
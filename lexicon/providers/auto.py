@@ -4,23 +4,22 @@ from __future__ import absolute_import
 import argparse
 import importlib
 import logging
-import pkgutil
 import re
 import subprocess
 
 import six
-import tldextract
 
 from lexicon import config as helper_config
-from lexicon import providers
+from lexicon import discovery, nameservers
+from lexicon.providers.base import run_in_executor
 
 LOGGER = logging.getLogger(__name__)
 
 
 def _get_available_providers():
     available_providers = {}
-    for _, modname, _ in pkgutil.iter_modules(providers.__path__):
-        if modname not in ("base", "auto"):
+    for modname, available in discovery.find_providers().items():
+        if modname != "auto" and available:
             try:
                 available_providers[modname] = importlib.import_module(
                     "lexicon.providers." + modname
@@ -35,18 +34,100 @@ def _get_available_providers():
     return available_providers
 
 
-AVAILABLE_PROVIDERS = _get_available_providers()
+class _NameserverRegistry(object):
+    """
+    Index of the nameserver domains declared by the available providers.
+    Plain domains are stored in a map, so any suffix of a nameserver hostname can be
+    looked up in constant time, while regexes are combined into one single pattern:
+    only the regexes following the first one matching a suffix are checked one by one,
+    so that all the providers matching it are found.
+    Regexes that cannot be combined safely (named groups, flags) are matched one by one.
+    """
+
+    def __init__(self, nameserver_domains):
+        self._providers_by_suffix = {}
+        self._combined_by_group = {}
+        self._combined_patterns = []
+        self._standalone_patterns = []
+        patterns = []
+        group_index = 1
+
+        for provider_name in sorted(nameserver_domains):
+            for ns_domain in nameserver_domains[provider_name]:
+                if isinstance(ns_domain, six.string_types):
+                    self._providers_by_suffix.setdefault(
+                        ns_domain.rstrip(".").lower(), []
+                    ).append(provider_name)
+                elif not _is_combinable(ns_domain):
+                    self._standalone_patterns.append((ns_domain, provider_name))
+                else:
+                    # Each regex is wrapped in a capturing group, found by its index
+                    # after the groups of the previous regexes.
+                    self._combined_by_group[group_index] = len(self._combined_patterns)
+                    self._combined_patterns.append((ns_domain, provider_name))
+                    patterns.append("({0})".format(ns_domain.pattern))
+                    group_index += ns_domain.groups + 1
+
+        self._matcher = re.compile("|".join(patterns)) if patterns else None
+
+    def find(self, ns_records):
+        """
+        Return the names of the providers matching the given nameservers hostnames.
+        Each suffix of a hostname is checked, from the longest to the registered domain.
+        """
+        relevant_providers = []
+        for nameserver in ns_records:
+            labels = nameserver.rstrip(".").lower().split(".")
+            for index in range(len(labels)):
+                suffix = ".".join(labels[index:])
+                found = list(self._providers_by_suffix.get(suffix, []))
+                if self._matcher:
+                    match = self._matcher.match(suffix)
+                    if match:
+                        # The wrapping group is closed last, so it is the last index.
+                        first = self._combined_by_group[match.lastindex]
+                        found.append(self._combined_patterns[first][1])
+                        for pattern, provider_name in self._combined_patterns[
+                            first + 1 :
+                        ]:
+                            if pattern.match(suffix):
+                                found.append(provider_name)
+                for pattern, provider_name in self._standalone_patterns:
+                    if pattern.match(suffix):
+                        found.append(provider_name)
+                for provider_name in found:
+                    if provider_name not in relevant_providers:
+                        relevant_providers.append(provider_name)
+
+        return relevant_providers
+
+
+def _is_combinable(pattern):
+    if pattern.groupindex or pattern.flags & ~re.UNICODE:
+        return False
+    try:
+        re.compile("({0})".format(pattern.pattern))
+    except re.error:
+        # Eg. global inline flags, that must be at the start of the pattern.
+        return False
+    return True
 
 
-def _get_ns_records_domains_for_domain(domain):
-    tlds = [
-        tldextract.extract(ns_entry) for ns_entry in _get_ns_records_for_domain(domain)
-    ]
+_NAMESERVER_REGISTRY = None
 
-    return {"{0}.{1}".format(tld.domain, tld.suffix) for tld in tlds}
+
+def _get_nameserver_registry():
+    global _NAMESERVER_REGISTRY
+    if _NAMESERVER_REGISTRY is None:
+        _NAMESERVER_REGISTRY = _NameserverRegistry(discovery.find_nameserver_domains())
+    return _NAMESERVER_REGISTRY
 
 
 def _get_ns_records_for_domain(domain):
+    if nameservers.is_available():
+        # In-process resolution, with NS records cached until their TTL expires.
+        return nameservers.get_nameservers(domain)
+
     # Available both for Windows and Linux (if dnsutils is installed for the latter)
     try:
         output = subprocess.check_output(
@@ -72,35 +153,13 @@ def _get_ns_records_for_domain(domain):
 
 
 def _relevant_provider_for_domain(domain):
-    nameserver_domains = _get_ns_records_domains_for_domain(domain)
-    relevant_providers = []
-
-    for provider_name, provider_module in AVAILABLE_PROVIDERS.items():
-        ns_domains = provider_module.NAMESERVER_DOMAINS
-
-        # Test plain domain string comparison
-        if {
-            ns_domain
-            for ns_domain in ns_domains
-            if isinstance(ns_domain, six.string_types)
-        } & nameserver_domains:
-            relevant_providers.append((provider_name, provider_module))
-            continue
-
-        # Test domains regexp matching
-        for ns_domain in ns_domains:
-            if hasattr(ns_domain, "match") and [
-                nameserver_domain
-                for nameserver_domain in nameserver_domains
-                if ns_domain.match(nameserver_domain)
-            ]:
-                relevant_providers.append((provider_name, provider_module))
-                continue
+    ns_records = _get_ns_records_for_domain(domain)
+    relevant_providers = _get_nameserver_registry().find(ns_records)
 
     if not relevant_providers:
         raise ValueError(
             "Error, could not find the DNS provider for given domain {0}. "
-            "Found nameservers domains are {1}".format(domain, nameserver_domains)
+            "Found nameservers are {1}".format(domain, ns_records)
         )
 
     if len(relevant_providers) > 1:
@@ -112,7 +171,12 @@ def _relevant_provider_for_domain(domain):
             relevant_providers,
         )
 
-    return relevant_providers[0]
+    # Only the provider that will be used is imported.
+    provider_name = relevant_providers[0]
+    return (
+        provider_name,
+        importlib.import_module("lexicon.providers." + provider_name),
+    )
 
 
 def provider_parser(subparser):
@@ -134,7 +198,7 @@ def provider_parser(subparser):
     )
 
     # Explore and load the arguments available for every provider into the 'auto' provider.
-    for provider_name, provider_module in AVAILABLE_PROVIDERS.items():
+    for provider_name, provider_module in _get_available_providers().items():
         parser = argparse.ArgumentParser(add_help=False)
         provider_module.provider_parser(parser)
 
@@ -182,6 +246,18 @@ class Provider(object):
         provider, then call its authenticate() method. Almost every subsequent operation will then
         be delegated to that provider.
         """
+        self._resolve_proxy_provider()
+        self.proxy_provider.authenticate()
+
+    async def async_authenticate(self):
+        """
+        Asynchronous version of authenticate(): the relevant provider is found in a thread,
+        then its async_authenticate() method is awaited.
+        """
+        await run_in_executor(self._resolve_proxy_provider)
+        await self.proxy_provider.async_authenticate()
+
+    def _resolve_proxy_provider(self):
         mapping_override = self.config.resolve("lexicon:auto:mapping_override")
         mapping_override_processed = {}
         if mapping_override:
@@ -193,17 +269,15 @@ class Provider(object):
 
         override_provider = mapping_override_processed.get(self.domain)
         if override_provider:
-            provider = [
-                element
-                for element in AVAILABLE_PROVIDERS.items()
-                if element[0] == override_provider
-            ][0]
+            provider_name = override_provider
+            provider_module = importlib.import_module(
+                "lexicon.providers." + provider_name
+            )
             LOGGER.info(
                 "Provider authoritatively mapped for domain %s: %s.",
                 self.domain,
-                provider.__name__,
+                provider_name,
             )
-            (provider_name, provider_module) = provider
         else:
             (provider_name, provider_module) = _relevant_provider_for_domain(
                 self.domain
@@ -237,7 +311,6 @@ class Provider(object):
                 new_config.with_dict(new_dict)
 
         self.proxy_provider = provider_module.Provider(new_config)
-        self.proxy_provider.authenticate()
 
     def __getattr__(self, attr_name):
         """
@@ -255,6 +255,42 @@ class Provider(BaseProvider):
         assert subscription_id
         assert resource_group
 
+        self._access_token = self._get_stored_token()
+        result = None
+        if self._access_token:
+            try:
+                result = self._list_dns_zones(subscription_id, resource_group)
+            except requests.exceptions.HTTPError as error:
+                if error.response.status_code != 401:
+                    raise
+                LOGGER.debug("Stored access token has been rejected, renewing it")
+                self._discard_stored_token()
+
+        if result is None:
+            self._access_token = self._exchange_token(
+                tenant_id, client_id, client_secret
+            )
+            result = self._list_dns_zones(subscription_id, resource_group)
+
+        data = result.json()
+
+        our_data = [
+            one_data for one_data in data["value"] if one_data["name"] == self.domain
+        ]
+
+        if not our_data:
+            raise Exception(
+                "Resource group `{0}` in subscription `{1}` "
+                "does not contain the DNS zone `{2}`".format(
+                    resource_group, subscription_id, self.domain
+                )
+            )
+
+        self.domain_id = our_data[0]["id"]
+
+    # The access token obtained with the client credentials is kept in the token store
+    # until it expires, so the next Lexicon operations can skip this exchange.
+    def _exchange_token(self, tenant_id, client_id, client_secret):
         url = "{0}/{1}/oauth2/token".format(AZURE_AD_URL, tenant_id)
         data = {
             "grant_type": "client_credentials",
@@ -263,41 +299,30 @@ class Provider(BaseProvider):
             "resource": MANAGEMENT_URL,
         }
 
-        result = requests.post(url, data=data)
+        result = self._get_http_session().post(url, data=data)
         result.raise_for_status()
 
-        self._access_token = result.json()["access_token"]
+        token = result.json()
+        if token.get("expires_in"):
+            self._store_token(token["access_token"], token["expires_in"])
+        return token["access_token"]
 
+    def _list_dns_zones(self, subscription_id, resource_group):
         url = "{0}/subscriptions/{1}/resourceGroups/{2}/providers/Microsoft.Network/dnsZones".format(
             MANAGEMENT_URL, subscription_id, resource_group
         )
         headers = {"Authorization": "Bearer {0}".format(self._access_token)}
         params = {"api-version": API_VERSION}
 
-        result = requests.get(url, headers=headers, params=params)
+        result = self._get_http_session().get(url, headers=headers, params=params)
         result.raise_for_status()
-
-        data = result.json()
-
-        our_data = [
-            one_data for one_data in data["value"] if one_data["name"] == self.domain
-        ]
-
-        if not our_data:
-            raise Exception(
-                "Resource group `{0}` in subscription `{1}` "
-                "does not contain the DNS zone `{2}`".format(
-                    resource_group, subscription_id, self.domain
-                )
-            )
-
-        self.domain_id = our_data[0]["id"]
+        return result
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
         query_params = {} if not query_params else query_params.copy()
         query_params["api-version"] = API_VERSION
         headers = {"Authorization": "Bearer {0}".format(self._access_token)}
-        request = requests.request(
+        request = self._get_http_session().request(
             action,
             MANAGEMENT_URL + self.domain_id + url,
             params=query_params,
@@ -1,10 +1,66 @@
 """Base provider module for all Lexicon providers"""
 from __future__ import absolute_import
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
 import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from lexicon import cache, changeset, retry, snapshot, token_store
 from lexicon.config import ConfigResolver, legacy_config_resolver
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+LOGGER = logging.getLogger(__name__)
+
+# Name of the cache file storing the domain ids resolved by providers.
+DOMAIN_IDS_CACHE = "domain_ids"
+
+# Maximum number of threads used to run synchronous provider operations from the
+# asynchronous Provider API, shared by all providers of the process.
+ASYNC_MAX_WORKERS = int(os.environ.get("LEXICON_ASYNC_MAX_WORKERS", "10"))
+
+_ASYNC_EXECUTOR = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+# Default size of the HTTP connections pool of each provider, per host.
+HTTP_POOL_SIZE_DEFAULT = 10
+
+# Credential options included in the rate limit key, in addition to the auth_* options
+# declared by the parser of each provider.
+_COMMON_AUTH_OPTIONS = ("auth_username", "auth_token", "auth_key", "auth_api_key")
+
+
+async def run_in_executor(func, *args, **kwargs):
+    """
+    Run the given synchronous function in the bounded thread pool shared by Lexicon
+    providers, and return its result without blocking the event loop.
+    """
+    global _ASYNC_EXECUTOR  # pylint: disable=global-statement
+    with _ASYNC_EXECUTOR_LOCK:
+        if not _ASYNC_EXECUTOR:
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(
+                max_workers=ASYNC_MAX_WORKERS, thread_name_prefix="lexicon-async"
+            )
+
+    return await asyncio.get_event_loop().run_in_executor(
+        _ASYNC_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
 
 class Provider(object):
     """
@@ -36,6 +92,48 @@ class Provider(object):
     for this provider, merged from CLI and Env variables.
     """
 
+    # Default retry policy and rate limit of the HTTP requests sent by the provider.
+    # Providers can change them to fit their API, and users can override them with the
+    # http_max_retries, http_backoff_factor and http_rate_limit options.
+    HTTP_MAX_RETRIES = 5
+    HTTP_BACKOFF_FACTOR = 0.5
+    HTTP_BACKOFF_MAX = 30
+    # Randomize the backoff delays (see retry.RetryPolicy), so that concurrent clients
+    # do not retry all at the same time.
+    HTTP_BACKOFF_JITTER = True
+    # Statuses retried whatever the HTTP method, as the request has not been processed.
+    HTTP_RETRY_STATUSES = frozenset([429])
+    # Statuses retried only for idempotent HTTP methods (see retry.IDEMPOTENT_METHODS).
+    HTTP_RETRY_IDEMPOTENT_STATUSES = frozenset([503])
+    # Maximum requests per second for the same provider credentials, None for no limit.
+    HTTP_RATE_LIMIT = None
+    HTTP_RATE_BURST = 1
+    # Seconds a zone snapshot is reused before listing the zone again, None for no
+    # expiry. Users can override it with the zone_snapshot_ttl option, 0 disabling
+    # the snapshots. Only used by providers implementing _fetch_zone_records().
+    ZONE_SNAPSHOT_TTL = 30
+    # Seconds a domain id resolved by the provider is reused by the next invocations of
+    # Lexicon, overridable with the domain_id_cache_ttl option (0 to disable). Only used
+    # by providers calling _get_cached_domain_id() from their _authenticate().
+    DOMAIN_ID_CACHE_TTL = 24 * 3600
+    # Pages of a paginated listing fetched at the same time once the number of pages is
+    # known, overridable with the page_fetch_concurrency option (1 to fetch them one by
+    # one). Only used by providers calling _fetch_pages().
+    PAGE_FETCH_CONCURRENCY = 4
+
+    # requests session of this provider, created by _get_http_session()
+    _http_session = None
+    # retry policy of this provider, created by _get_retry_policy()
+    _retry_policy = None
+    # aiohttp session used by the native asynchronous implementations, if any
+    _async_session = None
+    # zone snapshot of this provider, created by _get_zone_snapshot()
+    _zone_snapshot = None
+    # state of the zone snapshot during a write: None, "invalidated" or "updated"
+    _zone_snapshot_state = None
+    # True if the domain id of this provider has been read from the cache
+    _domain_id_cached = False
+
     def __init__(self, config):
         if not isinstance(config, ConfigResolver):
             # If config is a plain dict, we are in a legacy situation.
@@ -84,7 +182,7 @@ class Provider(object):
             )
             rtype = kwargs.get("type")
 
-        return self._create_record(rtype, name, content)
+        return self._write_zone(self._create_record, rtype, name, content)
 
     def list_records(self, rtype=None, name=None, content=None, **kwargs):
         """
@@ -100,7 +198,9 @@ class Provider(object):
             )
             rtype = kwargs.get("type")
 
-        return self._list_records(rtype=rtype, name=name, content=content)
+        return self._resolve_domain_id(
+            self._list_records, rtype=rtype, name=name, content=content
+        )
 
     def update_record(self, identifier, rtype=None, name=None, content=None, **kwargs):
         """
@@ -113,7 +213,9 @@ class Provider(object):
             )
             rtype = kwargs.get("type")
 
-        return self._update_record(identifier, rtype=rtype, name=name, content=content)
+        return self._write_zone(
+            self._update_record, identifier, rtype=rtype, name=name, content=content
+        )
 
     def delete_record(
         self, identifier=None, rtype=None, name=None, content=None, **kwargs
@@ -130,10 +232,108 @@ class Provider(object):
             )
             rtype = kwargs.get("type")
 
-        return self._delete_record(
-            identifier=identifier, rtype=rtype, name=name, content=content
+        return self._write_zone(
+            self._delete_record,
+            identifier=identifier,
+            rtype=rtype,
+            name=name,
+            content=content,
+        )
+
+    def apply_changes(self, changes):
+        """
+        Apply the given list of record creations, updates and deletions (see
+        lexicon.changeset for their format), and return their results in the same order.
+        Providers having a bulk API submit all the changes in one request, so that none
+        of them is applied if one is invalid. Other providers apply them one by one.
+        """
+        changes = [changeset.normalize(change) for change in changes]
+        if self._has_native_changes():
+            return self._write_zone(self._apply_changes, changes)
+        return [self._apply_change(change) for change in changes]
+
+    # Asynchronous Provider API
+    # Providers implementing natively the _async_* methods are executed on the event loop,
+    # other providers are executed in a bounded thread pool (see run_in_executor()).
+    async def async_authenticate(self):
+        """Asynchronous version of authenticate()"""
+        if self._has_native_async():
+            return await self._async_authenticate()
+        return await run_in_executor(self.authenticate)
+
+    async def async_create_record(self, rtype=None, name=None, content=None, **kwargs):
+        """Asynchronous version of create_record()"""
+        if self._has_native_async():
+            rtype = _deprecated_type(rtype, kwargs)
+            return await self._async_write_zone(
+                self._async_create_record, rtype, name, content
+            )
+        return await run_in_executor(self.create_record, rtype, name, content, **kwargs)
+
+    async def async_list_records(self, rtype=None, name=None, content=None, **kwargs):
+        """Asynchronous version of list_records()"""
+        if self._has_native_async():
+            rtype = _deprecated_type(rtype, kwargs)
+            return await self._async_resolve_domain_id(
+                self._async_list_records, rtype=rtype, name=name, content=content
+            )
+        return await run_in_executor(self.list_records, rtype, name, content, **kwargs)
+
+    async def async_update_record(
+        self, identifier, rtype=None, name=None, content=None, **kwargs
+    ):
+        """Asynchronous version of update_record()"""
+        if self._has_native_async():
+            rtype = _deprecated_type(rtype, kwargs)
+            return await self._async_write_zone(
+                self._async_update_record,
+                identifier,
+                rtype=rtype,
+                name=name,
+                content=content,
+            )
+        return await run_in_executor(
+            self.update_record, identifier, rtype, name, content, **kwargs
+        )
+
+    async def async_delete_record(
+        self, identifier=None, rtype=None, name=None, content=None, **kwargs
+    ):
+        """Asynchronous version of delete_record()"""
+        if self._has_native_async():
+            rtype = _deprecated_type(rtype, kwargs)
+            return await self._async_write_zone(
+                self._async_delete_record,
+                identifier=identifier,
+                rtype=rtype,
+                name=name,
+                content=content,
+            )
+        return await run_in_executor(
+            self.delete_record, identifier, rtype, name, content, **kwargs
         )
 
+    async def async_apply_changes(self, changes):
+        """Asynchronous version of apply_changes()"""
+        if self._has_native_async():
+            results = []
+            for change in [changeset.normalize(change) for change in changes]:
+                results.append(await self._async_apply_change(change))
+            return results
+        return await run_in_executor(self.apply_changes, changes)
+
+    def close(self):
+        """Release the resources (eg. HTTP connections) used by this provider"""
+        if self._http_session:
+            self._http_session.close()
+            self._http_session = None
+
+    async def async_close(self):
+        """Release the resources (eg. HTTP connections) used by the asynchronous API"""
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+
     # Internal abstract implementations
     def _authenticate(self):
         raise NotImplementedError("Providers must implement this!")
@@ -150,10 +350,430 @@ class Provider(object):
     def _delete_record(self, identifier=None, rtype=None, name=None, content=None):
         raise NotImplementedError("Providers must implement this!")
 
+    # Internal change sets implementation, used if _has_native_changes() returns True
+    def _has_native_changes(self):
+        return False
+
+    def _apply_changes(self, changes):
+        raise NotImplementedError("Providers must implement this!")
+
+    def _apply_change(self, change):
+        if change["action"] == "create":
+            return self.create_record(change["type"], change["name"], change["content"])
+        if change["action"] == "update":
+            return self.update_record(
+                change["identifier"], change["type"], change["name"], change["content"]
+            )
+        return self.delete_record(
+            change["identifier"], change["type"], change["name"], change["content"]
+        )
+
+    async def _async_apply_change(self, change):
+        if change["action"] == "create":
+            return await self.async_create_record(
+                change["type"], change["name"], change["content"]
+            )
+        if change["action"] == "update":
+            return await self.async_update_record(
+                change["identifier"], change["type"], change["name"], change["content"]
+            )
+        return await self.async_delete_record(
+            change["identifier"], change["type"], change["name"], change["content"]
+        )
+
+    # Internal asynchronous implementations, used if _has_native_async() returns True
+    def _has_native_async(self):
+        return False
+
+    async def _async_authenticate(self):
+        raise NotImplementedError("Providers must implement this!")
+
+    async def _async_create_record(self, rtype, name, content):
+        raise NotImplementedError("Providers must implement this!")
+
+    async def _async_list_records(self, rtype=None, name=None, content=None):
+        raise NotImplementedError("Providers must implement this!")
+
+    async def _async_update_record(
+        self, identifier, rtype=None, name=None, content=None
+    ):
+        raise NotImplementedError("Providers must implement this!")
+
+    async def _async_delete_record(
+        self, identifier=None, rtype=None, name=None, content=None
+    ):
+        raise NotImplementedError("Providers must implement this!")
+
+    # Zone snapshots
+    # Providers listing the whole zone to find records implement _fetch_zone_records(),
+    # and look up records in _get_zone_snapshot() instead of listing the zone again.
+    # After a write, the snapshot is invalidated unless the provider has updated it,
+    # with _set_zone_snapshot() or the snapshot returned by _update_zone_snapshot(),
+    # or listed the zone again after invalidating it itself, or has not changed the
+    # zone (see _keep_zone_snapshot()).
+    def _fetch_zone_records(self):
+        raise NotImplementedError("Providers using zone snapshots must implement this!")
+
+    def _get_zone_snapshot(self):
+        """Return the zone snapshot, listing the zone if missing or expired"""
+        if self._zone_snapshot is None or self._zone_snapshot.is_expired():
+            records = self._fetch_zone_records()
+            if self._get_zone_snapshot_ttl() == 0:
+                return self._create_zone_snapshot(records)
+            self._zone_snapshot = self._create_zone_snapshot(records)
+            if self._zone_snapshot_state == "invalidated":
+                self._zone_snapshot_state = "updated"
+        return self._zone_snapshot
+
+    def _set_zone_snapshot(self, records):
+        """Replace the zone snapshot by the given records, eg. returned by a write"""
+        if self._get_zone_snapshot_ttl() != 0:
+            self._zone_snapshot = self._create_zone_snapshot(records)
+            self._zone_snapshot_state = "updated"
+
+    def _update_zone_snapshot(self):
+        """
+        Return the current zone snapshot to apply a write to it, or None if there is
+        no snapshot to update.
+        """
+        if self._zone_snapshot is not None and not self._zone_snapshot.is_expired():
+            self._zone_snapshot_state = "updated"
+            return self._zone_snapshot
+        return None
+
+    def _keep_zone_snapshot(self):
+        """Keep the zone snapshot after a write that did not change the zone"""
+        self._zone_snapshot_state = "updated"
+
+    def _invalidate_zone_snapshot(self):
+        self._zone_snapshot = None
+        self._zone_snapshot_state = "invalidated"
+
+    def _create_zone_snapshot(self, records):
+        return snapshot.ZoneSnapshot(records, ttl=self._get_zone_snapshot_ttl())
+
+    def _get_zone_snapshot_ttl(self):
+        ttl = self._get_lexicon_option("zone_snapshot_ttl")
+        return float(ttl) if ttl is not None else self.ZONE_SNAPSHOT_TTL
+
+    def _write_zone(self, func, *args, **kwargs):
+        self._zone_snapshot_state = None
+        try:
+            return self._resolve_domain_id(func, *args, **kwargs)
+        finally:
+            if self._zone_snapshot_state != "updated":
+                self._zone_snapshot = None
+
+    async def _async_write_zone(self, func, *args, **kwargs):
+        self._zone_snapshot_state = None
+        try:
+            return await self._async_resolve_domain_id(func, *args, **kwargs)
+        finally:
+            if self._zone_snapshot_state != "updated":
+                self._zone_snapshot = None
+
+    # Paginated listings
+    # Providers fetch the first page of a listing to learn the number of pages, then
+    # the remaining pages with _fetch_pages(), that sends the requests concurrently.
+    def _fetch_pages(self, fetch_page, pages):
+        """
+        Return the results of fetch_page(page) for each of the given pages, in the same
+        order, fetching up to page_fetch_concurrency pages at the same time.
+        """
+        pages = list(pages)
+        workers = min(self._get_page_fetch_concurrency(), len(pages))
+        if workers <= 1:
+            return [fetch_page(page) for page in pages]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lexicon-pages"
+        ) as executor:
+            return list(executor.map(fetch_page, pages))
+
+    async def _async_fetch_pages(self, fetch_page, pages):
+        """Asynchronous version of _fetch_pages(), fetch_page being a coroutine function"""
+        semaphore = asyncio.Semaphore(self._get_page_fetch_concurrency())
+
+        async def fetch(page):
+            async with semaphore:
+                return await fetch_page(page)
+
+        return await asyncio.gather(*[fetch(page) for page in pages])
+
+    def _get_page_fetch_concurrency(self):
+        concurrency = self._get_lexicon_option("page_fetch_concurrency")
+        return max(int(concurrency) if concurrency else self.PAGE_FETCH_CONCURRENCY, 1)
+
+    # Domain ids
+    # Providers resolving the domain id with costly requests (eg. listing the zones of
+    # the account) reuse it between invocations of Lexicon: their _authenticate() uses
+    # _get_cached_domain_id() if available, and _cache_domain_id() after a resolution.
+    # If an operation fails because a cached domain id is stale (see
+    # _is_stale_domain_id_error()), the provider authenticates again without the cache,
+    # and the operation is retried once.
+    def _get_cached_domain_id(self):
+        """Return the domain id resolved by a previous invocation, if any"""
+        domain_id = None
+        if self._get_domain_id_cache_ttl() != 0:
+            domain_id = cache.get_entry(DOMAIN_IDS_CACHE, self._domain_id_key())
+        self._domain_id_cached = domain_id is not None
+        return domain_id
+
+    def _cache_domain_id(self, domain_id):
+        """Store the resolved domain id for the next invocations"""
+        ttl = self._get_domain_id_cache_ttl()
+        if ttl != 0:
+            cache.set_entry(
+                DOMAIN_IDS_CACHE, self._domain_id_key(), domain_id, time.time() + ttl
+            )
+
+    def _discard_cached_domain_id(self):
+        cache.delete_entry(DOMAIN_IDS_CACHE, self._domain_id_key())
+        self._domain_id_cached = False
+
+    def _domain_id_key(self):
+        return "{0}:{1}:{2}".format(
+            self.provider_name, self._account_fingerprint(), self.domain
+        )
+
+    def _get_domain_id_cache_ttl(self):
+        ttl = self._get_lexicon_option("domain_id_cache_ttl")
+        return float(ttl) if ttl is not None else self.DOMAIN_ID_CACHE_TTL
+
+    def _is_stale_domain_id_error(self, error):
+        """Check if the given error is raised because the domain id does not exist"""
+        response = getattr(error, "response", None)
+        return (
+            isinstance(error, requests.exceptions.HTTPError)
+            and response is not None
+            and response.status_code == 404
+        )
+
+    def _resolve_domain_id(self, func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:  # pylint: disable=broad-except
+            if not self._domain_id_cached or not self._is_stale_domain_id_error(error):
+                raise
+            LOGGER.info("Cached domain id %s is stale, resolving it", self.domain_id)
+            self._discard_cached_domain_id()
+            self._zone_snapshot = None
+            self._authenticate()
+        return func(*args, **kwargs)
+
+    async def _async_resolve_domain_id(self, func, *args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as error:  # pylint: disable=broad-except
+            if not self._domain_id_cached or not self._is_stale_domain_id_error(error):
+                raise
+            LOGGER.info("Cached domain id %s is stale, resolving it", self.domain_id)
+            self._discard_cached_domain_id()
+            self._zone_snapshot = None
+            await self._async_authenticate()
+        return await func(*args, **kwargs)
+
+    # Access tokens
+    # Providers exchanging their credentials for an access token (eg. OAuth) reuse it
+    # between invocations of Lexicon through the token store (see lexicon.token_store).
+    def _get_stored_token(self):
+        """Return the access token stored for this provider account, if still valid"""
+        return token_store.get_token_store().get(self._token_key())
+
+    def _store_token(self, token, expires_in):
+        """Store the access token of this provider account, valid for expires_in seconds"""
+        token_store.get_token_store().set(
+            self._token_key(), token, time.time() + float(expires_in)
+        )
+
+    def _discard_stored_token(self):
+        """Remove the access token of this provider account, eg. if it is rejected"""
+        token_store.get_token_store().delete(self._token_key())
+
+    def _token_key(self):
+        return "{0}:{1}".format(self.provider_name, self._account_fingerprint())
+
     # Helpers
     def _request(self, action="GET", url="/", data=None, query_params=None):
         raise NotImplementedError("Providers must implement this!")
 
+    async def _async_request(self, action="GET", url="/", data=None, query_params=None):
+        raise NotImplementedError("Providers must implement this!")
+
+    async def _async_http_request(self, action, url, **kwargs):
+        """
+        Execute an HTTP request with aiohttp, reusing the connections of this provider.
+        Keyword arguments are given to aiohttp.ClientSession.request(). The response is
+        returned as a requests.Response, so it is handled like a synchronous response.
+        """
+        if not self._async_session:
+            self._async_session = aiohttp.ClientSession(
+                timeout=self._get_async_http_timeout()
+            )
+
+        policy = self._get_retry_policy()
+        attempt = 0
+        while True:
+            if policy.rate_limiter:
+                await asyncio.sleep(policy.rate_limiter.reserve())
+            try:
+                result = await self._async_http_send(action, url, **kwargs)
+            except aiohttp.ClientConnectorError:
+                if not policy.should_retry_error(attempt, action, request_sent=False):
+                    raise
+                result = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not policy.should_retry_error(attempt, action):
+                    raise
+                result = None
+            if result is not None and not policy.should_retry(attempt, result):
+                return result
+            await asyncio.sleep(policy.delay(attempt, result))
+            attempt += 1
+
+    async def _async_http_send(self, action, url, **kwargs):
+        async with self._async_session.request(action, url, **kwargs) as response:
+            content = await response.read()
+
+        result = requests.Response()
+        result.request = requests.PreparedRequest()
+        result.request.prepare(method=action, url=url)
+        result.status_code = response.status
+        result.reason = response.reason
+        result.url = str(response.url)
+        result.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        result.encoding = response.charset
+        result._content = content  # pylint: disable=protected-access
+        return result
+
+    def _get_async_http_timeout(self):
+        # Like for requests, http_timeout applies to the connection and to each read.
+        timeout = self._get_lexicon_option("http_timeout")
+        if not timeout:
+            return aiohttp.ClientTimeout(total=None)
+        return aiohttp.ClientTimeout(
+            total=None, sock_connect=float(timeout), sock_read=float(timeout)
+        )
+
+    def _get_http_session(self):
+        """
+        Return the requests.Session used to reach the provider API: connections are
+        kept alive and pooled between all requests made by this provider instance.
+        """
+        if not self._http_session:
+            self._http_session = self._create_http_session()
+        return self._http_session
+
+    def _create_http_session(self):
+        """
+        Create the requests.Session returned by _get_http_session(). Pool size and
+        timeout are set by the http_pool_size and http_timeout Lexicon options.
+        Responses are retried according to the policy of _get_retry_policy().
+        """
+        pool_size = int(
+            self._get_lexicon_option("http_pool_size") or HTTP_POOL_SIZE_DEFAULT
+        )
+        timeout = self._get_lexicon_option("http_timeout")
+        adapter = _PooledHTTPAdapter(
+            timeout=float(timeout) if timeout else None,
+            retry_policy=self._get_retry_policy(),
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=self._get_retry_policy().network_retries(),
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_retry_policy(self):
+        """
+        Return the retry.RetryPolicy of the HTTP requests sent by this provider, built
+        from the provider defaults (HTTP_* class attributes) and the Lexicon options.
+        """
+        if not self._retry_policy:
+            rate_limit = self._get_http_option("http_rate_limit", self.HTTP_RATE_LIMIT)
+            self._retry_policy = retry.RetryPolicy(
+                # The policy is owned by the HTTP session of this provider: it must not
+                # keep the provider alive, so its connections are closed with it.
+                _weak_method(self._is_retryable_response),
+                max_retries=int(
+                    self._get_http_option("http_max_retries", self.HTTP_MAX_RETRIES)
+                ),
+                backoff_factor=float(
+                    self._get_http_option(
+                        "http_backoff_factor", self.HTTP_BACKOFF_FACTOR
+                    )
+                ),
+                backoff_max=self.HTTP_BACKOFF_MAX,
+                jitter=self.HTTP_BACKOFF_JITTER,
+                rate_limiter=(
+                    retry.get_rate_limiter(
+                        self._rate_limit_key(), float(rate_limit), self.HTTP_RATE_BURST
+                    )
+                    if rate_limit
+                    else None
+                ),
+            )
+        return self._retry_policy
+
+    def _is_retryable_response(self, response):
+        """
+        Check if the given requests.Response must be retried. Providers can override
+        this method to detect API specific transient errors (eg. from the body).
+        """
+        if response.status_code in self.HTTP_RETRY_STATUSES:
+            return True
+        return (
+            response.status_code in self.HTTP_RETRY_IDEMPOTENT_STATUSES
+            and response.request is not None
+            and response.request.method in retry.IDEMPOTENT_METHODS
+        )
+
+    def _rate_limit_key(self):
+        """
+        Return the key identifying the rate limit shared by the requests of this provider,
+        by default its name and its credentials (hashed, to not keep them in memory).
+        """
+        return (self.provider_name, self._account_fingerprint())
+
+    def _account_fingerprint(self):
+        """
+        Return a hash of the credentials of this provider, identifying its account
+        without revealing the credentials.
+        """
+        credentials = hashlib.sha256()
+        for option in self._auth_options():
+            credentials.update(
+                "{0}={1}\0".format(
+                    option, self._get_provider_option(option) or ""
+                ).encode("utf-8")
+            )
+        return credentials.hexdigest()
+
+    def _auth_options(self):
+        """
+        Return the names of the auth_* options declared by the provider_parser() of
+        the module of this provider.
+        """
+        options = set(_COMMON_AUTH_OPTIONS)
+        provider_parser = getattr(
+            sys.modules.get(type(self).__module__), "provider_parser", None
+        )
+        if provider_parser:
+            parser = argparse.ArgumentParser(add_help=False)
+            provider_parser(parser)
+            options.update(
+                action.dest
+                for action in parser._actions  # pylint: disable=protected-access
+                if action.dest.startswith("auth_")
+            )
+        return sorted(options)
+
+    def _get_http_option(self, option, default):
+        value = self._get_lexicon_option(option)
+        return value if value is not None else default
+
     # Helpers
     def _get(self, url="/", query_params=None):
         return self._request("GET", url, query_params=query_params)
@@ -170,6 +790,22 @@ class Provider(object):
     def _delete(self, url="/", query_params=None):
         return self._request("DELETE", url, query_params=query_params)
 
+    async def _async_get(self, url="/", query_params=None):
+        return await self._async_request("GET", url, query_params=query_params)
+
+    async def _async_post(self, url="/", data=None, query_params=None):
+        return await self._async_request(
+            "POST", url, data=data, query_params=query_params
+        )
+
+    async def _async_put(self, url="/", data=None, query_params=None):
+        return await self._async_request(
+            "PUT", url, data=data, query_params=query_params
+        )
+
+    async def _async_delete(self, url="/", query_params=None):
+        return await self._async_request("DELETE", url, query_params=query_params)
+
     def _fqdn_name(self, record_name):
         # strip trailing period from fqdn if present
         record_name = record_name.rstrip(".")
@@ -207,3 +843,54 @@ class Provider(object):
 
     def _get_provider_option(self, option):
         return self.config.resolve("lexicon:{0}:{1}".format(self.provider_name, option))
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter applying a default timeout to requests that do not define one,
+    and retrying responses according to the given retry.RetryPolicy.
+    """
+
+    def __init__(self, timeout=None, retry_policy=None, **kwargs):
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        super(_PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            if policy and policy.rate_limiter:
+                policy.rate_limiter.acquire()
+            response = super(_PooledHTTPAdapter, self).send(request, **kwargs)
+            if not policy or not policy.should_retry(attempt, response):
+                return response
+            delay = policy.delay(attempt, response)
+            # Read the body, so the connection is released to the pool.
+            response.content  # pylint: disable=pointless-statement
+            time.sleep(delay)
+            attempt += 1
+
+
+def _weak_method(method):
+    """Return a function calling the given bound method, without keeping its instance alive"""
+    reference = weakref.WeakMethod(method)
+
+    def call(*args, **kwargs):
+        bound = reference()
+        return bound(*args, **kwargs) if bound else False
+
+    return call
+
+
+def _deprecated_type(rtype, kwargs):
+    if not rtype and kwargs.get("type"):
+        warnings.warn(
+            'Parameter "type" is deprecated, use "rtype" instead.',
+            DeprecationWarning,
+        )
+        rtype = kwargs.get("type")
+    return rtype
@@ -8,10 +8,18 @@ import requests
 
 from lexicon.providers.base import Provider as BaseProvider
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = ["cloudflare.com"]
 
+# Maximum number of records per page accepted by the list DNS records API
+LIST_RECORDS_PAGE_SIZE = 5000
+
 
 def provider_parser(subparser):
     """Return the parser for this provider"""
@@ -49,6 +57,10 @@ class Provider(BaseProvider):
     def _authenticate(self):
         zone_id = self._get_provider_option("zone_id")
         if not zone_id:
+            self.domain_id = self._get_cached_domain_id()
+            if self.domain_id:
+                return
+
             payload = self._get("/zones", {"name": self.domain, "status": "active"})
 
             if not payload["result"]:
@@ -57,6 +69,7 @@ class Provider(BaseProvider):
                 raise Exception("Too many domains found. This should not happen")
 
             self.domain_id = payload["result"][0]["id"]
+            self._cache_domain_id(self.domain_id)
         else:
             payload = self._get("/zones/{0}".format(zone_id))
 
@@ -75,15 +88,7 @@ class Provider(BaseProvider):
         try:
             payload = self._post("/zones/{0}/dns_records".format(self.domain_id), data)
         except requests.exceptions.HTTPError as err:
-            already_exists = next(
-                (
-                    True
-                    for error in err.response.json()["errors"]
-                    if error["code"] == 81057
-                ),
-                False,
-            )
-            if not already_exists:
+            if not self._is_already_existing_error(err):
                 raise
 
         LOGGER.debug("create_record: %s", payload["success"])
@@ -93,37 +98,21 @@ class Provider(BaseProvider):
     # type, name and content are used to filter records.
     # If possible filter during the query, otherwise filter after response is received.
     def _list_records(self, rtype=None, name=None, content=None):
-        filter_obj = {"per_page": 100}
-        if rtype:
-            filter_obj["type"] = rtype
-        if name:
-            filter_obj["name"] = self._full_name(name)
-        if content:
-            filter_obj["content"] = content
+        url = "/zones/{0}/dns_records".format(self.domain_id)
+        filter_obj = self._list_records_filter(rtype, name, content)
 
-        records = []
-        while True:
-            payload = self._get(
-                "/zones/{0}/dns_records".format(self.domain_id), filter_obj
-            )
+        def fetch_page(page):
+            return self._get(url, dict(filter_obj, page=page))
 
-            LOGGER.debug("payload: %s", payload)
+        payload = self._get(url, filter_obj)
+        payloads = [payload] + self._fetch_pages(
+            fetch_page, range(2, payload["result_info"]["total_pages"] + 1)
+        )
 
-            for record in payload["result"]:
-                processed_record = {
-                    "type": record["type"],
-                    "name": record["name"],
-                    "ttl": record["ttl"],
-                    "content": record["content"],
-                    "id": record["id"],
-                }
-                records.append(processed_record)
-
-            pages = payload["result_info"]["total_pages"]
-            page = payload["result_info"]["page"]
-            if page >= pages:
-                break
-            filter_obj["page"] = page + 1
+        records = []
+        for payload in payloads:
+            LOGGER.debug("payload: %s", payload)
+            records.extend(self._process_record(record) for record in payload["result"])
 
         LOGGER.debug("list_records: %s", records)
         LOGGER.debug("Number of records retrieved: %d", len(records))
@@ -133,29 +122,11 @@ class Provider(BaseProvider):
     def _update_record(self, identifier, rtype=None, name=None, content=None):
         if identifier is None:
             records = self._list_records(rtype, name)
-            if len(records) == 1:
-                identifier = records[0]["id"]
-            elif len(records) < 1:
-                raise Exception(
-                    "No records found matching type and name - won't update"
-                )
-            else:
-                raise Exception(
-                    "Multiple records found matching type and name - won't update"
-                )
-
-        data = {}
-        if rtype:
-            data["type"] = rtype
-        if name:
-            data["name"] = self._full_name(name)
-        if content:
-            data["content"] = content
-        if self._get_lexicon_option("ttl"):
-            data["ttl"] = self._get_lexicon_option("ttl")
+            identifier = self._unique_record_id(records)
 
         payload = self._put(
-            "/zones/{0}/dns_records/{1}".format(self.domain_id, identifier), data
+            "/zones/{0}/dns_records/{1}".format(self.domain_id, identifier),
+            self._update_record_data(rtype, name, content),
         )
 
         LOGGER.debug("update_record: %s", payload["success"])
@@ -179,12 +150,161 @@ class Provider(BaseProvider):
         LOGGER.debug("delete_record: %s", True)
         return True
 
+    # Native asynchronous implementations, mirroring the synchronous ones
+    def _has_native_async(self):
+        return aiohttp is not None
+
+    async def _async_authenticate(self):
+        zone_id = self._get_provider_option("zone_id")
+        if not zone_id:
+            self.domain_id = self._get_cached_domain_id()
+            if self.domain_id:
+                return
+
+            payload = await self._async_get(
+                "/zones", {"name": self.domain, "status": "active"}
+            )
+
+            if not payload["result"]:
+                raise Exception("No domain found")
+            if len(payload["result"]) > 1:
+                raise Exception("Too many domains found. This should not happen")
+
+            self.domain_id = payload["result"][0]["id"]
+            self._cache_domain_id(self.domain_id)
+        else:
+            payload = await self._async_get("/zones/{0}".format(zone_id))
+
+            if not payload["result"]:
+                raise Exception("No domain found for Zone ID {0}".format(zone_id))
+
+            self.domain_id = zone_id
+
+    async def _async_create_record(self, rtype, name, content):
+        data = {"type": rtype, "name": self._full_name(name), "content": content}
+        if self._get_lexicon_option("ttl"):
+            data["ttl"] = self._get_lexicon_option("ttl")
+
+        payload = {"success": True}
+        try:
+            payload = await self._async_post(
+                "/zones/{0}/dns_records".format(self.domain_id), data
+            )
+        except requests.exceptions.HTTPError as err:
+            if not self._is_already_existing_error(err):
+                raise
+
+        LOGGER.debug("create_record: %s", payload["success"])
+        return payload["success"]
+
+    async def _async_list_records(self, rtype=None, name=None, content=None):
+        url = "/zones/{0}/dns_records".format(self.domain_id)
+        filter_obj = self._list_records_filter(rtype, name, content)
+
+        async def fetch_page(page):
+            return await self._async_get(url, dict(filter_obj, page=page))
+
+        payload = await self._async_get(url, filter_obj)
+        payloads = [payload] + await self._async_fetch_pages(
+            fetch_page, range(2, payload["result_info"]["total_pages"] + 1)
+        )
+
+        records = []
+        for payload in payloads:
+            LOGGER.debug("payload: %s", payload)
+            records.extend(self._process_record(record) for record in payload["result"])
+
+        LOGGER.debug("list_records: %s", records)
+        LOGGER.debug("Number of records retrieved: %d", len(records))
+        return records
+
+    async def _async_update_record(
+        self, identifier, rtype=None, name=None, content=None
+    ):
+        if identifier is None:
+            records = await self._async_list_records(rtype, name)
+            identifier = self._unique_record_id(records)
+
+        payload = await self._async_put(
+            "/zones/{0}/dns_records/{1}".format(self.domain_id, identifier),
+            self._update_record_data(rtype, name, content),
+        )
+
+        LOGGER.debug("update_record: %s", payload["success"])
+        return payload["success"]
+
+    async def _async_delete_record(
+        self, identifier=None, rtype=None, name=None, content=None
+    ):
+        delete_record_id = []
+        if not identifier:
+            records = await self._async_list_records(rtype, name, content)
+            delete_record_id = [record["id"] for record in records]
+        else:
+            delete_record_id.append(identifier)
+
+        LOGGER.debug("delete_records: %s", delete_record_id)
+
+        for record_id in delete_record_id:
+            await self._async_delete(
+                "/zones/{0}/dns_records/{1}".format(self.domain_id, record_id)
+            )
+
+        LOGGER.debug("delete_record: %s", True)
+        return True
+
     # Helpers
     def _request(self, action="GET", url="/", data=None, query_params=None):
         if data is None:
             data = {}
         if query_params is None:
             query_params = {}
+        response = self._get_http_session().request(
+            action,
+            self.api_endpoint + url,
+            params=query_params,
+            data=json.dumps(data),
+            headers=self._request_headers(),
+        )
+        # if the request fails for any reason, throw an error.
+        response.raise_for_status()
+        return response.json()
+
+    async def _async_request(self, action="GET", url="/", data=None, query_params=None):
+        if data is None:
+            data = {}
+        if query_params is None:
+            query_params = {}
+        response = await self._async_http_request(
+            action,
+            self.api_endpoint + url,
+            params=query_params,
+            data=json.dumps(data),
+            headers=self._request_headers(),
+        )
+        # if the request fails for any reason, throw an error.
+        response.raise_for_status()
+        return response.json()
+
+    # Besides a 404 status, Cloudflare reports a zone id that does not exist anymore
+    # with the errors 1001 (invalid zone identifier) or 7003 (invalid object identifier).
+    def _is_stale_domain_id_error(self, error):
+        if super(Provider, self)._is_stale_domain_id_error(error):
+            return True
+        response = getattr(error, "response", None)
+        if (
+            not isinstance(error, requests.exceptions.HTTPError)
+            or response is None
+            or response.status_code != 400
+        ):
+            return False
+        try:
+            codes = {item.get("code") for item in response.json().get("errors", [])}
+        except (ValueError, AttributeError):
+            return False
+        return bool(codes & {1001, 7003})
+
+    def _request_headers(self):
         headers = {"Content-Type": "application/json"}
         if self._get_provider_option("auth_username"):
             headers["X-Auth-Email"] = self._get_provider_option("auth_username")
@@ -193,13 +313,53 @@ class Provider(BaseProvider):
             headers["Authorization"] = "Bearer {}".format(
                 self._get_provider_option("auth_token")
             )
-        response = requests.request(
-            action,
-            self.api_endpoint + url,
-            params=query_params,
-            data=json.dumps(data),
-            headers=headers,
+        return headers
+
+    # Type, name and content filters are applied by the API, and records are listed with
+    # the maximum page size, remaining pages being fetched concurrently.
+    def _list_records_filter(self, rtype, name, content):
+        filter_obj = {"per_page": LIST_RECORDS_PAGE_SIZE}
+        if rtype:
+            filter_obj["type"] = rtype
+        if name:
+            filter_obj["name"] = self._full_name(name)
+        if content:
+            filter_obj["content"] = content
+        return filter_obj
+
+    def _update_record_data(self, rtype, name, content):
+        data = {}
+        if rtype:
+            data["type"] = rtype
+        if name:
+            data["name"] = self._full_name(name)
+        if content:
+            data["content"] = content
+        if self._get_lexicon_option("ttl"):
+            data["ttl"] = self._get_lexicon_option("ttl")
+        return data
+
+    @staticmethod
+    def _process_record(record):
+        return {
+            "type": record["type"],
+            "name": record["name"],
+            "ttl": record["ttl"],
+            "content": record["content"],
+            "id": record["id"],
+        }
+
+    @staticmethod
+    def _unique_record_id(records):
+        if len(records) == 1:
+            return records[0]["id"]
+        if len(records) < 1:
+            raise Exception("No records found matching type and name - won't update")
+        raise Exception("Multiple records found matching type and name - won't update")
+
+    @staticmethod
+    def _is_already_existing_error(err):
+        return next(
+            (True for error in err.response.json()["errors"] if error["code"] == 81057),
+            False,
         )
-        # if the request fails for any reason, throw an error.
-        response.raise_for_status()
-        return response.json()
@@ -3,8 +3,6 @@ from __future__ import absolute_import
 
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -203,7 +201,7 @@ class Provider(BaseProvider):
             data.update(self._build_authentication_data())
 
         # Fire request against ClouDNS API and parse result as JSON
-        response = requests.request(
+        response = self._get_http_session().request(
             action, self.api_endpoint + url, params=query_params, data=data
         )
         response.raise_for_status()
@@ -191,7 +191,7 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             url,
             data=json.dumps(data),
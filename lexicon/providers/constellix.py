@@ -274,7 +274,7 @@ class Provider(BaseProvider):
         default_headers["x-cnsdns-requestDate"] = request_date
         default_headers["x-cnsdns-hmac"] = base64.b64encode(hashed.digest())
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -3,15 +3,22 @@ from __future__ import absolute_import
 
 import json
 import logging
-
-import requests
+from urllib.parse import parse_qs, urlparse
 
 from lexicon.providers.base import Provider as BaseProvider
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = ["digitalocean.com"]
 
+# Maximum number of records per page accepted by the API
+LIST_RECORDS_PAGE_SIZE = 200
+
 
 def provider_parser(subparser):
     """Configure provider parser for Digital Ocean"""
@@ -35,62 +42,33 @@ class Provider(BaseProvider):
         ttl = self._get_lexicon_option("ttl")
 
         if not self._list_records(rtype, name, content):
-            record = {
-                "type": rtype,
-                "name": self._relative_name(name),
-                "data": content,
-                "ttl": ttl,
-            }
-            if rtype == "CNAME":
-                # make sure a the data is always a FQDN for CNAMe.
-                record["data"] = record["data"].rstrip(".") + "."
-
+            record = self._create_record_data(rtype, name, content, ttl)
             self._post("/domains/{0}/records".format(self.domain_id), record)
         LOGGER.debug("create_record: %s", True)
         return True
 
     # List all records. Return an empty list if no records found
     # type, name and content are used to filter records.
-    # If possible filter during the query, otherwise filter after response is received.
+    # Type and name are filtered by the API, content after response is received.
+    # Records are listed with the maximum page size, and once the first page gives the
+    # number of pages, the remaining pages are fetched concurrently.
     def _list_records(self, rtype=None, name=None, content=None):
         url = "/domains/{0}/records".format(self.domain_id)
+        query_params = self._list_records_params(rtype, name)
+
+        def fetch_page(page):
+            return self._get(url, dict(query_params, page=page))
+
+        payload = self._get(url, query_params)
+        payloads = [payload] + self._fetch_pages(
+            fetch_page, range(2, self._last_page(payload) + 1)
+        )
+
         records = []
-        payload = {}
-
-        next_url = url
-        while next_url is not None:
-            payload = self._get(next_url)
-            if (
-                "links" in payload
-                and "pages" in payload["links"]
-                and "next" in payload["links"]["pages"]
-            ):
-                next_url = payload["links"]["pages"]["next"]
-            else:
-                next_url = None
-
-            for record in payload["domain_records"]:
-                processed_record = {
-                    "type": record["type"],
-                    "name": "{0}.{1}".format(record["name"], self.domain_id),
-                    "ttl": record["ttl"],
-                    "content": record["data"],
-                    "id": record["id"],
-                }
-                records.append(processed_record)
+        for payload in payloads:
+            records.extend(self._process_records(payload))
 
-        if rtype:
-            records = [record for record in records if record["type"] == rtype]
-        if name:
-            records = [
-                record for record in records if record["name"] == self._full_name(name)
-            ]
-        if content:
-            records = [
-                record
-                for record in records
-                if record["content"].lower() == content.lower()
-            ]
+        records = self._filter_records(records, rtype, name, content)
 
         LOGGER.debug("list_records: %s", records)
         return records
@@ -98,17 +76,7 @@ class Provider(BaseProvider):
     # Create or update a record.
     def _update_record(self, identifier, rtype=None, name=None, content=None):
 
-        data = {}
-        if rtype:
-            data["type"] = rtype
-        if name:
-            data["name"] = self._relative_name(name)
-        if content:
-            data["data"] = content
-
-        ttl = self._get_lexicon_option("ttl")
-        if ttl:
-            data["ttl"] = ttl
+        data = self._update_record_data(rtype, name, content)
 
         self._put("/domains/{0}/records/{1}".format(self.domain_id, identifier), data)
 
@@ -134,6 +102,79 @@ class Provider(BaseProvider):
         LOGGER.debug("delete_record: %s", True)
         return True
 
+    # Native asynchronous implementations, mirroring the synchronous ones
+    def _has_native_async(self):
+        return aiohttp is not None
+
+    async def _async_authenticate(self):
+        await self._async_get("/domains/{0}".format(self.domain))
+        self.domain_id = self.domain
+
+    async def _async_create_record(self, rtype, name, content):
+        # check if record already exists
+        ttl = self._get_lexicon_option("ttl")
+
+        if not await self._async_list_records(rtype, name, content):
+            record = self._create_record_data(rtype, name, content, ttl)
+            await self._async_post(
+                "/domains/{0}/records".format(self.domain_id), record
+            )
+        LOGGER.debug("create_record: %s", True)
+        return True
+
+    async def _async_list_records(self, rtype=None, name=None, content=None):
+        url = "/domains/{0}/records".format(self.domain_id)
+        query_params = self._list_records_params(rtype, name)
+
+        async def fetch_page(page):
+            return await self._async_get(url, dict(query_params, page=page))
+
+        payload = await self._async_get(url, query_params)
+        payloads = [payload] + await self._async_fetch_pages(
+            fetch_page, range(2, self._last_page(payload) + 1)
+        )
+
+        records = []
+        for payload in payloads:
+            records.extend(self._process_records(payload))
+
+        records = self._filter_records(records, rtype, name, content)
+
+        LOGGER.debug("list_records: %s", records)
+        return records
+
+    async def _async_update_record(
+        self, identifier, rtype=None, name=None, content=None
+    ):
+        data = self._update_record_data(rtype, name, content)
+
+        await self._async_put(
+            "/domains/{0}/records/{1}".format(self.domain_id, identifier), data
+        )
+
+        LOGGER.debug("update_record: %s", True)
+        return True
+
+    async def _async_delete_record(
+        self, identifier=None, rtype=None, name=None, content=None
+    ):
+        delete_record_id = []
+        if not identifier:
+            records = await self._async_list_records(rtype, name, content)
+            delete_record_id = [record["id"] for record in records]
+        else:
+            delete_record_id.append(identifier)
+
+        LOGGER.debug("delete_records: %s", delete_record_id)
+
+        for record_id in delete_record_id:
+            await self._async_delete(
+                "/domains/{0}/records/{1}".format(self.domain_id, record_id)
+            )
+
+        LOGGER.debug("delete_record: %s", True)
+        return True
+
     # Helpers
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
@@ -141,25 +182,116 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        default_headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": "Bearer {0}".format(
-                self._get_provider_option("auth_token")
-            ),
-        }
         if not url.startswith(self.api_endpoint):
             url = self.api_endpoint + url
 
-        response = requests.request(
+        response = self._get_http_session().request(
+            action,
+            url,
+            params=query_params,
+            data=json.dumps(data),
+            headers=self._request_headers(),
+        )
+        # if the request fails for any reason, throw an error.
+        response.raise_for_status()
+        if action == "DELETE":
+            return ""
+        return response.json()
+
+    async def _async_request(self, action="GET", url="/", data=None, query_params=None):
+        if data is None:
+            data = {}
+        if query_params is None:
+            query_params = {}
+        if not url.startswith(self.api_endpoint):
+            url = self.api_endpoint + url
+
+        response = await self._async_http_request(
             action,
             url,
             params=query_params,
             data=json.dumps(data),
-            headers=default_headers,
+            headers=self._request_headers(),
         )
         # if the request fails for any reason, throw an error.
         response.raise_for_status()
         if action == "DELETE":
             return ""
         return response.json()
+
+    def _request_headers(self):
+        return {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": "Bearer {0}".format(
+                self._get_provider_option("auth_token")
+            ),
+        }
+
+    def _create_record_data(self, rtype, name, content, ttl):
+        record = {
+            "type": rtype,
+            "name": self._relative_name(name),
+            "data": content,
+            "ttl": ttl,
+        }
+        if rtype == "CNAME":
+            # make sure a the data is always a FQDN for CNAMe.
+            record["data"] = record["data"].rstrip(".") + "."
+        return record
+
+    def _update_record_data(self, rtype, name, content):
+        data = {}
+        if rtype:
+            data["type"] = rtype
+        if name:
+            data["name"] = self._relative_name(name)
+        if content:
+            data["data"] = content
+
+        ttl = self._get_lexicon_option("ttl")
+        if ttl:
+            data["ttl"] = ttl
+        return data
+
+    def _list_records_params(self, rtype, name):
+        query_params = {"per_page": LIST_RECORDS_PAGE_SIZE}
+        if rtype:
+            query_params["type"] = rtype
+        if name:
+            query_params["name"] = self._full_name(name)
+        return query_params
+
+    @staticmethod
+    def _last_page(payload):
+        last_url = payload.get("links", {}).get("pages", {}).get("last")
+        if not last_url:
+            return 1
+        return int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+
+    def _process_records(self, payload):
+        return [
+            {
+                "type": record["type"],
+                "name": "{0}.{1}".format(record["name"], self.domain_id),
+                "ttl": record["ttl"],
+                "content": record["data"],
+                "id": record["id"],
+            }
+            for record in payload["domain_records"]
+        ]
+
+    def _filter_records(self, records, rtype=None, name=None, content=None):
+        if rtype:
+            records = [record for record in records if record["type"] == rtype]
+        if name:
+            records = [
+                record for record in records if record["name"] == self._full_name(name)
+            ]
+        if content:
+            records = [
+                record
+                for record in records
+                if record["content"].lower() == content.lower()
+            ]
+        return records
@@ -218,7 +218,7 @@ class Provider(BaseProvider):
 
         username = self._get_provider_option("auth_username")
         password = self._get_provider_option("auth_password")
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             auth=(username, password),
@@ -216,7 +216,7 @@ class Provider(BaseProvider):
 
         query_params["domain"] = self.domain
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.endpoint + url,
             auth=HTTPBasicAuth(
@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -213,7 +211,7 @@ class Provider(BaseProvider):
         else:
             raise Exception("No valid authentication mechanism found")
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -9,8 +9,6 @@ from email.utils import formatdate
 from hashlib import sha1
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -19,29 +17,6 @@ LOGGER = logging.getLogger(__name__)
 NAMESERVER_DOMAINS = ["dnsmadeeasy"]
 
 
-class _RetryRateLimit(Retry):
-    # Standard urllib3 Retry objects trigger retries only based on HTTP status code or HTTP method.
-    # However we need to differentiate 400 errors with body `{"error": ["Rate limit exceeded"]}`
-    # from the other 400 errors. The internal _RetryRateLimit class does that.
-    def increment(
-        self,
-        method=None,
-        url=None,
-        response=None,
-        error=None,
-        _pool=None,
-        _stacktrace=None,
-    ):
-        if response:
-            body = json.loads(response.data)
-            if "Rate limit exceeded" in body.get("error", []):
-                return super(_RetryRateLimit, self).increment(
-                    method, url, response, error, _pool, _stacktrace
-                )
-
-        raise RuntimeError("URL {0} returned a HTTP 400 status code.".format(url))
-
-
 def provider_parser(subparser):
     """Configure provider parser for DNSMadeEasy"""
     subparser.add_argument(
@@ -53,6 +28,18 @@ def provider_parser(subparser):
 class Provider(BaseProvider):
     """Provider class for DNSMadeEasy"""
 
+    # DNSMadeEasy allows only 150 requests in a floating 5 min time window.
+    # So rate limited requests are retried, up to 10 times with a backoff of 0.6:
+    # retries are done up to 1.2s, 2.4s, 4.8s, 9.6s, 19.2s, 38.4s, 76.8s, 153.6s,
+    # 307.2s after the previous attempt, which covers the size of the floating window.
+    # Beyond it we can assume something else is wrong and so give up.
+    # Delays are not randomized, otherwise the last retries could happen long before
+    # the end of the window.
+    HTTP_MAX_RETRIES = 10
+    HTTP_BACKOFF_FACTOR = 0.6
+    HTTP_BACKOFF_MAX = 310
+    HTTP_BACKOFF_JITTER = False
+
     def __init__(self, config):
         super(Provider, self).__init__(config)
         self.domain_id = None
@@ -176,6 +163,17 @@ class Provider(BaseProvider):
 
     # Helpers
 
+    def _is_retryable_response(self, response):
+        # A rate limited request is answered with a 400 error and the body
+        # `{"error": ["Rate limit exceeded"]}`: it needs to be differentiated from
+        # the other 400 errors.
+        if response.status_code == 400:
+            try:
+                return "Rate limit exceeded" in response.json().get("error", [])
+            except ValueError:
+                return False
+        return super(Provider, self)._is_retryable_response(response)
+
     def _request(self, action="GET", url="/", data=None, query_params=None):
         if data is None:
             data = {}
@@ -200,36 +198,18 @@ class Provider(BaseProvider):
         default_headers["x-dnsme-requestDate"] = request_date
         default_headers["x-dnsme-hmac"] = hashed.hexdigest()
 
-        session = requests.Session()
-        try:
-            # DNSMadeEasy allows only 150 requests in a floating 5 min time window.
-            # So we implement a retry strategy on requests returned as 400 with body
-            # `{"error": ["Rate limit exceeded"]}`.
-            # 10 retries with backoff = 0.6 gives following retry delays after first attempt:
-            # 1.2s, 2.4s, 4.8s, 9.6s, 19.2s, 38.4s, 76.8s, 153.6s, 307.2s
-            # So last attempt is done 5 min 7 seconds after first try, so the
-            # size of the floating window.
-            # Beyond it we can assume something else is wrong and so give up.
-            session_retries = _RetryRateLimit(
-                total=10, backoff_factor=0.6, status_forcelist=[400]
-            )
-            session_adapter = HTTPAdapter(max_retries=session_retries)
-            session.mount("http://", session_adapter)
-            session.mount("https://", session_adapter)
-            response = session.request(
-                action,
-                self.api_endpoint + url,
-                params=query_params,
-                data=json.dumps(data),
-                headers=default_headers,
-                auth=default_auth,
-            )
-            # if the request fails for any reason, throw an error.
-            response.raise_for_status()
-
-            # PUT and DELETE actions dont return valid json.
-            if action in ["DELETE", "PUT"]:
-                return response.text
-            return response.json()
-        finally:
-            session.close()
+        response = self._get_http_session().request(
+            action,
+            self.api_endpoint + url,
+            params=query_params,
+            data=json.dumps(data),
+            headers=default_headers,
+            auth=default_auth,
+        )
+        # if the request fails for any reason, throw an error.
+        response.raise_for_status()
+
+        # PUT and DELETE actions dont return valid json.
+        if action in ["DELETE", "PUT"]:
+            return response.text
+        return response.json()
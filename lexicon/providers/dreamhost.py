@@ -4,9 +4,6 @@ from __future__ import absolute_import
 import base64
 import json
 import logging
-import time
-
-import requests
 
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -47,6 +44,10 @@ def provider_parser(subparser):
 class Provider(BaseProvider):
     """Provider class for Dreamhost"""
 
+    # Requests are limited to one per second, to avoid triggering the DDoS protection
+    # of Dreamhost in case of looped requests.
+    HTTP_RATE_LIMIT = 1
+
     def __init__(self, config):
         super(Provider, self).__init__(config)
         self.domain_id = None
@@ -197,9 +198,6 @@ class Provider(BaseProvider):
             except Exception as exception:
                 err = exception
 
-            # Sleeping for 1-second to avoid trigerring ddos protecting in case of looped requests
-            time.sleep(1)
-
         if err is not None:
             raise err
 
@@ -223,7 +221,7 @@ class Provider(BaseProvider):
         if "cmd" not in query_params:
             query_params["cmd"] = url
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint,
             params=query_params,
@@ -158,7 +158,7 @@ class Provider(BaseProvider):
 
         LOGGER.debug("Request: %s %s with data %s", action, url, data)
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             data=data,
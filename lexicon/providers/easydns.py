@@ -145,7 +145,7 @@ class Provider(BaseProvider):
             "Content-Type": "application/json",
         }
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -4,7 +4,7 @@ from __future__ import absolute_import, print_function
 import logging
 
 from bs4 import BeautifulSoup, Tag
-from requests import Response, Session
+from requests import Response
 
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -42,9 +42,8 @@ class Provider(BaseProvider):
 
     def __init__(self, config):
         super(Provider, self).__init__(config)
-        self.session = Session()
+        self.session = self._get_http_session()
         self.domain_id = None
-        self._records = None
 
     def _authenticate(self):
         """
@@ -98,7 +97,7 @@ class Provider(BaseProvider):
         create_response = self.session.post(
             self.URLS["dns_create_entry"].format(self.domain_id), data=data
         )
-        self._invalidate_records_cache()
+        self._invalidate_zone_snapshot()
         self._log("Create DNS entry", create_response)
 
         # Pull a list of records and check for ours
@@ -129,6 +128,8 @@ class Provider(BaseProvider):
         """
         record_ids = self._get_matching_dns_entry_ids(identifier, rtype, name, content)
         LOGGER.debug("Record IDs to delete: %s", record_ids)
+        if not record_ids:
+            self._keep_zone_snapshot()
 
         success = True
         for rec_id in record_ids:
@@ -138,7 +139,7 @@ class Provider(BaseProvider):
             delete_response_confirm = self.session.post(
                 self.URLS["dns_delete_entry_confirm"].format(self.domain_id, rec_id)
             )
-            self._invalidate_records_cache()
+            self._invalidate_zone_snapshot()
             self._log("Delete DNS entry {}".format(rec_id), delete_response)
             # success = success and delete_response_confirm.url == success_url
             success = "feedback-message--success" in delete_response_confirm.text
@@ -210,48 +211,46 @@ class Provider(BaseProvider):
           AssertionError: When a request returns unexpected or unknown data.
         """
         name = self._full_name(name) if name is not None else name
-        if self._records is None:
-            records = []
-            # skip the first record which contains the table header
-            rows = self._get_dns_entry_trs()[1:]
-
-            for row in rows:
-                self._log("DNS list entry", row)
-                try:
-                    rec = {}
-                    columns = row.find_all("td")
-                    rec["name"] = (columns[0].string or "").strip()
-                    rec["type"] = (columns[1].contents[1] or "").strip()
-                    rec["content"] = (columns[2].string or "").strip()
-                    rec["priority"] = (columns[3].string or "").strip()
-                    rec["ttl"] = (columns[4].string or "").strip()
-                    rec["id"] = int(columns[5].find("a")["href"].rsplit("/", 1)[-1])
-
-                    if rec["priority"]:
-                        rec["priority"] = int(rec["priority"])
-
-                    if rec["ttl"]:
-                        rec["ttl"] = int(rec["ttl"])
-                except Exception as error:
-                    errmsg = "Cannot parse DNS entry ({}).".format(error)
-                    LOGGER.warning(errmsg)
-                    raise AssertionError(errmsg)
-                records.append(rec)
-            self._records = records
-
-        records = self._filter_records(self._records, rtype, name, content, identifier)
+        records = self._get_zone_snapshot().find(rtype=rtype, name=name)
+        records = self._filter_records(records, content=content, identifier=identifier)
         LOGGER.debug("Final records (%d): %s", len(records), records)
         return records
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
         pass
 
-    def _invalidate_records_cache(self):
+    def _fetch_zone_records(self):
         """
-        Invalidate DNS entries cache such that list_records will do a new
-        request to retrieve DNS entries.
+        Retrieve the DNS entries of the domain zone, cached by the zone snapshot
+        of the provider until the next change.
         """
-        self._records = None
+        records = []
+        # skip the first record which contains the table header
+        rows = self._get_dns_entry_trs()[1:]
+
+        for row in rows:
+            self._log("DNS list entry", row)
+            try:
+                rec = {}
+                columns = row.find_all("td")
+                rec["name"] = (columns[0].string or "").strip()
+                rec["type"] = (columns[1].contents[1] or "").strip()
+                rec["content"] = (columns[2].string or "").strip()
+                rec["priority"] = (columns[3].string or "").strip()
+                rec["ttl"] = (columns[4].string or "").strip()
+                rec["id"] = int(columns[5].find("a")["href"].rsplit("/", 1)[-1])
+
+                if rec["priority"]:
+                    rec["priority"] = int(rec["priority"])
+
+                if rec["ttl"]:
+                    rec["ttl"] = int(rec["ttl"])
+            except Exception as error:
+                errmsg = "Cannot parse DNS entry ({}).".format(error)
+                LOGGER.warning(errmsg)
+                raise AssertionError(errmsg)
+            records.append(rec)
+        return records
 
     def _get_post_data_to_create_dns_entry(self, rtype, name, content, identifier=None):
         """
@@ -289,6 +288,7 @@ class Provider(BaseProvider):
         is_duplicate = len(records) >= 1
         if is_duplicate:
             LOGGER.info("Duplicate record %s %s %s, NOOP", rtype, name, content)
+            self._keep_zone_snapshot()
         return is_duplicate
 
     def _get_matching_dns_entry_ids(
@@ -10,8 +10,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -229,7 +227,7 @@ class Provider(BaseProvider):
         if self.session_id:
             query_params["sess_id"] = self.session_id
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint,
             params=query_params,
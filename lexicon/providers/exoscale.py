@@ -3,8 +3,6 @@ from __future__ import absolute_import
 
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -172,7 +170,7 @@ class Provider(BaseProvider):
             )
         )
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
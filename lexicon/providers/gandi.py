@@ -27,6 +27,7 @@ attempt to detect and account for that.
 """
 from __future__ import absolute_import
 
+import contextlib
 import json
 import logging
 from builtins import object
@@ -258,6 +259,36 @@ class Provider(BaseProvider):
         LOGGER.debug("delete_record: %s", True)
         return True
 
+    # With RPC protocol, all the changes are applied on one new zone version, activated
+    # once at the end, or deleted if one of the changes fails.
+    def _has_native_changes(self):
+        return self.protocol == "rpc"
+
+    def _apply_changes(self, changes):
+        results = []
+        with self.rpc_helper.transaction():
+            for change in changes:
+                if change["action"] == "create":
+                    result = self._create_record(
+                        change["type"], change["name"], change["content"]
+                    )
+                elif change["action"] == "update":
+                    result = self._update_record(
+                        change["identifier"],
+                        change["type"],
+                        change["name"],
+                        change["content"],
+                    )
+                else:
+                    result = self._delete_record(
+                        change["identifier"],
+                        change["type"],
+                        change["name"],
+                        change["content"],
+                    )
+                results.append(result)
+        return results
+
     # Helpers
     def _request(self, action="GET", url="/", data=None, query_params=None):
         if data is None:
@@ -272,7 +303,7 @@ class Provider(BaseProvider):
         if not url.startswith(self.api_endpoint):
             url = self.api_endpoint + url
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             url,
             params=query_params,
@@ -303,6 +334,7 @@ class GandiRPCSubProvider(object):
         self._full_name = full_name_fn
         self._api = xmlrpclib.ServerProxy(self._api_endpoint, allow_none=True)
         self._zone_id = None
+        self._version = None
 
     # Authenticate against provider,
     # Make any requests required to get the domain's id for this provider,
@@ -317,34 +349,48 @@ class GandiRPCSubProvider(object):
         except xmlrpclib.Fault as err:
             raise Exception("Failed to authenticate: '{0}'".format(err))
 
+    # Gandi zone changes are made on a new version of the zone, activated once all the
+    # changes are applied. Within a transaction, all the record changes share the same
+    # version, so the zone is cloned and activated only once. The version is deleted if
+    # a change fails, leaving the active zone untouched.
+    @contextlib.contextmanager
+    def transaction(self):
+        """Apply the record changes made in this context with one new zone version."""
+        if self._version is not None:
+            yield self._version
+            return
+
+        self._version = self._api.domain.zone.version.new(self._api_key, self._zone_id)
+        activated = False
+        try:
+            yield self._version
+            self._api.domain.zone.version.set(
+                self._api_key, self._zone_id, self._version
+            )
+            activated = True
+        finally:
+            version, self._version = self._version, None
+            if not activated:
+                self._api.domain.zone.version.delete(
+                    self._api_key, self._zone_id, version
+                )
+
     # Create record. If record already exists with the same content, do nothing.
     def create_record(self, rtype, name, content, ttl):
         """Creates a record for the domain in a new Gandi zone."""
-        version = None
-        ret = False
-
         # This isn't quite "do nothing" if the record already exists.
         # In this case, no new record will be created, but a new zone version
         # will be created and set.
-        try:
-            version = self._api.domain.zone.version.new(self._api_key, self._zone_id)
+        with self.transaction() as version:
             self._api.domain.zone.record.add(
                 self._api_key,
                 self._zone_id,
                 version,
                 {"type": rtype.upper(), "name": name, "value": content, "ttl": ttl},
             )
-            self._api.domain.zone.version.set(self._api_key, self._zone_id, version)
-            ret = True
-
-        finally:
-            if not ret and version is not None:
-                self._api.domain.zone.version.delete(
-                    self._api_key, self._zone_id, version
-                )
 
-        LOGGER.debug("create_record: %s", ret)
-        return ret
+        LOGGER.debug("create_record: %s", True)
+        return True
 
     # List all records. Return an empty list if no records found
     # type, name and content are used to filter records.
@@ -388,67 +434,69 @@ class GandiRPCSubProvider(object):
     # Update a record. Identifier or type+name+content
     def update_record(self, identifier, rtype=None, name=None, content=None):
         """Updates the specified record in a new Gandi zone."""
-        if not identifier:
-            records = self.list_records(rtype, name)
-            if len(records) == 1:
-                identifier = records[0]["id"]
-            elif len(records) > 1:
-                raise Exception("Several record identifiers match the request")
-            else:
-                raise Exception("Record identifier could not be found")
-
-        identifier = str(identifier)
-        version = None
+        ret = False
 
         # Gandi doesn't allow you to edit records on the active zone file.
         # Gandi also doesn't persist zone record identifiers when creating
         # a new zone file. To update by identifier, we lookup the record
         # by identifier, then use the record fields to find the record in
-        # the newly created zone.
-        records = self._api.domain.zone.record.list(
-            self._api_key, self._zone_id, 0, {"id": identifier}
-        )
+        # the newly created zone. Without identifier, the record is looked up
+        # directly in the open zone version of a transaction, if any.
+        lookup_version = None if identifier else self._version
+        if identifier:
+            records = self._api.domain.zone.record.list(
+                self._api_key, self._zone_id, 0, {"id": str(identifier)}
+            )
+        else:
+            records = self._api.domain.zone.record.list(
+                self._api_key,
+                self._zone_id,
+                lookup_version or 0,
+                self._record_filter(rtype, name),
+            )
+            if len(records) > 1:
+                raise Exception("Several record identifiers match the request")
+            if not records:
+                raise Exception("Record identifier could not be found")
 
         if len(records) == 1:
             rec = records[0]
-            del rec["id"]
+            version_id = rec.pop("id")
 
             try:
-                version = self._api.domain.zone.version.new(
-                    self._api_key, self._zone_id
-                )
-                records = self._api.domain.zone.record.list(
-                    self._api_key, self._zone_id, version, rec
-                )
-                if len(records) != 1:
-                    raise self.GandiInternalError("expected one record")
+                with self.transaction() as version:
+                    # Record identifiers are only valid in the version looked up
+                    if version != lookup_version:
+                        records = self._api.domain.zone.record.list(
+                            self._api_key, self._zone_id, version, rec
+                        )
+                        if len(records) != 1:
+                            raise self.GandiInternalError("expected one record")
+                        version_id = records[0]["id"]
+
+                    if rtype is not None:
+                        rec["type"] = rtype.upper()
+                    if name is not None:
+                        rec["name"] = self._relative_name(name)
+                    if content is not None:
+                        rec["value"] = (
+                            self._txt_encode(content)
+                            if rec["type"] == "TXT"
+                            else content
+                        )
 
-                if rtype is not None:
-                    rec["type"] = rtype.upper()
-                if name is not None:
-                    rec["name"] = self._relative_name(name)
-                if content is not None:
-                    rec["value"] = (
-                        self._txt_encode(content) if rec["type"] == "TXT" else content
+                    records = self._api.domain.zone.record.update(
+                        self._api_key, self._zone_id, version, {"id": version_id}, rec
                     )
+                    if len(records) != 1:
+                        raise self.GandiInternalError("Expected one updated record")
 
-                records = self._api.domain.zone.record.update(
-                    self._api_key, self._zone_id, version, {"id": records[0]["id"]}, rec
-                )
-                if len(records) != 1:
-                    raise self.GandiInternalError("Expected one updated record")
-
-                self._api.domain.zone.version.set(self._api_key, self._zone_id, version)
                 ret = True
 
             except self.GandiInternalError:
-                pass
-
-            finally:
-                if not ret and version is not None:
-                    self._api.domain.zone.version.delete(
-                        self._api_key, self._zone_id, version
-                    )
+                # The whole transaction is rolled back if one of its changes fails
+                if self._version is not None:
+                    raise
 
         LOGGER.debug("update_record: %s", ret)
         return ret
@@ -458,50 +506,44 @@ class GandiRPCSubProvider(object):
     # If an identifier is specified, use it, otherwise do a lookup using type, name and content.
     def delete_record(self, identifier=None, rtype=None, name=None, content=None):
         """Removes the specified records in a new Gandi zone."""
-        version = None
-        ret = False
-
-        opts = {}
         if identifier is not None:
-            opts["id"] = identifier
+            records = self._api.domain.zone.record.list(
+                self._api_key, self._zone_id, 0, {"id": identifier}
+            )
         else:
             if not rtype and not name and not content:
                 raise ValueError(
                     "Error, at least one parameter from type, name or content must be set"
                 )
-            if rtype:
-                opts["type"] = rtype.upper()
-            if name:
-                opts["name"] = self._relative_name(name)
-            if content:
-                opts["value"] = (
-                    self._txt_encode(content) if opts["type"] == "TXT" else content
-                )
-
-        records = self._api.domain.zone.record.list(
-            self._api_key, self._zone_id, 0, opts
-        )
+            records = self._api.domain.zone.record.list(
+                self._api_key,
+                self._zone_id,
+                self._version or 0,
+                self._record_filter(rtype, name, content),
+            )
 
         if records:
-            try:
-                version = self._api.domain.zone.version.new(
-                    self._api_key, self._zone_id
-                )
+            with self.transaction() as version:
                 for record in records:
                     del record["id"]
                     self._api.domain.zone.record.delete(
                         self._api_key, self._zone_id, version, record
                     )
-                self._api.domain.zone.version.set(self._api_key, self._zone_id, version)
-                ret = True
-            finally:
-                if not ret and version is not None:
-                    self._api.domain.zone.version.delete(
-                        self._api_key, self._zone_id, version
-                    )
 
-        LOGGER.debug("delete_record: %s", ret)
-        return ret
+        LOGGER.debug("delete_record: %s", bool(records))
+        return bool(records)
+
+    def _record_filter(self, rtype=None, name=None, content=None):
+        opts = {}
+        if rtype:
+            opts["type"] = rtype.upper()
+        if name:
+            opts["name"] = self._relative_name(name)
+        if content:
+            opts["value"] = (
+                self._txt_encode(content) if opts.get("type") == "TXT" else content
+            )
+        return opts
 
     @staticmethod
     def _txt_encode(val):
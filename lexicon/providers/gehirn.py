@@ -6,7 +6,6 @@ import json
 import logging
 import re
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from lexicon.providers.base import Provider as BaseProvider
@@ -328,7 +327,7 @@ class Provider(BaseProvider):
         if query_params:
             query_string = json.dumps(query_params)
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_string,
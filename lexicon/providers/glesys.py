@@ -3,8 +3,6 @@ from __future__ import absolute_import
 
 import json
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 NAMESERVER_DOMAINS = ["glesys.com"]
@@ -134,7 +132,7 @@ class Provider(BaseProvider):
             self._get_provider_option("auth_username"),
             self._get_provider_option("auth_token"),
         )
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -5,10 +5,6 @@ import hashlib
 import json
 import logging
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -47,6 +43,14 @@ class Provider(BaseProvider):
     something is changed in the record.
     """
 
+    # When editing DNS zone, API is unavailable for few seconds
+    # (until modifications are propagated).
+    # In this case, call to API will return 409 HTTP error.
+    # We retry the requests until we get a processable reponse
+    # (402 HTTP status, or an HTTP error != 409)
+    HTTP_MAX_RETRIES = 10
+    HTTP_RETRY_STATUSES = BaseProvider.HTTP_RETRY_STATUSES | frozenset([409])
+
     def __init__(self, config):
         super(Provider, self).__init__(config)
         self.domain_id = None
@@ -283,22 +287,7 @@ class Provider(BaseProvider):
         if not query_params:
             query_params = {}
 
-        # When editing DNS zone, API is unavailable for few seconds
-        # (until modifications are propagated).
-        # In this case, call to API will return 409 HTTP error.
-        # We use the Retry extension to retry the requests until
-        # we get a processable reponse (402 HTTP status, or an HTTP error != 409)
-        retries = Retry(
-            total=10,
-            backoff_factor=0.5,
-            status_forcelist=[409],
-            method_whitelist=frozenset(["GET", "PUT", "POST", "DELETE", "PATCH"]),
-        )
-
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=retries))
-
-        result = session.request(
+        result = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
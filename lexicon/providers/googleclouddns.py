@@ -22,6 +22,7 @@ through create/update/list/delete processes.
 from __future__ import absolute_import
 
 import binascii
+import hashlib
 import json
 import logging
 import time
@@ -32,6 +33,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
+from lexicon import changeset
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -119,9 +121,45 @@ class Provider(BaseProvider):
     #     to the Google Cloud DNS API to authenticate the user.
     #   - finally we make a first authenticated request to retrieve
     #     the managed zone id, which will also be used on future requests.
-    # This access token has a default lifetime of 10 minutes,
-    # but is used only for the current Lexicon operation, so it should be sufficient.
+    # The access token is kept in the token store until it expires (usually one hour),
+    # so the next Lexicon operations can skip the JWT signature and exchange.
     def _authenticate(self):
+        self._token = self._get_stored_token()
+        self.domain_id = self._get_cached_domain_id() if self._token else None
+        if self.domain_id:
+            return
+
+        results = None
+        if self._token:
+            try:
+                results = self._get("/managedZones")
+            except requests.exceptions.HTTPError as error:
+                if error.response.status_code != 401:
+                    raise
+                LOGGER.debug("Stored access token has been rejected, renewing it")
+                self._discard_stored_token()
+
+        if results is None:
+            self._token = self._exchange_token()
+            results = self._get("/managedZones")
+
+        targeted_managed_zone_ids = [
+            managedZone["id"]
+            for managedZone in results["managedZones"]
+            if managedZone["dnsName"] == "{0}.".format(self.domain)
+        ]
+
+        if not targeted_managed_zone_ids:
+            raise Exception(
+                "Error, domain {0} is not registered for this project".format(
+                    self.domain
+                )
+            )
+
+        self.domain_id = targeted_managed_zone_ids[0]
+        self._cache_domain_id(self.domain_id)
+
+    def _exchange_token(self):
         jwt_header_bytes = urlsafe_b64encode(
             json.dumps({"alg": "RS256", "typ": "JWT"}).encode("utf-8")
         )
@@ -154,7 +192,7 @@ class Provider(BaseProvider):
 
         jwt_bytes = b".".join([jwt_header_bytes, jwt_claims_bytes, jwt_sign_bytes])
 
-        auth_request = requests.request(
+        auth_request = self._get_http_session().request(
             "POST",
             "https://www.googleapis.com/oauth2/v4/token",
             data={
@@ -175,39 +213,79 @@ class Provider(BaseProvider):
                 )
             )
 
-        self._token = post_result["access_token"]
+        if post_result.get("expires_in"):
+            self._store_token(post_result["access_token"], post_result["expires_in"])
 
-        results = self._get("/managedZones")
+        return post_result["access_token"]
 
-        targeted_managed_zone_ids = [
-            managedZone["id"]
-            for managedZone in results["managedZones"]
-            if managedZone["dnsName"] == "{0}.".format(self.domain)
-        ]
+    # The service account info may be given as a file path, so the account is identified
+    # by the content of this file instead of the auth_service_account_info option.
+    def _account_fingerprint(self):
+        return hashlib.sha256(
+            "{0}\0{1}\0{2}".format(
+                self._service_account_info["client_email"],
+                self._service_account_info["project_id"],
+                self._service_account_info.get("private_key_id", ""),
+            ).encode("utf-8")
+        ).hexdigest()
+
+    # With a cached managed zone id, the stored access token is not checked by
+    # _authenticate(): a rejected token is handled like a stale managed zone id,
+    # _authenticate() renewing both.
+    def _is_stale_domain_id_error(self, error):
+        return super(Provider, self)._is_stale_domain_id_error(error) or (
+            isinstance(error, requests.exceptions.HTTPError)
+            and error.response is not None
+            and error.response.status_code == 401
+        )
 
-        if not targeted_managed_zone_ids:
-            raise Exception(
-                "Error, domain {0} is not registered for this project".format(
-                    self.domain
-                )
+    # Iterate over the RecordSets of the zone, following the pages of the listing.
+    # The API filters the RecordSets by name if given, and by type if name is given too
+    # (the API does not accept a type without a name).
+    def _iter_rrsets(self, rtype=None, name=None):
+        query_params = {}
+        if name:
+            if rtype:
+                query_params["type"] = rtype
+            query_params["name"] = self._fqdn_name(name)
+
+        while True:
+            results = self._get(
+                "/managedZones/{0}/rrsets".format(self.domain_id),
+                query_params=query_params or None,
             )
+            for rrset in results.get("rrsets", []):
+                yield rrset
 
-        self.domain_id = targeted_managed_zone_ids[0]
+            if not results.get("nextPageToken"):
+                break
+            query_params = dict(query_params, pageToken=results["nextPageToken"])
 
     # List all records for the given type/name/content.
     # It is quite straight forward to request data, the biggest operation is to convert
     # the stacked multivalued RecordSets into Lexicon monovalued entries.
-    # Please note that we could provide type and name to the API to make the filtering,
-    # but providing the type makes the name mandatory with the Google Cloud DNS API, and
-    # name is not always available (we can ask for every TXT record for example). So to stick to
-    # the most general case, its preferable to always get all records and be free to filter
-    # the way we want afterwards.
+    # Name and type are given to the API when possible, other filters are applied afterwards.
     def _list_records(self, rtype=None, name=None, content=None):
-        results = self._get("/managedZones/{0}/rrsets".format(self.domain_id))
+        records = self._rrsets_records(self._iter_rrsets(rtype, name))
 
+        if rtype:
+            records = [record for record in records if record["type"] == rtype]
+        if name:
+            records = [
+                record for record in records if record["name"] == self._full_name(name)
+            ]
+        if content:
+            records = [record for record in records if record["content"] == content]
+
+        LOGGER.debug("list_records: %s", records)
+
+        return records
+
+    # Convert the given RecordSets into Lexicon monovalued entries.
+    def _rrsets_records(self, rrsets):
         records = []
 
-        for rrset in results["rrsets"]:
+        for rrset in rrsets:
             for rrdata in rrset["rrdatas"]:
                 record = {
                     "type": rrset["type"],
@@ -219,17 +297,6 @@ class Provider(BaseProvider):
                 record["id"] = Provider._identifier(record)
                 records.append(record)
 
-        if rtype:
-            records = [record for record in records if record["type"] == rtype]
-        if name:
-            records = [
-                record for record in records if record["name"] == self._full_name(name)
-            ]
-        if content:
-            records = [record for record in records if record["content"] == content]
-
-        LOGGER.debug("list_records: %s", records)
-
         return records
 
     # Create the record with provided type, name and content.
@@ -247,16 +314,11 @@ class Provider(BaseProvider):
             {"type": rtype, "name": self._full_name(name), "content": content}
         )
 
-        query_params = {"type": rtype, "name": self._fqdn_name(name)}
-
-        results = self._get(
-            "/managedZones/{0}/rrsets".format(self.domain_id), query_params=query_params
-        )
+        rrset = next(self._iter_rrsets(rtype, name), None)
 
         rrdatas = []
         changes = {}
-        if results["rrsets"]:
-            rrset = results["rrsets"][0]
+        if rrset:
             for rrdata in rrset["rrdatas"]:
                 if rrdata == Provider._normalize_content(rrset["type"], content):
                     LOGGER.debug("create_record (ignored, duplicate): %s", identifier)
@@ -290,26 +352,76 @@ class Provider(BaseProvider):
 
         return True
 
+    # All the changes are submitted with one Change, that deletes the RecordSets modified in
+    # their original state, and adds them back in their final state unless they become empty.
+    # The Change is atomic: if one of its deletions or additions fails, none is applied.
+    def _has_native_changes(self):
+        return True
+
+    def _apply_changes(self, changes):
+        records = changeset.touched_records(changes, self._list_records)
+        final_records, results = changeset.plan(records, changes, self._full_name)
+
+        data = {"additions": [], "deletions": []}
+        for rtype, name, before, after in changeset.changed_rrsets(
+            records, final_records
+        ):
+            if before:
+                data["deletions"].append(
+                    {
+                        "name": self._fqdn_name(name),
+                        "type": rtype,
+                        "ttl": before[0]["ttl"],
+                        "rrdatas": [
+                            Provider._normalize_content(rtype, record["content"])
+                            for record in before
+                        ],
+                    }
+                )
+            if after:
+                data["additions"].append(
+                    {
+                        "name": self._fqdn_name(name),
+                        "type": rtype,
+                        "ttl": self._get_lexicon_option("ttl"),
+                        "rrdatas": [
+                            Provider._normalize_content(rtype, record["content"])
+                            for record in after
+                        ],
+                    }
+                )
+
+        if data["additions"] or data["deletions"]:
+            self._post("/managedZones/{0}/changes".format(self.domain_id), data=data)
+
+        LOGGER.debug("apply_changes: %s", data)
+
+        return results
+
     # Update a record for the given identifier or type/name pair
     # with the given content if provided.
     # Again because of the API specification, updating is even more complex than creating,
     # as we need to take into account every RecordSet that should be destroyed then recreated.
-    # As all the hard work has been done on list_record, create_record and delete_record, we use a
-    # combination of these three methods to obtain the state we want.
-    # Even if this make the operation very costly regarding the number of requests to do, it allows
-    # the implementation to be way more readable (without that, it would take grossly the size of
-    # he three quoted methods).
+    # The RecordSets fetched to find the record are reused to compute one Change, that removes
+    # the original content from its RecordSet and adds the new content to the target RecordSet.
     def _update_record(self, identifier, rtype=None, name=None, content=None):
         if not identifier and (not rtype or not name):
             raise Exception("Error, identifier or rtype+name parameters are required.")
 
         if identifier:
-            records = self._list_records()
+            rrsets = list(self._iter_rrsets())
             records_to_update = [
-                record for record in records if record["id"] == identifier
+                record
+                for record in self._rrsets_records(rrsets)
+                if record["id"] == identifier
             ]
         else:
-            records_to_update = self._list_records(rtype=rtype, name=name)
+            rrsets = list(self._iter_rrsets(rtype, name))
+            records_to_update = [
+                record
+                for record in self._rrsets_records(rrsets)
+                if record["type"] == rtype and record["name"] == self._full_name(name)
+            ]
 
         if not records_to_update:
             raise Exception(
@@ -325,26 +437,76 @@ class Provider(BaseProvider):
                 records_to_update,
             )
 
-        record_identifier = records_to_update[0]["id"]
-
-        original_level = LOGGER.getEffectiveLevel()
-        LOGGER.setLevel(logging.WARNING)
-        self._delete_record(record_identifier)
-
+        record = records_to_update[0]
         new_record = {
-            "type": rtype if rtype else records_to_update[0]["type"],
-            "name": name if name else records_to_update[0]["name"],
-            "content": content if content else records_to_update[0]["content"],
+            "type": rtype if rtype else record["type"],
+            "name": name if name else record["name"],
+            "content": content if content else record["content"],
         }
 
-        self._create_record(
-            new_record["type"], new_record["name"], new_record["content"]
+        changes = self._process_records_to_delete_by_parameters(
+            {"rrsets": rrsets}, record["type"], record["name"], record["content"]
+        )
+
+        # The target RecordSet, if it exists, is among the fetched ones: they are either
+        # all the RecordSets of the zone, or the ones of the unchanged type and name.
+        target_name = self._fqdn_name(new_record["name"])
+        target = next(
+            (
+                rrset
+                for rrset in rrsets
+                if rrset["type"] == new_record["type"] and rrset["name"] == target_name
+            ),
+            None,
+        )
+
+        original_rrset = (record["type"], self._fqdn_name(record["name"]))
+        rrdatas = []
+        if target is not None:
+            changes["additions"] = [
+                addition
+                for addition in changes["additions"]
+                if addition["type"] != target["type"]
+                or addition["name"] != target["name"]
+            ]
+            if (target["type"], target["name"]) == original_rrset:
+                rrdatas = [
+                    rrdata
+                    for rrdata in target["rrdatas"]
+                    if rrdata
+                    != Provider._normalize_content(record["type"], record["content"])
+                ]
+            else:
+                changes["deletions"].append(
+                    {
+                        "name": target["name"],
+                        "type": target["type"],
+                        "ttl": target["ttl"],
+                        "rrdatas": target["rrdatas"][:],
+                    }
+                )
+                rrdatas = target["rrdatas"][:]
+
+        new_rrdata = Provider._normalize_content(
+            new_record["type"], new_record["content"]
         )
-        LOGGER.setLevel(original_level)
+        if new_rrdata not in rrdatas:
+            rrdatas.append(new_rrdata)
+
+        changes["additions"].append(
+            {
+                "name": target_name,
+                "type": new_record["type"],
+                "ttl": self._get_lexicon_option("ttl"),
+                "rrdatas": rrdatas,
+            }
+        )
+
+        self._post("/managedZones/{0}/changes".format(self.domain_id), data=changes)
 
         LOGGER.debug(
             "update_record: %s => %s",
-            record_identifier,
+            record["id"],
             Provider._identifier(new_record),
         )
 
@@ -365,7 +527,10 @@ class Provider(BaseProvider):
     #   - do not mark as additions RecordSets whose rrdatas subset become empty:
     #     for this type/name pair, all RecordSet needs to go away.
     def _delete_record(self, identifier=None, rtype=None, name=None, content=None):
-        results = self._get("/managedZones/{0}/rrsets".format(self.domain_id))
+        if identifier:
+            results = {"rrsets": list(self._iter_rrsets())}
+        else:
+            results = {"rrsets": list(self._iter_rrsets(rtype, name))}
 
         if identifier:
             changes = self._process_records_to_delete_by_identifier(results, identifier)
@@ -500,7 +665,7 @@ class Provider(BaseProvider):
     #   - the body response is also encoded as application/json for GET and POST,
     #   - and the request headers must contain the access token in the 'Authorization' field.
     def _request(self, action="GET", url="/", data=None, query_params=None):
-        request = requests.request(
+        request = self._get_http_session().request(
             action,
             "https://content.googleapis.com/dns/v1/projects/{0}{1}".format(
                 self._service_account_info["project_id"], url
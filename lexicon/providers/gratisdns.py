@@ -3,7 +3,6 @@ from __future__ import absolute_import
 
 import logging
 
-import requests
 from bs4 import BeautifulSoup
 
 from lexicon.providers.base import Provider as BaseProvider
@@ -42,7 +41,9 @@ class Provider(BaseProvider):
             "password": self._get_provider_option("auth_password"),
         }
         # Cannot allow redirects, as we miss the cookie then
-        response = requests.post(self.api_endpoint, data=payload, allow_redirects=False)
+        response = self._get_http_session().post(
+            self.api_endpoint, data=payload, allow_redirects=False
+        )
         response.raise_for_status()
 
         if "ORGID" not in response.cookies:
@@ -279,7 +280,7 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -5,7 +5,6 @@ import logging
 import re
 
 from bs4 import BeautifulSoup
-from requests import Session
 
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -29,6 +28,10 @@ def provider_parser(subparser):
     )
 
 
+class _StaleZoneError(Exception):
+    """Raised if the zone page of a cached zone id has no records"""
+
+
 class Provider(BaseProvider):
     """
     he.net provider
@@ -42,7 +45,7 @@ class Provider(BaseProvider):
 
     def _authenticate(self):
         # Create the session GET the login page to retrieve a session cookie
-        self.session = Session()
+        self.session = self._get_http_session()
         self.session.get("https://dns.he.net/")
 
         # Hit the login page with authentication info to login the session
@@ -60,6 +63,10 @@ class Provider(BaseProvider):
             LOGGER.warning("HE login failed, check HE_USER and HE_PASS")
             return False
 
+        self.domain_id = self._get_cached_domain_id()
+        if self.domain_id:
+            return True
+
         # Make an authenticated GET to the DNS management page
         zones_response = self.session.get("https://dns.he.net")
 
@@ -73,6 +80,7 @@ class Provider(BaseProvider):
 
         self.domain_id = zone_img["value"]
         LOGGER.debug("HENET domain ID: %s", self.domain_id)
+        self._cache_domain_id(self.domain_id)
         return True
 
     # Create record. If record already exists with the same content, do nothing
@@ -82,6 +90,7 @@ class Provider(BaseProvider):
         records = self._list_records(rtype=rtype, name=name, content=content)
         if len(records) >= 1:
             LOGGER.warning("Duplicate record %s %s %s, NOOP", rtype, name, content)
+            self._keep_zone_snapshot()
             return True
         data = {
             "account": "",
@@ -108,8 +117,10 @@ class Provider(BaseProvider):
                 data["Priority"] = "10"
             else:
                 data["Priority"] = str(prio)
-        self.session.post("https://dns.he.net/index.cgi", data=data)
-        # Pull a list of records and check for ours
+        create_response = self.session.post("https://dns.he.net/index.cgi", data=data)
+        # The response is the zone page, updated with our record
+        self._set_zone_records(create_response)
+        # Check for our record
         records = self._list_records(name=name)
         if len(records) >= 1:
             LOGGER.info("Successfully added record %s", name)
@@ -127,29 +138,66 @@ class Provider(BaseProvider):
     def _list_records_internal(
         self, rtype=None, name=None, content=None, identifier=None
     ):
-        records = []
+        if name:
+            LOGGER.debug("Filtering records by name: %s", name)
+            name = self._full_name(name)
+        if rtype:
+            LOGGER.debug("Filtering records by rtype: %s", rtype)
+        records = self._get_zone_snapshot().find(rtype=rtype, name=name)
+        if identifier:
+            LOGGER.debug("Filtering %d records by id: %s", len(records), identifier)
+            records = [record for record in records if record["id"] == identifier]
+        if content:
+            LOGGER.debug(
+                "Filtering %d records by content: %s", len(records), content.lower()
+            )
+            records = [
+                record
+                for record in records
+                if record["content"].lower() == content.lower()
+            ]
+        LOGGER.debug("Final records (%d): %s", len(records), records)
+
+        return records
+
+    def _fetch_zone_records(self):
         # Make an authenticated GET to the DNS management page
         edit_response = self.session.get(
             "https://dns.he.net/?hosted_dns_zoneid={0}&menu=edit_zone&hosted_dns_editzone".format(
                 self.domain_id
             )
         )
+        records = self._parse_zone_records(edit_response)
+        if not records:
+            if self._domain_id_cached:
+                # A zone has at least its SOA and NS records
+                raise _StaleZoneError(
+                    "Zone {0} not found in account".format(self.domain_id)
+                )
+            LOGGER.warning("Domains not found in account")
+        return records
+
+    def _is_stale_domain_id_error(self, error):
+        return isinstance(error, _StaleZoneError)
+
+    def _set_zone_records(self, response):
+        # The DNS management UI answers to writes with the zone page: reuse its records
+        # instead of getting the zone page again.
+        records = self._parse_zone_records(response)
+        if records:
+            self._set_zone_snapshot(records)
+        else:
+            self._invalidate_zone_snapshot()
 
+    def _parse_zone_records(self, response):
         # Parse the HTML response, and list the table rows for DNS records
-        html = BeautifulSoup(edit_response.content, "html.parser")
+        html = BeautifulSoup(response.content, "html.parser")
 
         def is_dns_tr_type(klass):
             return klass and re.compile("dns_tr").search(klass)
 
-        records = html.findAll("tr", class_=is_dns_tr_type)
-
-        # If the tag couldn't be found, error, otherwise, return the value of the tag
-        if records is None or not records:
-            LOGGER.warning("Domains not found in account")
-            return records
-
-        new_records = []
-        for dns_tr in records:
+        records = []
+        for dns_tr in html.findAll("tr", class_=is_dns_tr_type):
             tds = dns_tr.findAll("td")
             # Process HTML in the TR children to derive each object
             rec = {}
@@ -161,34 +209,11 @@ class Provider(BaseProvider):
             rec["type"] = type_elem.string if type_elem else None
             rec["ttl"] = tds[4].string
             if tds[5].string != "-":
-                rec["priority"] = tds[5]
+                rec["priority"] = tds[5].string
             rec["content"] = tds[6].string
             rec["is_dynamic"] = tds[7].string == "1"
             rec = self._clean_TXT_record(rec)
-            new_records.append(rec)
-        records = new_records
-        if identifier:
-            LOGGER.debug("Filtering %d records by id: %s", len(records), identifier)
-            records = [record for record in records if record["id"] == identifier]
-        if rtype:
-            LOGGER.debug("Filtering %d records by rtype: %s", len(records), rtype)
-            records = [record for record in records if record["type"] == rtype]
-        if name:
-            LOGGER.debug("Filtering %d records by name: %s", len(records), name)
-            if name.endswith("."):
-                name = name[:-1]
-            records = [record for record in records if name in record["name"]]
-        if content:
-            LOGGER.debug(
-                "Filtering %d records by content: %s", len(records), content.lower()
-            )
-            records = [
-                record
-                for record in records
-                if record["content"].lower() == content.lower()
-            ]
-        LOGGER.debug("Final records (%d): %s", len(records), records)
-
+            records.append(rec)
         return records
 
     # Create or update a record.
@@ -207,6 +232,8 @@ class Provider(BaseProvider):
         else:
             delete_record_ids.append(identifier)
         LOGGER.debug("Record IDs to delete: %s", delete_record_ids)
+        if not delete_record_ids:
+            self._keep_zone_snapshot()
         for rec_id in delete_record_ids:
             # POST to the DNS management UI with form values to delete the record
             delete_response = self.session.post(
@@ -225,7 +252,9 @@ class Provider(BaseProvider):
             html = BeautifulSoup(delete_response.content, "html.parser")
             if html.find("div", {"id": "dns_status"}) is None:
                 LOGGER.warning("Unable to delete record %s", rec_id)
+                self._invalidate_zone_snapshot()
                 return False
+            self._set_zone_records(delete_response)
         return True
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
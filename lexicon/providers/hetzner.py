@@ -4,10 +4,13 @@ from __future__ import absolute_import, unicode_literals
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 LOGGER = logging.getLogger(__name__)
 NAMESERVER_DOMAINS = ["ns.hetzner.com"]
 
@@ -44,28 +47,10 @@ class Provider(BaseProvider):
         :rtype: str
         """
 
-        data = {
-            # hetzner needs the FQDN name if it does not belong to the managed domain itself
-            "name": self._get_record_name(self.domain, name),
-            "type": rtype,
-            "value": content,
-            "zone_id": self.domain_id,
-        }
-        if self._get_lexicon_option("ttl"):
-            data["ttl"] = self._get_lexicon_option("ttl")
-
         records = self._list_records(rtype=rtype, name=name, content=content)
-        if len(records) >= 1:
-            for record in records:
-                LOGGER.warning(
-                    "Duplicate record %s %s %s with id %s",
-                    rtype,
-                    name,
-                    content,
-                    record["id"],
-                )
+        if self._warn_duplicate_records(records, rtype, name, content):
             return True
-        self._post("/records", data)
+        self._post("/records", self._record_data(rtype, name, content))
         return True
 
     def _list_records(self, rtype=None, name=None, content=None):
@@ -74,8 +59,7 @@ class Provider(BaseProvider):
         :rtype: list
         :returns: list of records, might be empty
         """
-        filter_obj = {"per_page": 100, "zone_id": self.domain_id}
-        payload = self._get("/records", filter_obj)
+        payload = self._get("/records", self._list_records_filter())
         records = map(self._hetzner_record_to_lexicon_record, payload["records"])
         filtered_records = self._filter_records(
             records, rtype, name if name is not None else None, content
@@ -98,27 +82,11 @@ class Provider(BaseProvider):
         :rtype: bool
         :returns: Boolean indicating success
         """
-        data = {
-            "type": rtype,
-            "name": self._get_record_name(self.domain, name),
-            "value": content,
-            "zone_id": self.domain_id,
-        }
-        if self._get_lexicon_option("ttl"):
-            data["ttl"] = self._get_lexicon_option("ttl")
+        data = self._record_data(rtype, name, content)
         update_identifier = identifier
         if update_identifier is None:
             records = self._list_records(rtype, name)
-            if len(records) == 1:
-                update_identifier = records[0]["id"]
-            elif len(records) < 1:
-                raise Exception(
-                    "No records found matching type, name and content - won't update"
-                )
-            else:
-                raise Exception(
-                    "Multiple records found matching type, name and content - won't update"
-                )
+            update_identifier = self._unique_record_id(records)
         self._put("/records/{0}".format(update_identifier), data)
         return True
 
@@ -139,26 +107,132 @@ class Provider(BaseProvider):
             self._delete("/records/{0}".format(record_id))
         return True
 
+    # Native asynchronous implementations, mirroring the synchronous ones
+    def _has_native_async(self):
+        return aiohttp is not None
+
+    async def _async_authenticate(self):
+        payload = await self._async_get("/zones")
+        provider = self._find_zone(payload, self.domain)
+        self.domain_id = provider["id"]
+
+    async def _async_create_record(self, rtype, name, content):
+        records = await self._async_list_records(
+            rtype=rtype, name=name, content=content
+        )
+        if self._warn_duplicate_records(records, rtype, name, content):
+            return True
+        await self._async_post("/records", self._record_data(rtype, name, content))
+        return True
+
+    async def _async_list_records(self, rtype=None, name=None, content=None):
+        payload = await self._async_get("/records", self._list_records_filter())
+        records = map(self._hetzner_record_to_lexicon_record, payload["records"])
+        return self._filter_records(records, rtype, name, content)
+
+    async def _async_update_record(
+        self, identifier, rtype=None, name=None, content=None
+    ):
+        data = self._record_data(rtype, name, content)
+        update_identifier = identifier
+        if update_identifier is None:
+            records = await self._async_list_records(rtype, name)
+            update_identifier = self._unique_record_id(records)
+        await self._async_put("/records/{0}".format(update_identifier), data)
+        return True
+
+    async def _async_delete_record(
+        self, identifier=None, rtype=None, name=None, content=None
+    ):
+        delete_record_ids = []
+        if identifier is None:
+            records = await self._async_list_records(rtype, name, content)
+            delete_record_ids = [record["id"] for record in records]
+        else:
+            delete_record_ids.append(identifier)
+
+        for record_id in delete_record_ids:
+            await self._async_delete("/records/{0}".format(record_id))
+        return True
+
     # Helpers
     def _request(self, action="GET", url="/", data=None, query_params=None):
         if data is None:
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
             data=json.dumps(data),
-            headers={
-                "Auth-API-Token": self._get_provider_option("auth_token"),
-                "Content-Type": "application/json",
-            },
+            headers=self._request_headers(),
         )
         # if the request fails for any reason, throw an error.
         response.raise_for_status()
         return response.json()
 
+    async def _async_request(self, action="GET", url="/", data=None, query_params=None):
+        if data is None:
+            data = {}
+        if query_params is None:
+            query_params = {}
+        response = await self._async_http_request(
+            action,
+            self.api_endpoint + url,
+            params=query_params,
+            data=json.dumps(data),
+            headers=self._request_headers(),
+        )
+        # if the request fails for any reason, throw an error.
+        response.raise_for_status()
+        return response.json()
+
+    def _request_headers(self):
+        return {
+            "Auth-API-Token": self._get_provider_option("auth_token"),
+            "Content-Type": "application/json",
+        }
+
+    def _record_data(self, rtype, name, content):
+        data = {
+            # hetzner needs the FQDN name if it does not belong to the managed domain itself
+            "name": self._get_record_name(self.domain, name),
+            "type": rtype,
+            "value": content,
+            "zone_id": self.domain_id,
+        }
+        if self._get_lexicon_option("ttl"):
+            data["ttl"] = self._get_lexicon_option("ttl")
+        return data
+
+    def _list_records_filter(self):
+        return {"per_page": 100, "zone_id": self.domain_id}
+
+    @staticmethod
+    def _warn_duplicate_records(records, rtype, name, content):
+        for record in records:
+            LOGGER.warning(
+                "Duplicate record %s %s %s with id %s",
+                rtype,
+                name,
+                content,
+                record["id"],
+            )
+        return len(records) >= 1
+
+    @staticmethod
+    def _unique_record_id(records):
+        if len(records) == 1:
+            return records[0]["id"]
+        if len(records) < 1:
+            raise Exception(
+                "No records found matching type, name and content - won't update"
+            )
+        raise Exception(
+            "Multiple records found matching type, name and content - won't update"
+        )
+
     def _get_zone_by_domain(self, domain):
         """
         Requests all dns zones from your Hetzner account and searches for a specific
@@ -171,6 +245,10 @@ class Provider(BaseProvider):
         :raises urllib.error.HttpError: If request to /zones did not return 200
         """
         payload = self._get("/zones")
+        return self._find_zone(payload, domain)
+
+    @staticmethod
+    def _find_zone(payload, domain):
         zones = payload["zones"]
         for zone in zones:
             if zone["name"] == domain:
@@ -5,14 +5,16 @@ import json
 import logging
 import time
 
-import requests
-
+from lexicon import changeset
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = ["hosting.de"]
 
+# Deleted records are looked for again after this delay, doubled after each listing
+DELETE_POLL_INITIAL_INTERVAL = 0.5
+
 # be aware to provide an auth_token
 # LEXICON_HOSTINGDE_AUTH_TOKEN
 
@@ -20,16 +22,47 @@ NAMESERVER_DOMAINS = ["hosting.de"]
 def provider_parser(subparser):
     """Return the parser for this provider"""
     subparser.add_argument("--auth-token", help="specify api key for authentication")
+    subparser.add_argument(
+        "--delete-timeout",
+        type=float,
+        default=30,
+        help="maximum number of seconds to wait for deleted records to disappear",
+    )
+
+
+def _response_data(response_json):
+    # check if there a data object, and if not, if there a records object
+    read_data = response_json.get("response", {}).get("data", None)
+    if read_data is None:
+        read_data = response_json.get("response", {}).get("records", None)
+    return read_data or []
 
 
 class Provider(BaseProvider):
     """Provider class for Hosting"""
 
+    # While the API is still busy with a previous request, it answers that the zone is
+    # blocked: the request is then retried every second or so, up to 30 times.
+    HTTP_MAX_RETRIES = 30
+    HTTP_BACKOFF_MAX = 2
+
     def __init__(self, config):
         super(Provider, self).__init__(config)
         self.domain_id = None
         self.api_endpoint = "https://secure.hosting.de/api/dns/v1/json"
 
+    def _is_retryable_response(self, response):
+        if response.ok:
+            try:
+                response_json = response.json()
+            except ValueError:
+                return False
+            return (
+                response_json.get("status") == "error"
+                and response_json.get("errors")[0].get("value", "") == "blocked"
+            )
+        return super(Provider, self)._is_retryable_response(response)
+
     def _authenticate(self):
 
         response = self._get_zone_config()
@@ -126,6 +159,41 @@ class Provider(BaseProvider):
         self._request(action="POST", url="/zoneUpdate", data=data)
         return True
 
+    def _has_native_changes(self):
+        return True
+
+    # Apply all the changes with one zone update, as records to add and to delete.
+    def _apply_changes(self, changes):
+        records = changeset.touched_records(changes, self._list_records)
+        final_records, results = changeset.plan(records, changes, self._full_name)
+        additions, deletions = changeset.diff(records, final_records)
+
+        if additions or deletions:
+            priority = self._get_lexicon_option("priority")
+            ttl = self._get_lexicon_option("ttl")
+            records_to_add = []
+            for record in additions:
+                record_to_add = {
+                    "name": record["name"],
+                    "type": record["type"],
+                    "content": record["content"],
+                }
+                if ttl:
+                    record_to_add["ttl"] = max(int(ttl), 60)
+                if priority:
+                    record_to_add["priority"] = int(priority)
+                records_to_add.append(record_to_add)
+
+            data = {
+                "zoneConfig": self._get_zone_config(),
+                "recordsToAdd": records_to_add,
+                "recordsToDelete": [{"id": record["id"]} for record in deletions],
+            }
+            LOGGER.debug("apply_changes: %s", data)
+            self._request(action="POST", url="/zoneUpdate", data=data)
+
+        return results
+
     # Normal Behaviour Update a record. Record to be updated can be specified by providing id OR
     # name, type and content. Return a boolean
     # True if successful.
@@ -152,7 +220,8 @@ class Provider(BaseProvider):
         new_name = name if name else orig_record["name"]
         new_content = content if content else orig_record["content"]
 
-        self._delete_record(orig_id)
+        # the type and name restrict the listings verifying the deletion
+        self._delete_record(orig_id, orig_record["type"], orig_record["name"])
         return self._create_record(new_rtype, new_name, new_content)
 
     # Normal Behaviour Remove a record. Record to be deleted can be
@@ -177,80 +246,66 @@ class Provider(BaseProvider):
 
         self._request(action="POST", url="/zoneUpdate", data=data)
 
-        # sometimes it takes some time to delete a record
-        # so, here check after deleting and loop
-        # if record(s) is not deleted after 30 seconds > False
-        retries = 30
-        for record_id in delete_record_ids:
-            while True:
-                if self._list_records(record_id):
-                    if retries < 1:
-                        break
-                    retries = retries - 1
-                    time.sleep(1)
-                else:
-                    break
-
-        LOGGER.debug("delete_records: %s", retries > 0)
-        return retries > 0
+        # sometimes it takes some time to delete a record: the records are listed
+        # again, with an exponential backoff, until none of them remains or the
+        # deletion timeout is reached
+        pending_ids = set(delete_record_ids)
+        deadline = time.monotonic() + self._get_delete_timeout()
+        interval = DELETE_POLL_INITIAL_INTERVAL
+        while pending_ids:
+            pending_ids &= {record["id"] for record in self._list_records(rtype, name)}
+            remaining = deadline - time.monotonic()
+            if not pending_ids or remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = interval * 2
+
+        if pending_ids:
+            LOGGER.warning("records not deleted yet: %s", sorted(pending_ids))
+        LOGGER.debug("delete_records: %s", not pending_ids)
+        return not pending_ids
+
+    def _get_delete_timeout(self):
+        delete_timeout = self._get_provider_option("delete_timeout")
+        return float(delete_timeout) if delete_timeout is not None else 30
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
-        if data is None:
-            data = {}
-        data.update({"authToken": self._get_provider_option("auth_token")})
-
-        read_page = 1
-        return_data = []
-        retries = 30
-
-        # in some situatons, API uses pagination
-        # here we check and if there is pagination, go through all pages
-        while True:
-            page_data = data
-            page_data.update({"page": read_page})
-
-            response = requests.request(
-                action,
-                self.api_endpoint + url,
-                params=query_params,
-                data=json.dumps(page_data),
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            response_json = response.json()  # Work with json Object
-            LOGGER.debug("_request response: %s", response_json)
-            status = response_json.get("status", "*** no status available ***")
-            # if API still busy just wait and retry
-            if (
-                status == "error"
-                and response_json.get("errors")[0].get("value", "") == "blocked"
+        payload = dict(data) if data else {}
+        payload["authToken"] = self._get_provider_option("auth_token")
+
+        # in some situatons, API uses pagination: only the find requests are paginated,
+        # and the following pages are requested with the same filter, concurrently
+        paginated = url.endswith("Find")
+        if paginated:
+            payload["page"] = 1
+
+        response_json = self._request_page(action, url, payload, query_params)
+        return_data = list(_response_data(response_json))
+
+        total_pages = response_json.get("response", {}).get("totalPages", 0)
+        if paginated and total_pages > 1:
+            for page_json in self._fetch_pages(
+                lambda page: self._request_page(
+                    action, url, dict(payload, page=page), query_params
+                ),
+                range(2, total_pages + 1),
             ):
-                if retries < 1:
-                    raise Exception(
-                        "Api error: {0}".format(response_json.get("errors"))
-                    )
-                retries = retries - 1
-                time.sleep(1)
-                continue
-
-            if status not in ("success", "pending"):
-                raise Exception("Api error: {0}".format(response_json.get("errors")))
-            # check if there a data object
-            read_data = response_json.get("response", {}).get("data", None)
-
-            # if no data object, check if there a records object
-            if read_data is None:
-                read_data = response_json.get("response", {}).get("records", None)
-
-            # add response data to return data
-            if read_data:
-                return_data += read_data
-
-            # is there pagination and more data available?
-            total_pages = response_json.get("response", {}).get("totalPages", 0)
-            if total_pages in (read_page, 0):
-                break  # no more data
-
-            read_page = read_page + 1
+                return_data += _response_data(page_json)
 
         return return_data
+
+    def _request_page(self, action, url, payload, query_params):
+        response = self._get_http_session().request(
+            action,
+            self.api_endpoint + url,
+            params=query_params,
+            data=json.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        response_json = response.json()  # Work with json Object
+        LOGGER.debug("_request response: %s", response_json)
+        status = response_json.get("status", "*** no status available ***")
+        if status not in ("success", "pending"):
+            raise Exception("Api error: {0}".format(response_json.get("errors")))
+        return response_json
@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -34,14 +32,14 @@ class Provider(BaseProvider):
 
     def _authenticate(self):
         # Getting required cookies "hover_session" and "hoverauth"
-        response = requests.get("https://www.hover.com/signin")
+        response = self._get_http_session().get("https://www.hover.com/signin")
         self.cookies["hover_session"] = response.cookies["hover_session"]
 
         payload = {
             "username": self._get_provider_option("auth_username"),
             "password": self._get_provider_option("auth_password"),
         }
-        response = requests.post(
+        response = self._get_http_session().post(
             "https://www.hover.com/signin/auth.json", json=payload, cookies=self.cookies
         )
         response.raise_for_status()
@@ -178,7 +176,7 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
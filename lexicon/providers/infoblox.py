@@ -19,8 +19,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -73,7 +71,7 @@ class Provider(BaseProvider):
         self.domain_id = None
         self.version_id = None
         self.view = self._get_provider_option("ib_view")
-        self.session = requests.session()
+        self.session = self._get_http_session()
         self.session.auth = (
             self._get_provider_option("auth_user"),
             self._get_provider_option("auth_psw"),
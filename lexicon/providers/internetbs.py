@@ -18,8 +18,6 @@ import hashlib
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -195,7 +193,7 @@ class Provider(BaseProvider):
         query_params["ResponseFormat"] = "json"
         query_params["ApiKey"] = self._get_provider_option("auth_key")
         query_params["Password"] = self._get_provider_option("auth_password")
-        request = requests.request(
+        request = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -144,7 +142,7 @@ class Provider(BaseProvider):
         query_params["resultFormat"] = "JSON"
         query_params["api_action"] = url
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint,
             params=query_params,
@@ -4,14 +4,15 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = ["linode.com"]
 
+# Maximum number of records per page accepted by the API
+LIST_RECORDS_PAGE_SIZE = 500
+
 
 def provider_parser(subparser):
     """Configure provider parser for Linode V4"""
@@ -50,20 +51,37 @@ class Provider(BaseProvider):
 
     # List all records. Return an empty list if no records found
     # type, name and content are used to filter records.
-    # If possible filter during the query, otherwise filter after response is received.
+    # Filters are sent to the API through the X-Filter header, and applied again after the
+    # response is received. Pages following the first one are fetched concurrently.
     def _list_records(self, rtype=None, name=None, content=None):
         resources_url = "domains/{0}/records".format(self.domain_id)
 
         if name:
             name = self._relative_name(name).lower()
 
-        processed_records = []
+        request_filter = {}
+        if rtype:
+            request_filter["type"] = rtype
+        if name:
+            request_filter["name"] = name
+        if content:
+            request_filter["target"] = content
 
-        payload = self._get(resources_url)
-        for page in range(1, payload["pages"] + 1, 1):
+        def fetch_page(page):
+            query_params = {"page_size": LIST_RECORDS_PAGE_SIZE}
             if page > 1:
-                payload = self._get(resources_url, query_params={"page": page})
+                query_params["page"] = page
+            if request_filter:
+                query_params["filter"] = request_filter
+            return self._get(resources_url, query_params=query_params)
+
+        payload = fetch_page(1)
+        payloads = [payload] + self._fetch_pages(
+            fetch_page, range(2, payload["pages"] + 1)
+        )
 
+        processed_records = []
+        for payload in payloads:
             resource_list = payload["data"]
             if rtype:
                 resource_list = [
@@ -157,7 +175,7 @@ class Provider(BaseProvider):
 
         request_url = "{0}{1}".format(self.api_endpoint, url)
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             request_url,
             params=query_params,
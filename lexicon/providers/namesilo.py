@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import logging
 from xml.etree import ElementTree
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -131,7 +129,7 @@ class Provider(BaseProvider):
         query_params["version"] = 1
         query_params["type"] = "xml"
         query_params["key"] = self._get_provider_option("auth_token")
-        response = requests.request(
+        response = self._get_http_session().request(
             action, self.api_endpoint + url, params=query_params
         )
         # data=json.dumps(data))
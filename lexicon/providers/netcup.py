@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -180,7 +178,7 @@ class Provider(BaseProvider):
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             data=json.dumps(data),
@@ -12,7 +12,6 @@ try:
 except ImportError:
     from urllib import urlencode
 
-import requests
 
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -171,7 +170,7 @@ class Provider(BaseProvider):
         )
         auth_header = {"X-NFSN-Authentication": auth_value}
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action, "".join([self.api_endpoint, url]), data=data, headers=auth_header
         )
         response.raise_for_status()
@@ -260,7 +260,7 @@ class Provider(BaseProvider):
         }
         default_auth = None
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
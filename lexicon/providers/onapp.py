@@ -44,7 +44,7 @@ class Provider(BaseProvider):
         if not self._get_provider_option("auth_server"):
             raise Exception("Error, OnApp Control Panel URL is not defined")
 
-        self.session = requests.Session()
+        self.session = self._get_http_session()
 
     def _authenticate(self):
         domain = self.domain
@@ -5,9 +5,11 @@ import hashlib
 import json
 import logging
 import time
+from contextlib import contextmanager
 
 import requests
 
+from lexicon import cache
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -24,6 +26,11 @@ ENDPOINTS = {
 
 NAMESERVER_DOMAINS = ["ovh.net", "anycast.me"]
 
+# Delta between the local clock and the OVH one is stored in this cache file, keyed by
+# API endpoint, for TIME_DELTA_CACHE_TTL seconds
+TIME_DELTAS_CACHE = "ovh_time_deltas"
+TIME_DELTA_CACHE_TTL = 300
+
 
 def provider_parser(subparser):
     """Generate provider parser for OVH"""
@@ -48,6 +55,12 @@ def provider_parser(subparser):
         "--auth-application-secret", help="specify the application secret"
     )
     subparser.add_argument("--auth-consumer-key", help="specify the consumer key")
+    subparser.add_argument(
+        "--deferred-refresh",
+        action="store_true",
+        help="refresh the zone only once, when the provider is closed (eg. at the end "
+        "of a batch), instead of after each record change",
+    )
 
 
 class Provider(BaseProvider):
@@ -71,14 +84,19 @@ class Provider(BaseProvider):
         self.endpoint_api = ENDPOINTS.get(self._get_provider_option("auth_entrypoint"))
         self.session = None
         self.time_delta = None
+        self._refresh_deferred = (
+            str(self._get_provider_option("deferred_refresh")).lower() == "true"
+        )
+        self._refresh_pending = False
 
     def _authenticate(self):
         # All requests will be done in one HTTPS session
-        self.session = requests.Session()
+        self.session = self._get_http_session()
 
         # Calculate delta time between local and OVH to avoid requests rejection
-        server_time = self.session.get("{0}/auth/time".format(self.endpoint_api)).json()
-        self.time_delta = server_time - int(time.time())
+        self.time_delta = cache.get_entry(TIME_DELTAS_CACHE, self.endpoint_api)
+        if self.time_delta is None:
+            self._sync_time_delta()
 
         # Get domain and status
         domain = self.domain
@@ -119,7 +137,7 @@ class Provider(BaseProvider):
             data["ttl"] = ttl
 
         result = self._post("/domain/zone/{0}/record".format(domain), data)
-        self._post("/domain/zone/{0}/refresh".format(domain))
+        self._refresh_zone()
 
         LOGGER.debug("create_record: %s", result["id"])
 
@@ -179,7 +197,7 @@ class Provider(BaseProvider):
             data["target"] = content
 
         self._put("/domain/zone/{0}/record/{1}".format(domain, identifier), data)
-        self._post("/domain/zone/{0}/refresh".format(domain))
+        self._refresh_zone()
 
         LOGGER.debug("update_record: %s", identifier)
 
@@ -200,13 +218,75 @@ class Provider(BaseProvider):
         for record_id in delete_record_id:
             self._delete("/domain/zone/{0}/record/{1}".format(domain, record_id))
 
-        self._post("/domain/zone/{0}/refresh".format(domain))
+        self._refresh_zone()
 
         LOGGER.debug("delete_record: %s", True)
 
         return True
 
+    def apply_changes(self, changes):
+        """
+        Apply the changes one by one, like providers without bulk API, but refresh
+        the zone only once they are all applied.
+        """
+        with self._deferring_refresh():
+            return super(Provider, self).apply_changes(changes)
+
+    def close(self):
+        # With deferred refresh, the zone is refreshed once for all the changes.
+        if self._refresh_pending:
+            self._flush_refresh()
+        super(Provider, self).close()
+
+    # Helpers
+
+    # Each refresh triggers a reload of the whole zone by OVH: while refresh is
+    # deferred, changes only mark the zone to be refreshed by _flush_refresh().
+    def _refresh_zone(self):
+        if self._refresh_deferred:
+            self._refresh_pending = True
+        else:
+            self._post("/domain/zone/{0}/refresh".format(self.domain))
+
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._post("/domain/zone/{0}/refresh".format(self.domain))
+
+    @contextmanager
+    def _deferring_refresh(self):
+        deferred = self._refresh_deferred
+        self._refresh_deferred = True
+        try:
+            yield
+        finally:
+            self._refresh_deferred = deferred
+            if self._refresh_pending and not deferred:
+                self._flush_refresh()
+
+    def _sync_time_delta(self):
+        server_time = self.session.get("{0}/auth/time".format(self.endpoint_api)).json()
+        self.time_delta = server_time - int(time.time())
+        cache.set_entry(
+            TIME_DELTAS_CACHE,
+            self.endpoint_api,
+            self.time_delta,
+            time.time() + TIME_DELTA_CACHE_TTL,
+        )
+
     def _request(self, action="GET", url="/", data=None, query_params=None):
+        result = self._signed_request(action, url, data, query_params)
+        if _is_time_rejection(result):
+            # Cached delta time may be obsolete (eg. after a clock correction): it is
+            # computed again, and the request is sent once more.
+            LOGGER.info("Request rejected by OVH, synchronizing time again")
+            cache.delete_entry(TIME_DELTAS_CACHE, self.endpoint_api)
+            self._sync_time_delta()
+            result = self._signed_request(action, url, data, query_params)
+        result.raise_for_status()
+
+        return result.json()
+
+    def _signed_request(self, action, url, data, query_params):
         headers = {}
         target = self.endpoint_api + url
         body = ""
@@ -245,9 +325,17 @@ class Provider(BaseProvider):
         # Sign the request
         headers["X-Ovh-Signature"] = "$1$" + signature.hexdigest()
 
-        result = self.session.request(
+        return self.session.request(
             method=action, url=target, params=query_params, data=body, headers=headers
         )
-        result.raise_for_status()
 
-        return result.json()
+
+def _is_time_rejection(response):
+    """Check if OVH rejected the request because of its timestamp or its signature"""
+    if response.status_code not in (400, 401, 403):
+        return False
+    try:
+        message = str(response.json().get("message", ""))
+    except (AttributeError, ValueError):
+        return False
+    return "time" in message.lower() or "signature" in message.lower()
@@ -10,8 +10,6 @@ from __future__ import absolute_import
 import logging
 from collections import OrderedDict
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 try:
@@ -96,7 +94,7 @@ class Provider(BaseProvider):
 
         LOGGER.debug("Request: %s", xml)
 
-        response = requests.post(
+        response = self._get_http_session().post(
             self.api_endpoint,
             headers=headers,
             data=xml,
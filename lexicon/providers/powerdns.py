@@ -25,8 +25,7 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
+from lexicon import changeset
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -229,6 +228,47 @@ class Provider(BaseProvider):
         self._zone_data = None
         return True
 
+    def _has_native_changes(self):
+        return True
+
+    def _apply_changes(self, changes):
+        records = changeset.touched_records(changes, self._list_records)
+        final_records, results = changeset.plan(records, changes, self._full_name)
+
+        rrsets = []
+        for rtype, name, before, after in changeset.changed_rrsets(
+            records, final_records
+        ):
+            rrset = {"name": self._fqdn_name(name), "type": rtype}
+            if after:
+                rrset["changetype"] = "REPLACE"
+                rrset["ttl"] = (
+                    before[0]["ttl"]
+                    if before
+                    else self._get_lexicon_option("ttl") or 600
+                )
+                rrset["records"] = [
+                    {
+                        "content": self._clean_content(rtype, record["content"]),
+                        "disabled": False,
+                    }
+                    for record in after
+                ]
+            else:
+                rrset["changetype"] = "DELETE"
+                rrset["records"] = []
+            rrsets.append(rrset)
+
+        if rrsets:
+            request = {"rrsets": rrsets}
+            LOGGER.debug("request: %s", request)
+
+            self._patch("/zones/" + self._ensure_dot(self.domain), data=request)
+            self.notify_slaves()
+
+            self._zone_data = None
+        return results
+
     def _update_record(self, identifier, rtype=None, name=None, content=None):
         self._delete_record(identifier)
         return self._create_record(rtype, name, content)
@@ -241,7 +281,7 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -5,14 +5,19 @@ import json
 import logging
 import time
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = ["rackspacecloud.com"]
 
+# Asynchronous jobs are polled first after this delay, doubled after each poll up to the
+# --sleep-time option
+POLL_INITIAL_INTERVAL = 0.1
+
+# Maximum number of records deleted by one request to the bulk deletion endpoint
+DELETE_RECORDS_BATCH_SIZE = 100
+
 
 def _async_request_completed(payload):
     """Looks into an async response payload to see if the requested job has finished."""
@@ -23,6 +28,14 @@ def _async_request_completed(payload):
     return False
 
 
+def _poll_intervals(max_interval):
+    """Yields the delays between the polls of an async job, growing exponentially."""
+    interval = min(POLL_INITIAL_INTERVAL, max_interval)
+    while True:
+        yield interval
+        interval = min(interval * 2, max_interval)
+
+
 def provider_parser(subparser):
     """Configure provider parser for Rackspace"""
     subparser.add_argument(
@@ -47,7 +60,10 @@ def provider_parser(subparser):
         "--sleep-time",
         type=float,
         default=1,
-        help="number of seconds to wait between update requests.",
+        help=(
+            "maximum number of seconds to wait between update requests. "
+            "Update requests start after 0.1 seconds and back off exponentially."
+        ),
     )
 
 
@@ -89,6 +105,10 @@ class Provider(BaseProvider):
             self._auth_token = auth_response["access"]["token"]["id"]
             self._auth_account = auth_response["access"]["token"]["tenant"]["id"]
 
+        self.domain_id = self._get_cached_domain_id()
+        if self.domain_id:
+            return
+
         payload = self._get("/domains", {"name": self.domain})
 
         if not payload["domains"]:
@@ -97,6 +117,7 @@ class Provider(BaseProvider):
             raise Exception("Too many domains found. This should not happen")
 
         self.domain_id = payload["domains"][0]["id"]
+        self._cache_domain_id(self.domain_id)
 
     # Create record. If record already exists with the same content, do nothing'
 
@@ -190,10 +211,26 @@ class Provider(BaseProvider):
 
         LOGGER.debug("delete_records: %s", delete_record_id)
 
-        for record_id in delete_record_id:
-            self._delete_and_wait(
-                "/domains/{0}/records/{1}".format(self.domain_id, record_id)
-            )
+        # Records are deleted in bulk, and the jobs of all batches are tracked together
+        jobs = []
+        for index in range(0, len(delete_record_id), DELETE_RECORDS_BATCH_SIZE):
+            batch = delete_record_id[index : index + DELETE_RECORDS_BATCH_SIZE]
+            if len(batch) == 1:
+                jobs.append(
+                    self._request(
+                        "DELETE",
+                        "/domains/{0}/records/{1}".format(self.domain_id, batch[0]),
+                    )
+                )
+            else:
+                jobs.append(
+                    self._request(
+                        "DELETE",
+                        "/domains/{0}/records".format(self.domain_id),
+                        query_params={"id": batch},
+                    )
+                )
+        self._wait_for_jobs(jobs)
 
         # If it didn't raise from the http status code, then we're good
         success = True
@@ -213,7 +250,7 @@ class Provider(BaseProvider):
         full_url = (self.api_endpoint + "/{0}" + url).format(
             self._get_rackspace_option("auth_account")
         )
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             full_url,
             params=query_params,
@@ -229,22 +266,36 @@ class Provider(BaseProvider):
 
     # Non-GET requests to the Rackspace CloudDNS API are asynchronous
     def _request_and_wait(self, action="POST", url="/", data=None, query_params=None):
-        result = self._request(action, url, data, query_params)
+        return self._wait_for_jobs([self._request(action, url, data, query_params)])[0]
 
+    # Polls the given async jobs until they are all finished, the jobs still running being
+    # updated concurrently. Returns their responses, in the same order.
+    def _wait_for_jobs(self, jobs):
         sleep_time = self._get_rackspace_option("sleep_time") or "1"
-        sleep_time = float(sleep_time)
+        intervals = _poll_intervals(float(sleep_time))
 
-        while not _async_request_completed(result):
-            if sleep_time:
-                time.sleep(sleep_time)
-            result = self._update_response(result)
+        jobs = list(jobs)
+        pending = [
+            index for index, job in enumerate(jobs) if not _async_request_completed(job)
+        ]
+        while pending:
+            interval = next(intervals)
+            if interval:
+                time.sleep(interval)
+            updates = self._fetch_pages(
+                self._update_response, [jobs[index] for index in pending]
+            )
+            for index, update in zip(pending, updates):
+                jobs[index] = update
+            pending = [
+                index for index in pending if not _async_request_completed(jobs[index])
+            ]
 
-        if result["status"] == "ERROR":
-            raise Exception(result["error"]["details"])
+        for job in jobs:
+            if job["status"] == "ERROR":
+                raise Exception(job["error"]["details"])
 
-        if "response" in result:
-            return result["response"]
-        return None
+        return [job.get("response") for job in jobs]
 
     def _post_and_wait(self, url="/", data=None, query_params=None):
         return self._request_and_wait("POST", url, data, query_params)
@@ -256,7 +307,7 @@ class Provider(BaseProvider):
         return self._request_and_wait("DELETE", url, data, query_params)
 
     def _update_response(self, payload):
-        response = requests.request(
+        response = self._get_http_session().request(
             "GET",
             payload["callbackUrl"],
             params={"showDetails": "true"},
@@ -275,7 +326,7 @@ class Provider(BaseProvider):
         if data is None:
             data = {}
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.auth_api_endpoint + url,
             params=query_params,
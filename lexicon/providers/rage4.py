@@ -148,7 +148,7 @@ class Provider(BaseProvider):
             self._get_provider_option("auth_token"),
         )
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
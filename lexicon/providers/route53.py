@@ -4,7 +4,9 @@ from __future__ import absolute_import
 import hashlib
 import logging
 import re
+import threading
 
+from lexicon import changeset
 from lexicon.providers.base import Provider as BaseProvider
 
 try:
@@ -17,6 +19,11 @@ LOGGER = logging.getLogger(__name__)
 
 NAMESERVER_DOMAINS = [re.compile(r"^awsdns-\d+\.\w+$")]
 
+# Clients are thread-safe and costly to create: they are reused by the providers
+# using the same credentials.
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
 
 def provider_parser(subparser):
     """Specify arguments for AWS Route 53 Lexicon Provider."""
@@ -67,23 +74,18 @@ class RecordSetPaginator(object):
             kwargs.update({"MaxItems": str(self.max_items)})
         return kwargs
 
-    def all_record_sets(self):
+    def all_record_sets(self, start_record_name=None, start_record_type=None):
         """Generator to loop through current record set.
 
-        Call next page if it exists.
+        Start from the given record name and type if any, call next page if it exists.
         """
         is_truncated = True
-        start_record_name = None
-        start_record_type = None
         kwargs = self.get_base_kwargs()
         while is_truncated:
             if start_record_name is not None:
-                kwargs.update(
-                    {
-                        "StartRecordName": start_record_name,
-                        "StartRecordType": start_record_type,
-                    }
-                )
+                kwargs.update({"StartRecordName": start_record_name})
+            if start_record_type is not None:
+                kwargs.update({"StartRecordType": start_record_type})
             result = self.get_record_sets(**kwargs)
             for record_set in result.get("ResourceRecordSets", []):
                 yield record_set
@@ -102,12 +104,12 @@ class Provider(BaseProvider):
         super(Provider, self).__init__(config)
         self.domain_id = None
         self.private_zone = self._get_provider_option("private_zone")
-        # instantiate the client
-        self.r53_client = boto3.client(
-            "route53",
-            aws_access_key_id=self._get_provider_option("auth_access_key")
-            or self._get_provider_option("auth_username"),
-            aws_secret_access_key=self._get_provider_option("auth_access_secret")
+        self.access_key = self._get_provider_option(
+            "auth_access_key"
+        ) or self._get_provider_option("auth_username")
+        self.r53_client = _get_client(
+            self.access_key,
+            self._get_provider_option("auth_access_secret")
             or self._get_provider_option("auth_token"),
         )
 
@@ -129,23 +131,44 @@ class Provider(BaseProvider):
 
     def _authenticate(self):
         """Determine the hosted zone id for the domain."""
+        self.domain_id = self._get_cached_domain_id()
+        if self.domain_id:
+            return
         try:
             hosted_zones = self.r53_client.list_hosted_zones_by_name()["HostedZones"]
             hosted_zone = next(hz for hz in hosted_zones if self.filter_zone(hz))
             self.domain_id = hosted_zone["Id"]
         except StopIteration:
             raise Exception("No domain found")
+        self._cache_domain_id(self.domain_id)
+
+    def _domain_id_key(self):
+        """Private and public hosted zones of a domain have different ids."""
+        return "{0}:{1}".format(
+            super(Provider, self)._domain_id_key(), self.private_zone or ""
+        )
+
+    def _account_fingerprint(self):
+        """
+        Without explicit credentials, boto3 resolves them from the environment, a profile
+        or an instance role: the account is then identified by the resolved access key.
+        """
+        if self.access_key:
+            return super(Provider, self)._account_fingerprint()
+        credentials = boto3.session.Session().get_credentials()
+        access_key = credentials.access_key if credentials else ""
+        return hashlib.sha256(
+            "ambient:{0}".format(access_key).encode("utf-8")
+        ).hexdigest()
+
+    def _is_stale_domain_id_error(self, error):
+        """Check if the hosted zone does not exist anymore."""
+        return (
+            isinstance(error, botocore.exceptions.ClientError)
+            and error.response["Error"]["Code"] == "NoSuchHostedZone"
+        )
 
     def _change_record_sets(self, action, rtype, name, content):
-        ttl = self._get_lexicon_option("ttl")
-        resource_records = []
-        if isinstance(content, list):
-            for i in content:
-                value = '"{0}"'.format(i) if rtype in ["TXT", "SPF"] else i
-                resource_records.append({"Value": value})
-        else:
-            value = '"{0}"'.format(content) if rtype in ["TXT", "SPF"] else content
-            resource_records.append({"Value": value})
         try:
             self.r53_client.change_resource_record_sets(
                 HostedZoneId=self.domain_id,
@@ -154,12 +177,9 @@ class Provider(BaseProvider):
                     "Changes": [
                         {
                             "Action": action,
-                            "ResourceRecordSet": {
-                                "Name": self._fqdn_name(name),
-                                "Type": rtype,
-                                "TTL": ttl if ttl is not None else 300,
-                                "ResourceRecords": resource_records,
-                            },
+                            "ResourceRecordSet": self._resource_record_set(
+                                rtype, name, content
+                            ),
                         }
                     ],
                 },
@@ -172,6 +192,67 @@ class Provider(BaseProvider):
             LOGGER.error(str(error), exc_info=True)
             return False
 
+    def _resource_record_set(self, rtype, name, content, ttl=None):
+        if ttl is None:
+            ttl = self._get_lexicon_option("ttl")
+        resource_records = []
+        if isinstance(content, list):
+            for i in content:
+                value = '"{0}"'.format(i) if rtype in ["TXT", "SPF"] else i
+                resource_records.append({"Value": value})
+        else:
+            value = '"{0}"'.format(content) if rtype in ["TXT", "SPF"] else content
+            resource_records.append({"Value": value})
+        return {
+            "Name": self._fqdn_name(name),
+            "Type": rtype,
+            "TTL": ttl if ttl is not None else 300,
+            "ResourceRecords": resource_records,
+        }
+
+    def _has_native_changes(self):
+        return True
+
+    def _apply_changes(self, changes):
+        """Apply all the changes with one ChangeBatch."""
+        records = changeset.touched_records(changes, self._list_flat_records)
+        final_records, results = changeset.plan(records, changes, self._full_name)
+
+        batch = []
+        for rtype, name, before, after in changeset.changed_rrsets(
+            records, final_records
+        ):
+            if any(record.get("alias_target") for record in before):
+                raise ValueError(
+                    "Alias record set {0} {1} cannot be changed with a change "
+                    "set".format(rtype, name)
+                )
+            # Existing record sets keep their TTL, deletion requiring the current one
+            ttl = before[0].get("ttl") if before else None
+            if after:
+                action = "UPSERT"
+                record_set = self._resource_record_set(
+                    rtype, name, [record["content"] for record in after], ttl
+                )
+            else:
+                action = "DELETE"
+                record_set = self._resource_record_set(
+                    rtype, name, [record["content"] for record in before], ttl
+                )
+            batch.append({"Action": action, "ResourceRecordSet": record_set})
+
+        if batch:
+            self.r53_client.change_resource_record_sets(
+                HostedZoneId=self.domain_id,
+                ChangeBatch={
+                    "Comment": "{0} changes using lexicon Route 53 provider".format(
+                        len(changes)
+                    ),
+                    "Changes": batch,
+                },
+            )
+        return results
+
     def _create_record(self, rtype, name, content):
         """Create a record in the hosted zone."""
         existing_records = self._list_record_sets(rtype, name)
@@ -272,6 +353,13 @@ class Provider(BaseProvider):
 
     def _list_records(self, rtype=None, name=None, content=None):
         """List all records for the hosted zone."""
+        records = self._list_flat_records(rtype, name, content)
+        for record in records:
+            record.pop("alias_target", None)
+        return records
+
+    def _list_flat_records(self, rtype=None, name=None, content=None):
+        """List records with one value each, alias records keeping their AliasTarget."""
         records = self._list_record_sets(rtype, name, content)
 
         flatten_records = []
@@ -293,7 +381,17 @@ class Provider(BaseProvider):
     def _list_record_sets(self, rtype=None, name=None, content=None):
         records = []
         paginator = RecordSetPaginator(self.r53_client, self.domain_id)
-        for record in paginator.all_record_sets():
+        if name is not None:
+            # Record sets are sorted by name, so the lookup of a name starts at this name
+            # (and type), and ends once record sets of the following names are returned.
+            record_sets = paginator.all_record_sets(self._fqdn_name(name), rtype)
+        else:
+            record_sets = paginator.all_record_sets()
+        for record in record_sets:
+            if name is not None and _name_order(record["Name"]) > _name_order(
+                self._fqdn_name(name)
+            ):
+                break
             record_content = []
             if rtype is not None and record["Type"] != rtype:
                 continue
@@ -310,16 +408,17 @@ class Provider(BaseProvider):
                 continue
 
             LOGGER.debug("record: %s", record)
-            records.append(
-                {
-                    "type": record["Type"],
-                    "name": self._full_name(record["Name"]),
-                    "ttl": record.get("TTL", None),
-                    "content": record_content[0]
-                    if len(record_content) == 1
-                    else record_content,
-                }
-            )
+            record_set = {
+                "type": record["Type"],
+                "name": self._full_name(record["Name"]),
+                "ttl": record.get("TTL", None),
+                "content": record_content[0]
+                if len(record_content) == 1
+                else record_content,
+            }
+            if record.get("AliasTarget", None) is not None:
+                record_set["alias_target"] = record["AliasTarget"]
+            records.append(record_set)
         return records
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
@@ -327,6 +426,32 @@ class Provider(BaseProvider):
         pass
 
 
+def _get_client(access_key, access_secret):
+    """
+    Return the Route 53 client of the given credentials, shared by the providers.
+    Without explicit credentials, the ones resolved by boto3 may differ from one
+    provider to another: a new client is then returned.
+    """
+    if not access_key:
+        return _create_client(access_key, access_secret)
+    with _CLIENTS_LOCK:
+        key = (access_key, access_secret)
+        if key not in _CLIENTS:
+            _CLIENTS[key] = _create_client(access_key, access_secret)
+        return _CLIENTS[key]
+
+
+def _create_client(access_key, access_secret):
+    return boto3.client(
+        "route53", aws_access_key_id=access_key, aws_secret_access_key=access_secret
+    )
+
+
+def _name_order(name):
+    # Route 53 sorts record sets by their labels in reverse order, eg. com.example.www
+    return name.rstrip(".").lower().replace("*", "\\052").split(".")[::-1]
+
+
 def _format_content(rtype, content):
     return content[1:-1] if rtype in ["TXT", "SPF"] else content
 
@@ -187,7 +187,7 @@ class Provider(BaseProvider):
         if not url.startswith(self.api_endpoint):
             url = self.api_endpoint + url
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             url,
             params=query_params,
@@ -4,7 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from lexicon.providers.base import Provider as BaseProvider
@@ -220,7 +219,7 @@ class Provider(BaseProvider):
         if query_params:
             query_string = json.dumps(query_params)
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_string,
@@ -25,8 +25,6 @@ import hashlib
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -80,7 +78,7 @@ class Provider(BaseProvider):
                 "password": password,
             }
 
-            result = requests.post(url, data=data)
+            result = self._get_http_session().post(url, data=data)
             result.raise_for_status()
             self.api_key = result.json()["accessToken"]
 
@@ -262,7 +260,7 @@ class Provider(BaseProvider):
             data = {}
         if query_params is None:
             query_params = {}
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             "https://restapi.ultradns.com/v2" + url,
             params=query_params,
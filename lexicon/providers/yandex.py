@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 __author__ = "Aliaksandr Kharkevich"
@@ -161,7 +159,7 @@ class Provider(BaseProvider):
         if not url.startswith(self.api_endpoint):
             url = self.api_endpoint + url
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             url,
             params=query_params,
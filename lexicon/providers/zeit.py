@@ -4,8 +4,6 @@ from __future__ import absolute_import
 import json
 import logging
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -162,7 +160,7 @@ class Provider(BaseProvider):
         if query_params is None:
             query_params = {}
 
-        request = requests.request(
+        request = self._get_http_session().request(
             action,
             self.api_endpoint + url,
             params=query_params,
@@ -177,7 +177,7 @@ class Provider(BaseProvider):
         return True
 
     def _request(self, action="GET", url="/", data=None, query_params=None):
-        response = requests.request(
+        response = self._get_http_session().request(
             action,
             "https://api.zilore.com/dns/v1{0}".format(url),
             params=query_params,
@@ -22,8 +22,6 @@ from __future__ import absolute_import
 import logging
 from xml.etree import ElementTree
 
-import requests
-
 from lexicon.providers.base import Provider as BaseProvider
 
 LOGGER = logging.getLogger(__name__)
@@ -195,7 +193,7 @@ class Provider(BaseProvider):
         else:
             query_params["api_key"] = self._get_provider_option("auth_token")
 
-        response = requests.request(
+        response = self._get_http_session().request(
             action, self.api_endpoint + url, params=query_params
         )
         tree = ElementTree.ElementTree(ElementTree.fromstring(response.content))
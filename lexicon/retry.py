@@ -0,0 +1,156 @@
+"""
+Retry and rate limiting of the HTTP requests sent by Lexicon providers to their API.
+
+A RetryPolicy decides if a response must be retried, and how long to wait before: the
+Retry-After header of the response is honoured if any, otherwise an exponential backoff
+with full jitter is used, so concurrent clients do not retry all at the same time.
+
+Requests can also be throttled by a token bucket, shared by all the providers of the
+process that use the same key (typically a provider name and its credentials).
+"""
+import email.utils
+import random
+import threading
+import time
+
+from urllib3.util.retry import Retry
+
+# Longest delay honoured from a Retry-After header, in seconds.
+RETRY_AFTER_MAX = 300
+
+# HTTP methods that can be sent again without side effects if the first attempt was
+# processed by the server (eg. a 503 error or a connection lost while reading).
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"])
+
+_RATE_LIMITERS = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+class RetryPolicy(object):
+    """
+    Retry policy of HTTP requests: a response for which is_retryable(response) is True
+    is retried up to max_retries times. Before retry N (starting at 0), the client waits
+    for the Retry-After delay of the response, or for a random delay between 0 and
+    min(backoff_max, backoff_factor * 2 ** N) seconds. With jitter disabled, the client
+    waits for this whole upper bound instead, for APIs whose rate limit window must be
+    elapsed before retrying. If a rate_limiter is provided, its acquire() method is
+    called before each attempt.
+
+    Network errors are retried with the same backoff: always if the request could not
+    be sent, and only for IDEMPOTENT_METHODS otherwise.
+    """
+
+    def __init__(
+        self,
+        is_retryable,
+        max_retries=5,
+        backoff_factor=0.5,
+        backoff_max=30,
+        rate_limiter=None,
+        jitter=True,
+    ):
+        self.is_retryable = is_retryable
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter
+        self.jitter = jitter
+
+    def should_retry(self, attempt, response):
+        """Check if the given response, received at the given attempt, must be retried"""
+        return attempt < self.max_retries and self.is_retryable(response)
+
+    def should_retry_error(self, attempt, method, request_sent=True):
+        """
+        Check if a network error, raised at the given attempt of a request with the
+        given method, must be retried.
+        """
+        return attempt < self.max_retries and (
+            not request_sent or method.upper() in IDEMPOTENT_METHODS
+        )
+
+    def delay(self, attempt, response=None):
+        """
+        Return the delay to wait, in seconds, before retrying the given response
+        (or a network error if response is None).
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, RETRY_AFTER_MAX)
+        backoff = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def network_retries(self):
+        """
+        Return the urllib3 Retry applying this policy to the network errors of a
+        requests HTTPAdapter. Responses are not retried by it.
+        """
+        return Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=0,
+            backoff_factor=self.backoff_factor,
+            raise_on_status=False,
+        )
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket allowing rate requests per second, with bursts of up to
+    burst requests. Callers exceeding the rate are delayed, in the order of arrival.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token, and return the delay to wait before using it, in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._timestamp) * self.rate
+            )
+            self._timestamp = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0
+
+    def acquire(self):
+        """Take one token, waiting until it is available"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+def get_rate_limiter(key, rate, burst=1):
+    """
+    Return the TokenBucket shared by the whole process for the given key, creating it
+    with the given rate and burst if needed.
+    """
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(key)
+        if not limiter:
+            limiter = TokenBucket(rate, burst)
+            _RATE_LIMITERS[key] = limiter
+        return limiter
+
+
+def parse_retry_after(value):
+    """
+    Return the delay in seconds represented by the given Retry-After header value,
+    either a number of seconds or an HTTP date, or None if it cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        date = email.utils.parsedate_tz(value)
+        if not date:
+            return None
+        return max(0.0, email.utils.mktime_tz(date) - time.time())
@@ -0,0 +1,236 @@
+"""
+Lexicon server: a long-running process that executes Lexicon operations received through
+a JSON API over HTTP, either on a TCP port or on a Unix socket.
+
+Each request is a POST whose body is one operation, in the same format as the ones
+given to Client.execute_batch(). The response body is {"result": ...} on success, or
+{"error": "..."} with a 4xx/5xx HTTP status on failure.
+
+On a TCP port, every request must be authenticated with the token of the server, given
+in an "Authorization: Bearer <token>" header. On a Unix socket, access is restricted to
+the owner of the socket, and a token is only checked if one is set.
+
+Authenticated providers are kept between requests in a pool, keyed by provider, domain
+and provider specific parameters. A provider unused for more than the idle timeout is
+evicted from the pool, and so is a provider whose last operation failed: its HTTP
+connections are closed.
+"""
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+from lexicon.client import (
+    ProviderNotAvailableError,
+    ProviderSession,
+    operation_group_key,
+    validate_operation,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+IDLE_TIMEOUT_DEFAULT = 300
+
+
+class ProviderPool(object):
+    """
+    Pool of authenticated provider sessions, shared by the threads serving requests.
+    Operations targeting the same session are executed one at a time.
+    """
+
+    def __init__(self, config, idle_timeout=IDLE_TIMEOUT_DEFAULT):
+        self.config = config
+        self.idle_timeout = idle_timeout
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def validate(self, operation):
+        """Check that the given operation can be executed (see client.validate_operation())"""
+        validate_operation(self.config, operation)
+
+    def execute(self, operation):
+        """Execute the given operation, reusing the relevant provider session if any"""
+        key = operation_group_key(self.config, operation)
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if not entry:
+                    entry = _PoolEntry()
+                    self._entries[key] = entry
+
+            with entry.lock:
+                # The entry may have been evicted while waiting for its lock: a session
+                # created on it would never be closed, so the pool is looked up again.
+                with self._lock:
+                    if self._entries.get(key) is not entry:
+                        continue
+                entry.last_used = time.time()
+                try:
+                    if not entry.session:
+                        entry.session = ProviderSession(self.config, operation)
+                    return entry.session.execute(operation)
+                except Exception:
+                    # Provider may be in an unknown state (eg. expired authentication):
+                    # next operation for this key will use a new session.
+                    _close_session(entry.session)
+                    entry.session = None
+                    raise
+                finally:
+                    entry.last_used = time.time()
+
+    def evict_idle(self, now=None):
+        """Remove from the pool the sessions unused for more than the idle timeout"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if now - entry.last_used > self.idle_timeout and entry.lock.acquire(
+                    False
+                ):
+                    try:
+                        del self._entries[key]
+                        _close_session(entry.session)
+                        entry.session = None
+                    finally:
+                        entry.lock.release()
+
+    def __len__(self):
+        with self._lock:
+            return len([entry for entry in self._entries.values() if entry.session])
+
+
+def _close_session(session):
+    if not session:
+        return
+    try:
+        session.close()
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.warning("Error while closing a provider session.", exc_info=True)
+
+
+class _PoolEntry(object):
+    def __init__(self):
+        self.session = None
+        self.lock = threading.Lock()
+        self.last_used = time.time()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handle the JSON API requests, using the ProviderPool of the server"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Execute the operation provided in the request body"""
+        if not self._is_authorized():
+            self._send_json(401, {"error": "Invalid or missing token."})
+            self.close_connection = True
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            operation = json.loads(self.rfile.read(length).decode("utf-8"))
+            if not isinstance(operation, dict):
+                raise ValueError("Request body must be a JSON object.")
+        except ValueError as error:
+            self._send_json(400, {"error": str(error)})
+            return
+
+        try:
+            self.server.pool.validate(operation)
+        except (AttributeError, ProviderNotAvailableError, ValueError) as error:
+            self._send_json(400, {"error": "Invalid operation: {0}".format(error)})
+            return
+
+        try:
+            result = self.server.pool.execute(operation)
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.exception("Error while executing operation.")
+            self._send_json(500, {"error": str(error)})
+        else:
+            self._send_json(200, {"result": result})
+
+    def _is_authorized(self):
+        token = self.server.token
+        if not token:
+            return True
+        scheme, _, provided = self.headers.get("Authorization", "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(
+            provided.strip().encode("utf-8"), token.encode("utf-8")
+        )
+
+    def _send_json(self, status, content):
+        body = json.dumps(content, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix sockets do not provide a client address.
+        return self.client_address[0] or "unix-socket"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        LOGGER.info("%s - %s", self.address_string(), format % args)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super(_ThreadingUnixHTTPServer, self).get_request()
+        return request, ("", 0)
+
+
+def create_server(
+    config, host="127.0.0.1", port=0, socket_path=None, token=None, **kwargs
+):
+    """
+    Create a Lexicon server listening on the given host and port, or on the given Unix
+    socket path if set. Parameters not defined by operations are resolved from config.
+    Requests must provide the given token as a bearer token: it is required on a TCP
+    port, and optional on a Unix socket.
+    Additional keyword arguments are given to the ProviderPool (eg. idle_timeout).
+    Call serve_forever() on the returned server to start serving requests.
+    """
+    if not socket_path and not token:
+        raise ValueError(
+            "Error, a token is required to listen on a TCP port: "
+            "use a Unix socket, or set a token."
+        )
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        # The socket is created by bind() with permissions restricted to its owner.
+        umask = os.umask(0o177)
+        try:
+            server = _ThreadingUnixHTTPServer(socket_path, _RequestHandler)
+        finally:
+            os.umask(umask)
+    else:
+        server = _ThreadingHTTPServer((host, port), _RequestHandler)
+
+    server.token = token
+    server.pool = ProviderPool(config, **kwargs)
+
+    eviction_thread = threading.Thread(target=_evict_idle_sessions, args=(server.pool,))
+    eviction_thread.daemon = True
+    eviction_thread.start()
+
+    return server
+
+
+def _evict_idle_sessions(pool):
+    while True:
+        time.sleep(max(1, min(pool.idle_timeout, 60)))
+        pool.evict_idle()
@@ -0,0 +1,70 @@
+"""
+Zone snapshots: the records of a DNS zone retrieved once by a provider, then reused
+by the following operations of this provider instead of listing the zone again.
+
+Records are indexed by name and type. A snapshot can expire after a TTL, and providers
+keep it consistent with their writes, by updating or invalidating it (see the zone
+snapshot methods of lexicon.providers.base.Provider).
+"""
+
+import copy
+import time
+
+
+class ZoneSnapshot(object):
+    """
+    Records of a zone, as dicts with at least the "id", "type" and "name" keys.
+    Names are full names: they are compared without trailing dot and case-insensitively.
+    If ttl is set, the snapshot expires ttl seconds after its creation.
+    """
+
+    def __init__(self, records, ttl=None):
+        self._records = []
+        self._index = {}
+        self._expires_at = time.monotonic() + ttl if ttl else None
+        for record in records:
+            self.add(record)
+
+    def is_expired(self):
+        """Check if the TTL of this snapshot has expired"""
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def find(self, rtype=None, name=None):
+        """
+        Return copies of the records with the given type and name (any if not given),
+        in the order of the zone.
+        """
+        if name is not None and rtype is not None:
+            records = self._index.get(_key(name, rtype), [])
+        else:
+            records = [
+                record
+                for record in self._records
+                if (rtype is None or record["type"] == rtype)
+                and (name is None or _normalize(record["name"]) == _normalize(name))
+            ]
+        return copy.deepcopy(records)
+
+    def add(self, record):
+        """Add the given record to the snapshot"""
+        record = copy.deepcopy(record)
+        self._records.append(record)
+        self._index.setdefault(_key(record["name"], record["type"]), []).append(record)
+
+    def remove(self, identifier):
+        """Remove the record with the given identifier from the snapshot, if any"""
+        removed = [record for record in self._records if record["id"] == identifier]
+        for record in removed:
+            self._records.remove(record)
+            self._index[_key(record["name"], record["type"])].remove(record)
+
+    def __len__(self):
+        return len(self._records)
+
+
+def _normalize(name):
+    return (name or "").rstrip(".").lower()
+
+
+def _key(name, rtype):
+    return (_normalize(name), rtype)
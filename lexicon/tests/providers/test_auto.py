@@ -1,15 +1,21 @@
 """Integration tests for auto"""
+import importlib
+import re
 import socket
 from unittest import TestCase
 
 import mock
 import pytest
 
-from lexicon.providers.auto import _get_ns_records_domains_for_domain
+from lexicon.providers.auto import (
+    _get_ns_records_for_domain,
+    _NameserverRegistry,
+    _relevant_provider_for_domain,
+)
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
-# This fixture ensures to mock _get_ns_records_domains_for_domain, in order to not rely
+# This fixture ensures to mock _get_ns_records_for_domain, in order to not rely
 # on the machine on which the test is done, as this function call nslookup.
 # Then it will prevent errors where there is no network or tested domain do not exists anymore.
 @pytest.fixture(autouse=True)
@@ -53,11 +59,73 @@ class AutoProviderTests(TestCase, IntegrationTestsV2):
     def _test_fallback_fn(self):
         return lambda x: "placeholder_" + x if x != "mapping_override" else None
 
-    # Here we do not mock the function _get_ns_records_domains_for_domain
+    # Here we do not mock the function _get_ns_records_for_domain
     # to effectively test the nslookup call and processing.\
     @pytest.mark.skipif(
         _there_is_no_network(), reason="No network, no nslookup call possible."
     )
     def test_nslookup_resolution(self):
         """Ensure that nameservers can be resolved through os nslookup call."""
-        assert _get_ns_records_domains_for_domain("google.com")
+        assert _get_ns_records_for_domain("google.com")
+
+
+def test_nameserver_registry_matches_plain_domains_and_regexes():
+    registry = _NameserverRegistry(
+        {
+            "ovh": ["ovh.net", "anycast.me"],
+            "hetzner": ["ns.hetzner.com"],
+            "route53": [re.compile(r"^awsdns-\d+\.\w+$")],
+            "linode": ["linode.com"],
+            "linode4": ["linode.com"],
+        }
+    )
+
+    assert registry.find(["dns10.ovh.net"]) == ["ovh"]
+    assert registry.find(["hydrogen.ns.hetzner.com."]) == ["hetzner"]
+    assert registry.find(["ns-1.awsdns-12.org", "ns-2.awsdns-34.co.uk"]) == ["route53"]
+    assert registry.find(["ns1.linode.com"]) == ["linode", "linode4"]
+    assert registry.find(["ns1.example.com"]) == []
+
+
+def test_nameserver_registry_finds_all_providers_matching_regexes():
+    registry = _NameserverRegistry(
+        {
+            "alpha": [re.compile(r"^ns\d\.example\.net$")],
+            "beta": [re.compile(r"^ns1\.example\.net$")],
+            "gamma": [re.compile(r"^ns\d\.other\.net$")],
+        }
+    )
+
+    assert registry.find(["ns1.example.net"]) == ["alpha", "beta"]
+    assert registry.find(["ns2.example.net"]) == ["alpha"]
+    assert registry.find(["ns1.other.net"]) == ["gamma"]
+
+
+def test_nameserver_registry_supports_regexes_with_groups_and_flags():
+    registry = _NameserverRegistry(
+        {
+            "alpha": [re.compile(r"^(ns|dns)\d\.alpha\.net$")],
+            "beta": [re.compile(r"^(?P<server>ns\d)\.beta\.net$")],
+            "gamma": [re.compile(r"(?i)^ns\.gamma\.net$")],
+            "delta": [re.compile(r"^(a)(b)?\.delta\.net$")],
+            "epsilon": [re.compile(r"^ns\.epsilon\.net$")],
+        }
+    )
+
+    assert registry.find(["dns1.alpha.net"]) == ["alpha"]
+    assert registry.find(["ns2.beta.net"]) == ["beta"]
+    assert registry.find(["ns.gamma.net"]) == ["gamma"]
+    assert registry.find(["a.delta.net"]) == ["delta"]
+    assert registry.find(["ns.epsilon.net"]) == ["epsilon"]
+
+
+def test_relevant_provider_for_domain_imports_only_the_relevant_provider():
+    with mock.patch(
+        "lexicon.providers.auto.importlib.import_module",
+        wraps=importlib.import_module,
+    ) as mock_import:
+        provider_name, provider_module = _relevant_provider_for_domain("pacalis.net")
+
+    assert provider_name == "ovh"
+    assert provider_module.__name__ == "lexicon.providers.ovh"
+    mock_import.assert_called_once_with("lexicon.providers.ovh")
@@ -1,8 +1,11 @@
 """Integration tests for DigitalOcean"""
 from unittest import TestCase
 
+import mock
 import pytest
 
+from lexicon.config import ConfigResolver
+from lexicon.providers.digitalocean import LIST_RECORDS_PAGE_SIZE, Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -23,3 +26,40 @@ class DigitalOceanProviderTests(TestCase, IntegrationTestsV2):
         self,
     ):
         return
+
+
+def test_records_are_filtered_by_api_and_remaining_pages_fetched():
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {"provider_name": "digitalocean", "domain": "foxwoodswebsites.com"}
+        )
+    )
+    provider.domain_id = "foxwoodswebsites.com"
+    record = {"type": "TXT", "name": "test", "ttl": 3600, "data": "token"}
+    last_url = (
+        "https://api.digitalocean.com/v2/domains/foxwoodswebsites.com/records?page=3"
+    )
+    pages = {
+        page: {
+            "domain_records": [dict(record, id=page)],
+            "links": {"pages": {"last": last_url}},
+        }
+        for page in (1, 2, 3)
+    }
+    sent = []
+
+    def get(url, query_params=None):
+        sent.append(dict(query_params))
+        return pages[query_params.get("page", 1)]
+
+    with mock.patch.object(Provider, "_get", side_effect=get):
+        records = provider._list_records("TXT", "test")
+
+    assert [record["id"] for record in records] == [1, 2, 3]
+    assert sorted(request.get("page", 1) for request in sent) == [1, 2, 3]
+    assert all(
+        request["type"] == "TXT"
+        and request["name"] == "test.foxwoodswebsites.com"
+        and request["per_page"] == LIST_RECORDS_PAGE_SIZE
+        for request in sent
+    )
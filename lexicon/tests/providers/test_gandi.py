@@ -1,6 +1,11 @@
 """Integration tests for Gandi"""
 from unittest import TestCase
 
+import mock
+import pytest
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.gandi import GandiRPCSubProvider, Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -30,3 +35,61 @@ class GandiRESTProviderTests(TestCase, IntegrationTestsV2):
 
     def _test_parameters_overrides(self):
         return {"api_protocol": "rest"}
+
+
+def _rpc_provider():
+    config = ConfigResolver().with_dict(
+        {
+            "provider_name": "gandi",
+            "domain": "reachlike.ca",
+            "gandi": {"auth_token": "placeholder", "api_protocol": "rpc"},
+        }
+    )
+    provider = Provider(config)
+    provider.rpc_helper._api = mock.Mock()
+    provider.rpc_helper._zone_id = 1
+    provider.rpc_helper._api.domain.zone.version.new.return_value = 2
+    return provider
+
+
+def test_rpc_changes_are_applied_with_one_zone_version():
+    provider = _rpc_provider()
+    api = provider.rpc_helper._api
+    api.domain.zone.record.list.return_value = [
+        {"id": 3, "type": "TXT", "name": "old", "value": '"token"', "ttl": 3600}
+    ]
+
+    results = provider.apply_changes(
+        [
+            {"action": "create", "type": "TXT", "name": "new", "content": "token"},
+            {"action": "delete", "type": "TXT", "name": "old", "content": "token"},
+        ]
+    )
+
+    assert results == [True, True]
+    api.domain.zone.version.new.assert_called_once_with("placeholder", 1)
+    api.domain.zone.record.list.assert_called_once_with(
+        "placeholder", 1, 2, {"type": "TXT", "name": "old", "value": '"token"'}
+    )
+    api.domain.zone.version.set.assert_called_once_with("placeholder", 1, 2)
+    api.domain.zone.version.delete.assert_not_called()
+
+
+def test_rpc_zone_version_is_deleted_when_a_change_fails():
+    provider = _rpc_provider()
+    api = provider.rpc_helper._api
+    api.domain.zone.record.list.return_value = [
+        {"id": 3, "type": "TXT", "name": "old", "value": '"token"', "ttl": 3600}
+    ]
+    api.domain.zone.record.update.return_value = []
+
+    with pytest.raises(GandiRPCSubProvider.GandiInternalError):
+        provider.apply_changes(
+            [
+                {"action": "create", "type": "TXT", "name": "new", "content": "token"},
+                {"action": "update", "type": "TXT", "name": "old", "content": "other"},
+            ]
+        )
+
+    api.domain.zone.version.set.assert_not_called()
+    api.domain.zone.version.delete.assert_called_once_with("placeholder", 1, 2)
@@ -1,6 +1,10 @@
 """Integration tests for Google Cloud DNS"""
 from unittest import TestCase
 
+import mock
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.googleclouddns import Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 # All data in the following service_account base64-encoded file have been invalidated
@@ -39,3 +43,44 @@ class GoogleCloudDnsTests(TestCase, IntegrationTestsV2):
                 SERVICE_ACCOUNT_INFO_BASE64
             )
         }
+
+
+def test_rrsets_listing_follows_pages_and_filters_by_name_and_type():
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {
+                "provider_name": "googleclouddns",
+                "domain": "fullm3tal.tk",
+                "googleclouddns": {
+                    "auth_service_account_info": "base64::{0}".format(
+                        SERVICE_ACCOUNT_INFO_BASE64
+                    )
+                },
+            }
+        )
+    )
+    provider.domain_id = "zone"
+    rrset = {"type": "TXT", "name": "test.fullm3tal.tk.", "ttl": 300}
+    pages = [
+        {"rrsets": [dict(rrset, rrdatas=['"one"'])], "nextPageToken": "next"},
+        {"rrsets": [dict(rrset, rrdatas=['"two"'])]},
+    ]
+
+    with mock.patch.object(Provider, "_get", side_effect=pages) as get:
+        records = provider._list_records("TXT", "test")
+
+    assert [record["content"] for record in records] == ["one", "two"]
+    assert get.call_args_list == [
+        mock.call(
+            "/managedZones/zone/rrsets",
+            query_params={"type": "TXT", "name": "test.fullm3tal.tk."},
+        ),
+        mock.call(
+            "/managedZones/zone/rrsets",
+            query_params={
+                "type": "TXT",
+                "name": "test.fullm3tal.tk.",
+                "pageToken": "next",
+            },
+        ),
+    ]
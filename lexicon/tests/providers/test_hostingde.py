@@ -1,6 +1,10 @@
 """Integration tests for HostingDE provider"""
 from unittest import TestCase
 
+import mock
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.hostingde import Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -21,3 +25,81 @@ class FooProviderTests(TestCase, IntegrationTestsV2):
 
     def _filter_query_parameters(self):
         return ["secret_key"]
+
+    def _test_parameters_overrides(self):
+        # Deleted records are listed once, without waiting for them to disappear
+        return {"delete_timeout": "0"}
+
+
+def _provider():
+    return Provider(
+        ConfigResolver().with_dict(
+            {"provider_name": "hostingde", "domain": "eruza.de", "auth_token": "token"}
+        )
+    )
+
+
+def test_deleted_records_verified_with_one_listing_per_poll():
+    provider = _provider()
+    records = [{"id": "first"}, {"id": "second"}, {"id": "other"}]
+    listings = [records, records[1:], records[2:]]
+
+    with mock.patch.object(
+        Provider, "_list_records", side_effect=[records[:2]] + listings
+    ) as list_records, mock.patch.object(
+        Provider, "_get_zone_config", return_value={}
+    ), mock.patch.object(
+        Provider, "_request", return_value=[]
+    ), mock.patch(
+        "lexicon.providers.hostingde.time.sleep"
+    ) as sleep:
+        assert provider._delete_record(rtype="TXT", name="_acme-challenge")
+
+    assert list_records.call_count == 4
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_updated_record_deletion_verified_with_filtered_listings():
+    provider = _provider()
+    record = {
+        "id": "first",
+        "type": "TXT",
+        "name": "_acme-challenge.eruza.de",
+        "content": "old",
+    }
+
+    with mock.patch.object(
+        Provider, "_list_records", side_effect=[[record], []]
+    ) as list_records, mock.patch.object(
+        Provider, "_get_zone_config", return_value={}
+    ), mock.patch.object(
+        Provider, "_request", return_value=[]
+    ), mock.patch.object(
+        Provider, "_create_record", return_value=True
+    ):
+        assert provider._update_record("first", content="new")
+
+    list_records.assert_called_with("TXT", "_acme-challenge.eruza.de")
+
+
+def test_only_find_requests_are_paginated():
+    provider = _provider()
+    pages = []
+
+    def request_page(action, url, payload, query_params):
+        pages.append((url, payload.get("page")))
+        return {
+            "status": "success",
+            "response": {"data": [payload.get("page")], "totalPages": 3},
+        }
+
+    with mock.patch.object(Provider, "_request_page", side_effect=request_page):
+        assert provider._request("POST", "/recordsFind", {"filter": {}}) == [1, 2, 3]
+        assert provider._request("POST", "/zoneUpdate", {"zoneConfig": {}}) == [None]
+
+    assert sorted(pages[:3]) == [
+        ("/recordsFind", 1),
+        ("/recordsFind", 2),
+        ("/recordsFind", 3),
+    ]
+    assert pages[3:] == [("/zoneUpdate", None)]
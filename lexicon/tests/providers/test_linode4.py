@@ -1,8 +1,11 @@
 """Integration tests for Linode V4"""
 from unittest import TestCase
 
+import mock
 import pytest
 
+from lexicon.config import ConfigResolver
+from lexicon.providers.linode4 import Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -27,3 +30,34 @@ class Linode4ProviderTests(TestCase, IntegrationTestsV2):
     @pytest.mark.skip(reason="can not set ttl when creating/updating records")
     def test_provider_when_calling_list_records_after_setting_ttl(self):
         return
+
+
+def test_records_are_filtered_by_api_and_remaining_pages_fetched():
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {"provider_name": "linode4", "domain": "lexicon-test.com"}
+        )
+    )
+    provider.domain_id = 1
+    record = {"type": "TXT", "name": "test", "ttl_sec": 0, "target": "token"}
+    pages = {
+        1: {"pages": 3, "data": [dict(record, id=1)]},
+        2: {"pages": 3, "data": [dict(record, id=2)]},
+        3: {"pages": 3, "data": [dict(record, id=3)]},
+    }
+    sent = []
+
+    def get(url, query_params=None):
+        sent.append(dict(query_params))
+        return pages[query_params.get("page", 1)]
+
+    with mock.patch.object(Provider, "_get", side_effect=get):
+        records = provider._list_records("TXT", "test")
+
+    assert [record["id"] for record in records] == [1, 2, 3]
+    assert sorted(request.get("page", 1) for request in sent) == [1, 2, 3]
+    assert all(
+        request["filter"] == {"type": "TXT", "name": "test"}
+        and request["page_size"] == 500
+        for request in sent
+    )
@@ -1,6 +1,10 @@
 """Integration tests for OVH"""
 from unittest import TestCase
 
+import mock
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.ovh import Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -18,3 +22,106 @@ class OvhProviderTests(TestCase, IntegrationTestsV2):
 
     def _test_parameters_overrides(self):
         return {"auth_entrypoint": "ovh-eu"}
+
+
+def _provider(**options):
+    ovh_options = {
+        "auth_entrypoint": "ovh-eu",
+        "auth_application_key": "key",
+        "auth_application_secret": "secret",
+        "auth_consumer_key": "consumer",
+    }
+    ovh_options.update(options)
+    return Provider(
+        ConfigResolver().with_dict(
+            {"provider_name": "ovh", "domain": "pacalis.net", "ovh": ovh_options}
+        )
+    )
+
+
+def _get(url, query_params=None):
+    if url == "/domain/zone/":
+        return ["pacalis.net"]
+    if url.endswith("/status"):
+        return {"isDeployed": True}
+    return []
+
+
+def test_time_delta_is_reused_between_providers():
+    session = mock.Mock()
+    session.get.return_value.json.return_value = 1000
+
+    with mock.patch.object(
+        Provider, "_get_http_session", return_value=session
+    ), mock.patch.object(Provider, "_get", side_effect=_get), mock.patch(
+        "lexicon.providers.ovh.time.time", return_value=900
+    ):
+        first = _provider()
+        first.authenticate()
+        second = _provider()
+        second.authenticate()
+
+    assert session.get.call_count == 1
+    assert first.time_delta == second.time_delta == 100
+
+
+def test_zone_refreshed_once_for_a_change_set():
+    provider = _provider()
+    provider.domain_id = "pacalis.net"
+    assert not provider._has_native_changes()
+
+    with mock.patch.object(Provider, "_get", side_effect=_get), mock.patch.object(
+        Provider, "_post", return_value={"id": 1}
+    ) as post:
+        provider.apply_changes(
+            [
+                {"action": "create", "type": "TXT", "name": "first", "content": "a"},
+                {"action": "create", "type": "TXT", "name": "second", "content": "b"},
+            ]
+        )
+
+    refreshes = [
+        call for call in post.call_args_list if call.args[0].endswith("refresh")
+    ]
+    assert len(refreshes) == 1
+    assert post.call_args_list[-1] == refreshes[0]
+
+
+def test_time_delta_synchronized_again_when_request_is_rejected():
+    provider = _provider()
+    provider.time_delta = 500
+    provider.session = mock.Mock()
+    provider.session.get.return_value.json.return_value = 1000
+    provider.session.prepare_request.return_value.url = "https://eu.api.ovh.com/"
+    rejected = mock.Mock(status_code=400)
+    rejected.json.return_value = {"message": "Query out of time"}
+    accepted = mock.Mock(status_code=200)
+    accepted.json.return_value = ["pacalis.net"]
+    provider.session.request.side_effect = [rejected, accepted]
+
+    with mock.patch("lexicon.providers.ovh.time.time", return_value=900):
+        assert provider._get("/domain/zone/") == ["pacalis.net"]
+
+    assert provider.time_delta == 100
+    assert provider.session.request.call_count == 2
+    timestamps = [
+        call.kwargs["headers"]["X-Ovh-Timestamp"]
+        for call in provider.session.request.call_args_list
+    ]
+    assert timestamps == ["1400", "1000"]
+
+
+def test_deferred_refresh_applied_when_provider_is_closed():
+    provider = _provider(deferred_refresh=True)
+    provider.domain_id = "pacalis.net"
+
+    with mock.patch.object(Provider, "_get", side_effect=_get), mock.patch.object(
+        Provider, "_post", return_value={"id": 1}
+    ) as post:
+        provider.create_record("TXT", "first", "a")
+        provider.create_record("TXT", "second", "b")
+        assert post.call_count == 2
+        provider.close()
+
+    assert post.call_count == 3
+    assert post.call_args.args[0] == "/domain/zone/pacalis.net/refresh"
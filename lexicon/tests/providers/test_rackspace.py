@@ -1,6 +1,10 @@
 """"Test for rackspace implementation of the lexicon interface"""
 from unittest import TestCase
 
+import mock
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.rackspace import Provider
 from lexicon.tests.providers.integration_tests import IntegrationTestsV2
 
 
@@ -35,3 +39,59 @@ class RackspaceProviderTests(TestCase, IntegrationTestsV2):
 
     def _test_fallback_fn(self):
         return lambda x: "placeholder_" + x if x != "auth_token" else None
+
+
+def test_records_deleted_in_bulk_and_jobs_polled_with_backoff():
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {
+                "provider_name": "rackspace",
+                "domain": "capsulecd.com",
+                "rackspace": {"sleep_time": "1"},
+            }
+        )
+    )
+    provider.domain_id = 1
+    records = [{"id": "TXT-{0}".format(index)} for index in range(150)]
+    sent = []
+    polls = {}
+
+    def request(action, url, data=None, query_params=None):
+        sent.append((action, url, query_params))
+        return {"status": "RUNNING", "callbackUrl": query_params["id"][0]}
+
+    def update_response(job):
+        polls[job["callbackUrl"]] = polls.get(job["callbackUrl"], 0) + 1
+        done = polls[job["callbackUrl"]] >= (2 if job["callbackUrl"] == "TXT-0" else 6)
+        return dict(job, status="COMPLETED" if done else "RUNNING")
+
+    with mock.patch.object(
+        Provider, "_list_records", return_value=records
+    ), mock.patch.object(Provider, "_request", side_effect=request), mock.patch.object(
+        Provider, "_update_response", side_effect=update_response
+    ), mock.patch(
+        "lexicon.providers.rackspace.time.sleep"
+    ) as sleep:
+        assert provider._delete_record(rtype="TXT", name="_acme-challenge")
+
+    assert sent == [
+        (
+            "DELETE",
+            "/domains/1/records",
+            {"id": [record["id"] for record in records[:100]]},
+        ),
+        (
+            "DELETE",
+            "/domains/1/records",
+            {"id": [record["id"] for record in records[100:]]},
+        ),
+    ]
+    assert polls == {"TXT-0": 2, "TXT-100": 6}
+    assert [call.args[0] for call in sleep.call_args_list] == [
+        0.1,
+        0.2,
+        0.4,
+        0.8,
+        1,
+        1,
+    ]
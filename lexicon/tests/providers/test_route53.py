@@ -2,8 +2,11 @@
 from contextlib import contextmanager
 from unittest import TestCase
 
+import mock
 import pytest
 
+from lexicon.config import ConfigResolver
+from lexicon.providers.route53 import Provider
 from lexicon.tests.providers import integration_tests
 
 
@@ -46,3 +49,146 @@ class Route53ProviderTests(TestCase, integration_tests.IntegrationTestsV2):
             filter_post_data_parameters=self._filter_post_data_parameters(),
         ):
             yield
+
+
+def test_record_sets_lookup_starts_at_name_and_stops_after_it():
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {
+                "provider_name": "route53",
+                "domain": "example.com",
+                "route53": {"auth_access_key": "key", "auth_access_secret": "secret"},
+            }
+        )
+    )
+    provider.domain_id = "ZONE"
+    provider.r53_client = mock.Mock()
+    provider.r53_client.list_resource_record_sets.return_value = {
+        "ResourceRecordSets": [
+            {
+                "Name": "_acme-challenge.example.com.",
+                "Type": "TXT",
+                "TTL": 300,
+                "ResourceRecords": [{"Value": '"token"'}],
+            },
+            {
+                "Name": "www._acme-challenge.example.com.",
+                "Type": "A",
+                "TTL": 300,
+                "ResourceRecords": [{"Value": "127.0.0.1"}],
+            },
+        ],
+        "IsTruncated": True,
+        "NextRecordName": "zzz.example.com.",
+        "NextRecordType": "A",
+    }
+
+    records = provider._list_records("TXT", "_acme-challenge")
+
+    assert [record["content"] for record in records] == ["token"]
+    provider.r53_client.list_resource_record_sets.assert_called_once_with(
+        HostedZoneId="ZONE",
+        StartRecordName="_acme-challenge.example.com.",
+        StartRecordType="TXT",
+    )
+
+
+def test_domain_id_key_identifies_ambient_credentials(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    keys = []
+    clients = []
+    for access_key in ("FIRSTACCOUNT", "SECONDACCOUNT"):
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", access_key)
+        provider = Provider(
+            ConfigResolver().with_dict(
+                {"provider_name": "route53", "domain": "example.com"}
+            )
+        )
+        keys.append(provider._domain_id_key())
+        clients.append(provider.r53_client)
+
+    assert keys[0] != keys[1]
+    assert clients[0] is not clients[1]
+
+
+def _route53_provider(record_sets):
+    provider = Provider(
+        ConfigResolver().with_dict(
+            {
+                "provider_name": "route53",
+                "domain": "example.com",
+                "route53": {"auth_access_key": "key", "auth_access_secret": "secret"},
+            }
+        )
+    )
+    provider.domain_id = "ZONE"
+    provider.r53_client = mock.Mock()
+    provider.r53_client.list_resource_record_sets.return_value = {
+        "ResourceRecordSets": record_sets,
+        "IsTruncated": False,
+    }
+    return provider
+
+
+def test_change_set_keeps_ttl_of_existing_record_sets():
+    provider = _route53_provider(
+        [
+            {
+                "Name": "_acme-challenge.example.com.",
+                "Type": "TXT",
+                "TTL": 60,
+                "ResourceRecords": [{"Value": '"first"'}],
+            }
+        ]
+    )
+
+    provider.apply_changes(
+        [
+            {
+                "action": "create",
+                "type": "TXT",
+                "name": "_acme-challenge",
+                "content": "second",
+            }
+        ]
+    )
+
+    listing = provider.r53_client.list_resource_record_sets.call_args
+    assert listing.kwargs["StartRecordName"] == "_acme-challenge.example.com."
+    change_batch = provider.r53_client.change_resource_record_sets.call_args.kwargs[
+        "ChangeBatch"
+    ]
+    assert change_batch["Changes"] == [
+        {
+            "Action": "UPSERT",
+            "ResourceRecordSet": {
+                "Name": "_acme-challenge.example.com.",
+                "Type": "TXT",
+                "TTL": 60,
+                "ResourceRecords": [{"Value": '"first"'}, {"Value": '"second"'}],
+            },
+        }
+    ]
+
+
+def test_change_set_refuses_alias_record_sets():
+    provider = _route53_provider(
+        [
+            {
+                "Name": "www.example.com.",
+                "Type": "A",
+                "AliasTarget": {
+                    "HostedZoneId": "ELB",
+                    "DNSName": "lb.amazonaws.com.",
+                    "EvaluateTargetHealth": False,
+                },
+            }
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        provider.apply_changes([{"action": "delete", "type": "A", "name": "www"}])
+
+    provider.r53_client.change_resource_record_sets.assert_not_called()
+    assert "alias_target" not in provider.list_records("A", "www")[0]
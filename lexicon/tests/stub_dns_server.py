@@ -0,0 +1,76 @@
+"""Stub DNS server, answering predefined records to test DNS resolution without network"""
+from __future__ import absolute_import
+
+import socket
+import threading
+
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+
+
+class StubDnsServer(object):
+    """
+    UDP DNS server listening on localhost, that answers queries using the given records.
+    Records are provided as a dict in the form of {(name, type): (ttl, [values])},
+    for instance: {("example.com.", "NS"): (3600, ["ns1.example.net."])}.
+    Queries received are recorded in the queries attribute, as (name, type) tuples.
+    """
+
+    def __init__(self, records=None):
+        self.records = records if records is not None else {}
+        self.queries = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+
+    @property
+    def port(self):
+        """Port on which this server listens"""
+        return self._socket.getsockname()[1]
+
+    def resolver(self):
+        """Return a dns.resolver.Resolver instance configured to query this server"""
+        resolver = dns.resolver.Resolver(configure=False)
+        resolver.nameservers = ["127.0.0.1"]
+        resolver.port = self.port
+        resolver.lifetime = 2
+        return resolver
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._socket.close()
+
+    def _serve(self):
+        while True:
+            try:
+                wire, address = self._socket.recvfrom(65535)
+            except OSError:
+                # Socket has been closed
+                return
+
+            query = dns.message.from_wire(wire)
+            question = query.question[0]
+            name = question.name.to_text()
+            rdtype = dns.rdatatype.to_text(question.rdtype)
+            self.queries.append((name, rdtype))
+
+            response = dns.message.make_response(query)
+            response.flags |= dns.flags.AA
+            record = self.records.get((name, rdtype))
+            if record:
+                ttl, values = record
+                response.answer.append(
+                    dns.rrset.from_text_list(name, ttl, "IN", rdtype, values)
+                )
+            elif not [key for key in self.records if key[0] == name]:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+
+            self._socket.sendto(response.to_wire(), address)
@@ -0,0 +1,190 @@
+"""Unit tests for the change sets applied by providers"""
+from __future__ import absolute_import
+
+import pytest
+
+from lexicon import changeset
+from lexicon.config import ConfigResolver
+from lexicon.providers.base import Provider
+
+RECORDS = [
+    {"id": "1", "type": "A", "name": "www.example.com", "content": "127.0.0.1"},
+    {"id": "2", "type": "TXT", "name": "txt.example.com", "content": "value1"},
+    {"id": "3", "type": "TXT", "name": "txt.example.com", "content": "value2"},
+]
+
+
+class _BatchProvider(Provider):
+    """Provider applying change sets natively, and recording the submitted batches"""
+
+    def __init__(self, config):
+        super(_BatchProvider, self).__init__(config)
+        self.records = [dict(record) for record in RECORDS]
+        self.batches = []
+
+    def _authenticate(self):
+        self.domain_id = self.domain
+
+    def _has_native_changes(self):
+        return True
+
+    def _apply_changes(self, changes):
+        final_records, results = changeset.plan(self.records, changes, self._full_name)
+        self.batches.append(changeset.changed_rrsets(self.records, final_records))
+        self.records = final_records
+        return results
+
+
+class _SequentialProvider(_BatchProvider):
+    """Provider applying change sets with one call per change"""
+
+    def _has_native_changes(self):
+        return False
+
+    def _create_record(self, rtype, name, content):
+        self.batches.append(("create", rtype, name, content))
+        return True
+
+    def _delete_record(self, identifier=None, rtype=None, name=None, content=None):
+        self.batches.append(("delete", identifier, rtype, name, content))
+        return True
+
+
+def _provider(provider_class):
+    config = ConfigResolver().with_dict(
+        {"provider_name": "fake", "domain": "example.com"}
+    )
+    provider = provider_class(config)
+    provider.authenticate()
+    return provider
+
+
+def _full_name(name):
+    return name if name.endswith("example.com") else name + ".example.com"
+
+
+def test_normalize_rejects_invalid_changes():
+    with pytest.raises(ValueError):
+        changeset.normalize({"action": "list"})
+    with pytest.raises(ValueError):
+        changeset.normalize({"action": "create", "type": "TXT", "name": "txt"})
+    with pytest.raises(ValueError):
+        changeset.normalize({"action": "update", "content": "value"})
+
+    assert changeset.normalize({"action": "delete", "rtype": "TXT"})["type"] == "TXT"
+
+
+def test_plan_applies_changes_in_order():
+    changes = [
+        changeset.normalize(change)
+        for change in [
+            {"action": "create", "type": "TXT", "name": "txt", "content": "value3"},
+            {"action": "create", "type": "TXT", "name": "txt", "content": "value1"},
+            {"action": "update", "identifier": "1", "content": "127.0.0.2"},
+            {"action": "delete", "type": "TXT", "name": "txt", "content": "value2"},
+        ]
+    ]
+
+    records, results = changeset.plan(RECORDS, changes, _full_name)
+
+    assert results == [True] * 4
+    assert sorted((record["type"], record["content"]) for record in records) == [
+        ("A", "127.0.0.2"),
+        ("TXT", "value1"),
+        ("TXT", "value3"),
+    ]
+
+
+def test_plan_raises_when_record_to_update_is_missing():
+    change = changeset.normalize(
+        {"action": "update", "type": "CNAME", "name": "www", "content": "example.net"}
+    )
+
+    with pytest.raises(ValueError):
+        changeset.plan(RECORDS, [change], _full_name)
+
+
+def test_touched_records_lists_only_targeted_record_sets():
+    lookups = []
+
+    def list_records(rtype, name):
+        lookups.append((rtype, name))
+        return [
+            record
+            for record in RECORDS
+            if (not rtype or record["type"] == rtype)
+            and (not name or record["name"] == _full_name(name))
+        ]
+
+    changes = [
+        changeset.normalize(change)
+        for change in [
+            {"action": "create", "type": "TXT", "name": "txt", "content": "value3"},
+            {"action": "delete", "type": "TXT", "name": "txt", "content": "value1"},
+            {"action": "delete", "name": "txt"},
+        ]
+    ]
+
+    records = changeset.touched_records(changes, list_records)
+
+    assert lookups == [("TXT", "txt"), (None, "txt")]
+    assert [record["id"] for record in records] == ["2", "3"]
+
+    lookups[:] = []
+    changeset.touched_records(
+        changes + [changeset.normalize({"action": "delete", "identifier": "1"})],
+        list_records,
+    )
+    assert lookups == [(None, None)]
+
+
+def test_diff_and_changed_rrsets_compare_records_by_value():
+    final = [
+        RECORDS[0],
+        {"type": "TXT", "name": "TXT.example.com.", "content": "value1"},
+        {"type": "MX", "name": "example.com", "content": "mail.example.com"},
+    ]
+
+    additions, deletions = changeset.diff(RECORDS, final)
+    changed = changeset.changed_rrsets(RECORDS, final)
+
+    assert [record["type"] for record in additions] == ["MX"]
+    assert [record["id"] for record in deletions] == ["3"]
+    assert [
+        (rtype, len(before), len(after)) for rtype, _, before, after in changed
+    ] == [
+        ("TXT", 2, 1),
+        ("MX", 0, 1),
+    ]
+
+
+def test_provider_submits_changes_in_one_batch():
+    provider = _provider(_BatchProvider)
+
+    results = provider.apply_changes(
+        [
+            {"action": "create", "type": "TXT", "name": "txt", "content": "value3"},
+            {"action": "delete", "identifier": "1"},
+        ]
+    )
+
+    assert results == [True, True]
+    assert len(provider.batches) == 1
+    assert [rrset[0] for rrset in provider.batches[0]] == ["A", "TXT"]
+
+
+def test_provider_without_bulk_api_applies_changes_one_by_one():
+    provider = _provider(_SequentialProvider)
+
+    results = provider.apply_changes(
+        [
+            {"action": "create", "type": "TXT", "name": "txt", "content": "value3"},
+            {"action": "delete", "identifier": "1"},
+        ]
+    )
+
+    assert results == [True, True]
+    assert provider.batches == [
+        ("create", "TXT", "txt", "value3"),
+        ("delete", "1", None, None, None),
+    ]
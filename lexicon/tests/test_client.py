@@ -1,7 +1,9 @@
 # pylint: disable=missing-docstring
 import os
 
+import mock
 import pytest
+import tldextract
 
 import lexicon.client
 from lexicon.config import ConfigResolver
@@ -182,4 +184,30 @@ def test_client_parse_env_with_auth_keys(monkeypatch):
     )
 
 
+def test_client_instances_share_one_offline_tld_extractor():
+    lexicon.client.get_registered_domain.cache_clear()
+    with mock.patch("lexicon.client._TLD_EXTRACTOR", None), mock.patch(
+        "lexicon.client.TLDEXTRACT_OFFLINE", True
+    ), mock.patch(
+        "lexicon.client.tldextract.TLDExtract", wraps=tldextract.TLDExtract
+    ) as mock_extract:
+        for domain in ["www.example.com", "www.example.com", "sub.example.co.uk"]:
+            options = {
+                "provider_name": "fakeprovider",
+                "action": "list",
+                "domain": domain,
+                "type": "TXT",
+            }
+            lexicon.client.Client(ConfigResolver().with_dict(options))
+
+        assert lexicon.client.get_registered_domain("sub.example.co.uk") == (
+            "example.co.uk"
+        )
+
+    mock_extract.assert_called_once()
+    assert mock_extract.call_args[1]["suffix_list_urls"] == ()
+    assert lexicon.client.get_registered_domain.cache_info().hits == 2
+    lexicon.client.get_registered_domain.cache_clear()
+
+
 # TODO: add tests for Provider loading?
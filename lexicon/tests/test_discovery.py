@@ -0,0 +1,94 @@
+"""Unit tests for the discovery of Lexicon providers and their availability"""
+from __future__ import absolute_import
+
+import mock
+import pytest
+
+from lexicon import discovery
+
+pytestmark = pytest.mark.skipif(
+    discovery.importlib_metadata is None, reason="Requires importlib.metadata."
+)
+
+
+class FakeMetadata(object):
+    def get_all(self, key):
+        assert key == "Provides-Extra"
+        return ["route53", "plesk", "gransy", "full"]
+
+
+class FakeDistribution(object):
+    def __init__(self, location):
+        self.version = "3.4.3"
+        self.metadata = FakeMetadata()
+        self.requires = [
+            "requests (>=2,<3)",
+            'boto3 (>=1,<2); extra == "route53" or extra == "full"',
+            'xmltodict (>=0,<1); extra == "plesk" or extra == "full"',
+            'zeep (>=3,<4); extra == "gransy" or extra == "full"',
+            'pywin32; sys_platform == "nonexistent" and extra == "plesk"',
+        ]
+        self._location = location
+
+    def locate_file(self, _):
+        return self._location
+
+
+@pytest.fixture
+def fake_distribution(monkeypatch, tmp_path):
+    monkeypatch.setenv("LEXICON_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(discovery, "_AVAILABILITY_INDEX", None)
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    distribution = FakeDistribution(str(site_packages))
+
+    def return_distribution(name):
+        if name == "dns-lexicon":
+            return distribution
+        if name == "xmltodict":
+            return mock.Mock(version="0.12.0")
+        if name == "zeep":
+            return mock.Mock(version="4.0.0")
+        raise discovery.importlib_metadata.PackageNotFoundError(name)
+
+    with mock.patch(
+        "lexicon.discovery.importlib_metadata.distribution",
+        side_effect=return_distribution,
+    ) as mock_distribution:
+        yield mock_distribution
+
+
+def test_find_providers_resolves_availability_from_extras(fake_distribution):
+    providers = discovery.find_providers()
+
+    assert providers["route53"] is False
+    if discovery.Requirement is not None:
+        # pywin32 is not installed, but not needed on this platform
+        assert providers["plesk"] is True
+    assert providers["cloudflare"] is True
+    if discovery.Requirement is not None:
+        # zeep is installed, but its version does not match the requirement
+        assert providers["gransy"] is False
+    assert "base" not in providers
+
+
+def test_find_providers_reuses_persistent_index(fake_distribution, monkeypatch):
+    discovery.find_providers()
+    monkeypatch.setattr(discovery, "_AVAILABILITY_INDEX", None)
+
+    with mock.patch("lexicon.discovery._resolve_extras") as mock_resolve:
+        providers = discovery.find_providers()
+
+    mock_resolve.assert_not_called()
+    assert providers["route53"] is False
+    assert providers["plesk"] is True
+
+
+def test_find_nameserver_domains_does_not_import_providers():
+    with mock.patch("lexicon.discovery.importlib.import_module") as mock_import:
+        nameserver_domains = discovery.find_nameserver_domains()
+
+    mock_import.assert_not_called()
+    assert "auto" not in nameserver_domains
+    assert nameserver_domains["ovh"] == ["ovh.net", "anycast.me"]
+    assert nameserver_domains["route53"][0].match("awsdns-12.org")
@@ -0,0 +1,96 @@
+"""Unit tests for the domain ids cached by providers between invocations"""
+from __future__ import absolute_import
+
+import time
+
+import pytest
+import requests
+
+from lexicon import cache
+from lexicon.config import ConfigResolver
+from lexicon.providers.base import Provider
+
+ZONES = {"example.com": "zone1"}
+
+
+class _ZonesProvider(Provider):
+    """Provider resolving its domain id from ZONES, and counting the resolutions"""
+
+    resolutions = 0
+
+    def _authenticate(self):
+        self.domain_id = self._get_cached_domain_id()
+        if self.domain_id:
+            return
+        _ZonesProvider.resolutions += 1
+        self.domain_id = ZONES[self.domain]
+        self._cache_domain_id(self.domain_id)
+
+    def _list_records(self, rtype=None, name=None, content=None):
+        if self.domain_id != ZONES[self.domain]:
+            response = requests.Response()
+            response.status_code = 404
+            raise requests.exceptions.HTTPError("Not found", response=response)
+        return [{"zone": self.domain_id}]
+
+
+@pytest.fixture(autouse=True)
+def zones():
+    ZONES["example.com"] = "zone1"
+    _ZonesProvider.resolutions = 0
+
+
+def _provider(**options):
+    options.update({"provider_name": "fake", "domain": "example.com"})
+    provider = _ZonesProvider(ConfigResolver().with_dict(options))
+    provider.authenticate()
+    return provider
+
+
+def test_cache_entries_expire():
+    cache.set_entry("entries", "valid", "value1", time.time() + 60)
+    cache.set_entry("entries", "expiring", "value2", time.time() + 1)
+    cache.set_entry("entries", "expired", "value3", time.time() - 1)
+
+    assert cache.get_entry("entries", "valid") == "value1"
+    assert cache.get_entry("entries", "expiring") == "value2"
+    assert cache.get_entry("entries", "expiring", margin=10) is None
+    assert cache.get_entry("entries", "expired") is None
+
+    cache.delete_entry("entries", "valid")
+
+    assert sorted(cache.load("entries")) == ["expiring"]
+
+
+def test_provider_reuses_domain_id_resolved_by_previous_invocation():
+    _provider()
+    provider = _provider()
+
+    assert provider.domain_id == "zone1"
+    assert _ZonesProvider.resolutions == 1
+
+
+def test_provider_resolves_stale_domain_id_once_and_retries_operation():
+    _provider()
+    ZONES["example.com"] = "zone2"
+    provider = _provider()
+
+    assert provider.list_records() == [{"zone": "zone2"}]
+    assert _ZonesProvider.resolutions == 2
+    assert _provider().domain_id == "zone2"
+
+
+def test_provider_does_not_resolve_again_a_domain_id_not_cached():
+    provider = _provider()
+    ZONES["example.com"] = "zone2"
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        provider.list_records()
+    assert _ZonesProvider.resolutions == 1
+
+
+def test_provider_domain_id_cache_can_be_disabled():
+    _provider(domain_id_cache_ttl="0")
+    _provider(domain_id_cache_ttl="0")
+
+    assert _ZonesProvider.resolutions == 2
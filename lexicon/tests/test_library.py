@@ -9,13 +9,16 @@ from __future__ import absolute_import, print_function
 
 import contextlib
 import importlib
+import io
 import pkgutil
+import threading
+import time
 from types import ModuleType
 
 import mock
 import pytest
 
-from lexicon.client import ProviderNotAvailableError
+from lexicon.client import ProviderNotAvailableError, load_operations
 from lexicon.config import ConfigResolver
 from lexicon.providers.base import Provider as BaseProvider
 
@@ -312,3 +315,195 @@ def test_delete_action_is_correctly_handled_by_provider(capsys, lexicon_client):
     assert results["type"] == "TXT"
     assert results["name"] == "fake"
     assert results["content"] == "fake-content"
+
+
+def test_batch_operations_share_authentication_by_domain(capsys, lexicon_client):
+    operations = [
+        {
+            "action": "create",
+            "provider_name": "fakeprovider",
+            "domain": "www.example.com",
+            "type": "TXT",
+            "name": "fake",
+            "content": "fake-content",
+        },
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "example.net",
+            "type": "TXT",
+        },
+        {
+            "action": "delete",
+            "provider_name": "fakeprovider",
+            "domain": "example.com",
+            "type": "TXT",
+            "name": "fake",
+            "content": "fake-content",
+        },
+    ]
+    results = lexicon_client.Client.execute_batch(operations, ConfigResolver())
+
+    out, _ = capsys.readouterr()
+
+    assert out.count("Authenticate action") == 2
+    assert [result["action"] for result in results] == ["create", "list", "delete"]
+    assert [result["domain"] for result in results] == [
+        "example.com",
+        "example.net",
+        "example.com",
+    ]
+    assert results[1]["name"] is None
+    assert results[2]["content"] == "fake-content"
+
+
+def test_batch_operations_are_validated(lexicon_client):
+    operations = [
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "example.com",
+            "type": "TXT",
+        },
+        {"provider_name": "fakeprovider", "domain": "example.com", "type": "TXT"},
+    ]
+    with pytest.raises(AttributeError):
+        lexicon_client.Client.execute_batch(operations, ConfigResolver())
+
+
+def test_batch_transaction_applies_changes_around_list_operations(lexicon_client):
+    operations = [
+        {
+            "action": action,
+            "provider_name": "fakeprovider",
+            "domain": "example.com",
+            "type": "TXT",
+            "name": "fake",
+            "content": "fake-content",
+        }
+        for action in ("create", "delete", "list", "create")
+    ]
+    with mock.patch.object(
+        Provider, "apply_changes", side_effect=lambda changes: [True] * len(changes)
+    ) as apply_changes:
+        results = lexicon_client.Client.execute_batch(
+            operations, ConfigResolver(), transaction=True
+        )
+
+    assert [len(call[0][0]) for call in apply_changes.call_args_list] == [2, 1]
+    assert results[:2] == [True, True]
+    assert results[2]["action"] == "list"
+    assert results[3] is True
+
+
+def test_many_operations_return_outcomes_in_order(capsys, lexicon_client):
+    operations = [
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "domain{0}.com".format(index % 3),
+            "type": "TXT",
+        }
+        for index in range(6)
+    ]
+    operations.insert(2, {"provider_name": "fakeprovider", "domain": "domain0.com"})
+
+    outcomes = lexicon_client.Client.execute_many(operations, ConfigResolver())
+
+    out, _ = capsys.readouterr()
+
+    assert out.count("Authenticate action") == 3
+    assert outcomes[2] == {"error": "action", "error_type": "AttributeError"}
+    assert [
+        outcome["result"]["domain"] for outcome in outcomes if "result" in outcome
+    ] == ["domain{0}.com".format(index % 3) for index in range(6)]
+
+
+def test_many_operations_respect_per_provider_limit(lexicon_client):
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def authenticate(_):
+        with lock:
+            running.append(True)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    operations = [
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "domain{0}.com".format(index),
+            "type": "TXT",
+        }
+        for index in range(6)
+    ]
+    with mock.patch.object(Provider, "_authenticate", authenticate):
+        outcomes = lexicon_client.Client.execute_many(
+            operations, ConfigResolver(), max_workers=6, per_provider_limit=2
+        )
+
+    assert all("result" in outcome for outcome in outcomes)
+    assert max(max_running) == 2
+
+
+def test_many_operations_respect_per_account_limit(lexicon_client):
+    running = {}
+    max_running = {}
+    lock = threading.Lock()
+
+    def authenticate(provider):
+        account = provider._get_provider_option("auth_token")
+        with lock:
+            running[account] = running.get(account, 0) + 1
+            max_running[account] = max(max_running.get(account, 0), running[account])
+        time.sleep(0.05)
+        with lock:
+            running[account] -= 1
+
+    operations = [
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "domain{0}.com".format(index),
+            "type": "TXT",
+            "fakeprovider": {"auth_token": "account{0}".format(index % 2)},
+        }
+        for index in range(6)
+    ]
+    with mock.patch.object(Provider, "_authenticate", authenticate):
+        outcomes = lexicon_client.Client.execute_many(
+            operations,
+            ConfigResolver(),
+            max_workers=6,
+            per_provider_limit=4,
+            per_account_limit=1,
+        )
+
+    assert all("result" in outcome for outcome in outcomes)
+    assert max_running == {"account0": 1, "account1": 1}
+
+
+def test_load_operations_from_json_lines_or_yaml():
+    json_lines = io.StringIO(
+        '{"action": "list", "domain": "example.com"}\n'
+        "\n"
+        '{"action": "create", "domain": "example.net"}\n'
+    )
+    yaml_documents = io.StringIO(
+        "action: list\n"
+        "domain: example.com\n"
+        "---\n"
+        "- action: create\n"
+        "  domain: example.net\n"
+    )
+
+    expected = [
+        {"action": "list", "domain": "example.com"},
+        {"action": "create", "domain": "example.net"},
+    ]
+    assert load_operations(json_lines) == expected
+    assert load_operations(yaml_documents) == expected
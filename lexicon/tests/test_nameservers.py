@@ -0,0 +1,46 @@
+"""Unit tests for the in-process resolution of nameservers"""
+from __future__ import absolute_import
+
+import mock
+import pytest
+
+from lexicon import nameservers
+
+StubDnsServer = pytest.importorskip("lexicon.tests.stub_dns_server").StubDnsServer
+
+RECORDS = {("example.com.", "NS"): (300, ["ns1.example.net.", "NS2.example.net."])}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("LEXICON_CACHE_DIR", str(tmp_path))
+
+
+def test_get_nameservers_queries_dns_server():
+    with StubDnsServer(RECORDS) as server:
+        result = nameservers.get_nameservers("example.com", server.resolver())
+
+    assert sorted(result) == ["ns1.example.net", "ns2.example.net"]
+    assert server.queries == [("example.com.", "NS")]
+
+
+def test_get_nameservers_reuses_cache_until_ttl_expires():
+    with StubDnsServer(RECORDS) as server:
+        with mock.patch("lexicon.nameservers.time.time", return_value=1000):
+            nameservers.get_nameservers("example.com", server.resolver())
+        with mock.patch("lexicon.nameservers.time.time", return_value=1299):
+            cached = nameservers.get_nameservers("example.com", server.resolver())
+
+        assert sorted(cached) == ["ns1.example.net", "ns2.example.net"]
+        assert len(server.queries) == 1
+
+        with mock.patch("lexicon.nameservers.time.time", return_value=1301):
+            nameservers.get_nameservers("example.com", server.resolver())
+
+        assert len(server.queries) == 2
+
+
+def test_get_nameservers_raises_error_for_unknown_domain():
+    with StubDnsServer(RECORDS) as server:
+        with pytest.raises(ValueError):
+            nameservers.get_nameservers("unknown.com", server.resolver())
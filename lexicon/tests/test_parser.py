@@ -1,6 +1,9 @@
 """Unit tests for the Lexicon CLI parser"""
 from __future__ import absolute_import
 
+import importlib
+
+import mock
 import pytest
 
 from lexicon import parser
@@ -42,3 +45,28 @@ def test_cli_main_parser_without_args():
     baseparser = parser.generate_cli_main_parser()
     with pytest.raises(SystemExit):
         baseparser.parse_args([])
+
+
+def test_cli_main_parser_imports_only_selected_provider():
+    with mock.patch(
+        "lexicon.parser.importlib.import_module", wraps=importlib.import_module
+    ) as mock_import:
+        baseparser = parser.generate_cli_main_parser()
+        mock_import.assert_not_called()
+
+        parsed = baseparser.parse_args(
+            ["cloudflare", "list", "capsulecd.com", "TXT", "--auth-token", "TOKEN"]
+        )
+
+    mock_import.assert_called_once_with("lexicon.providers.cloudflare")
+    assert parsed.auth_token == "TOKEN"
+
+
+def test_cli_main_parser_help_lists_all_providers(capsys):
+    baseparser = parser.generate_cli_main_parser()
+    with pytest.raises(SystemExit):
+        baseparser.parse_args(["--help"])
+
+    out, _ = capsys.readouterr()
+    assert "cloudflare" in out
+    assert "route53" in out
@@ -0,0 +1,173 @@
+"""Unit tests for the wait of records propagation to authoritative nameservers"""
+from __future__ import absolute_import
+
+import threading
+
+import mock
+import pytest
+
+from lexicon import propagation
+from lexicon.client import Client
+from lexicon.config import ConfigResolver
+
+StubDnsServer = pytest.importorskip("lexicon.tests.stub_dns_server").StubDnsServer
+dns_rrset = pytest.importorskip("dns.rrset")
+
+ZONE_RECORDS = {
+    ("example.com.", "NS"): (300, ["ns1.example.com.", "ns2.example.com."]),
+    ("ns1.example.com.", "A"): (300, ["127.0.0.1"]),
+    ("ns2.example.com.", "A"): (300, ["127.0.0.1"]),
+}
+CHALLENGE = ("_acme-challenge.example.com.", "TXT")
+
+
+def test_wait_for_propagation_returns_once_record_is_visible():
+    with StubDnsServer(dict(ZONE_RECORDS)) as server:
+        timer = threading.Timer(
+            0.2, server.records.__setitem__, (CHALLENGE, (60, ['"challenge"']))
+        )
+        timer.start()
+        assert propagation.wait_for_propagation(
+            "example.com",
+            "TXT",
+            "_acme-challenge.example.com",
+            "challenge",
+            timeout=5,
+            resolver=server.resolver(),
+        )
+        timer.join()
+
+    assert server.queries.count(CHALLENGE) >= 2
+
+
+def test_wait_for_propagation_of_a_deletion():
+    records = dict(ZONE_RECORDS)
+    records[CHALLENGE] = (60, ['"other"'])
+    with StubDnsServer(records) as server:
+        assert propagation.wait_for_propagation(
+            "example.com",
+            "TXT",
+            "_acme-challenge.example.com",
+            "challenge",
+            present=False,
+            timeout=5,
+            resolver=server.resolver(),
+        )
+
+    # One query to each nameserver
+    assert server.queries.count(CHALLENGE) == 2
+
+
+def test_wait_for_propagation_ignores_nameserver_errors():
+    real_udp = propagation.dns.query.udp
+
+    def udp(query, *args, **kwargs):
+        response = real_udp(query, *args, **kwargs)
+        if query.question[0].name.to_text() == CHALLENGE[0]:
+            response.set_rcode(propagation.dns.rcode.SERVFAIL)
+        return response
+
+    with StubDnsServer(dict(ZONE_RECORDS)) as server:
+        with mock.patch.object(propagation.dns.query, "udp", side_effect=udp):
+            with pytest.raises(propagation.PropagationTimeoutError):
+                propagation.wait_for_propagation(
+                    "example.com",
+                    "TXT",
+                    "_acme-challenge.example.com",
+                    present=False,
+                    timeout=0.2,
+                    resolver=server.resolver(),
+                )
+
+
+def test_wait_for_propagation_retries_truncated_answers_over_tcp():
+    real_udp = propagation.dns.query.udp
+
+    def udp(query, *args, **kwargs):
+        response = real_udp(query, *args, **kwargs)
+        if query.question[0].name.to_text() == CHALLENGE[0]:
+            response.flags |= propagation.dns.flags.TC
+        return response
+
+    def tcp(query, *args, **kwargs):
+        response = propagation.dns.message.make_response(query)
+        response.answer.append(
+            dns_rrset.from_text_list(CHALLENGE[0], 60, "IN", "TXT", ['"challenge"'])
+        )
+        return response
+
+    with StubDnsServer(dict(ZONE_RECORDS)) as server:
+        with mock.patch.object(
+            propagation.dns.query, "udp", side_effect=udp
+        ), mock.patch.object(
+            propagation.dns.query, "tcp", side_effect=tcp
+        ) as tcp_query:
+            assert propagation.wait_for_propagation(
+                "example.com",
+                "TXT",
+                "_acme-challenge.example.com",
+                "challenge",
+                timeout=5,
+                resolver=server.resolver(),
+            )
+
+    assert tcp_query.call_count == 2
+
+
+def test_wait_for_propagation_queries_ipv6_only_nameservers():
+    records = dict(ZONE_RECORDS)
+    del records[("ns2.example.com.", "A")]
+    records[("ns2.example.com.", "AAAA")] = (300, ["::1"])
+    with StubDnsServer(records) as server:
+        resolver = server.resolver()
+        addresses = propagation._get_nameservers_addresses("example.com", resolver)
+
+    assert addresses == {
+        "ns1.example.com": ["127.0.0.1"],
+        "ns2.example.com": ["::1"],
+    }
+    assert ("ns2.example.com.", "AAAA") in server.queries
+
+
+def test_wait_for_propagation_fails_at_timeout():
+    with StubDnsServer(dict(ZONE_RECORDS)) as server:
+        with pytest.raises(propagation.PropagationTimeoutError):
+            propagation.wait_for_propagation(
+                "example.com",
+                "TXT",
+                "_acme-challenge.example.com",
+                timeout=0.2,
+                resolver=server.resolver(),
+            )
+
+
+def test_client_waits_for_propagation_when_enabled():
+    config = ConfigResolver().with_dict(
+        {
+            "provider_name": "localzone",
+            "action": "create",
+            "domain": "www.example.com",
+            "type": "TXT",
+            "name": "_acme-challenge",
+            "content": "challenge",
+            "wait_propagation": True,
+            "propagation_timeout": 10,
+        }
+    )
+    client = Client(config)
+
+    with mock.patch.object(
+        client.provider, "create_record", return_value=True
+    ), mock.patch(
+        "lexicon.propagation.wait_for_propagation", return_value=True
+    ) as wait_for_propagation:
+        assert client._execute_action("create")
+
+    wait_for_propagation.assert_called_once_with(
+        "example.com",
+        "TXT",
+        "_acme-challenge.example.com",
+        "challenge",
+        True,
+        10.0,
+    )
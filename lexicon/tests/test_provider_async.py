@@ -0,0 +1,199 @@
+"""Unit tests for the asynchronous Provider API"""
+from __future__ import absolute_import
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lexicon.config import ConfigResolver
+from lexicon.providers import base, cloudflare, digitalocean, hetzner
+from lexicon.tests.providers import test_cloudflare, test_digitalocean, test_hetzner
+from lexicon.tests.providers.integration_tests import PROVIDER_VCR
+
+
+class SyncProvider(base.Provider):
+    """Provider implementing only the synchronous API"""
+
+    def __init__(self, config):
+        super(SyncProvider, self).__init__(config)
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def _authenticate(self):
+        self.domain_id = threading.current_thread().name
+
+    def _list_records(self, rtype=None, name=None, content=None):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return [{"type": rtype, "name": name, "content": content}]
+
+
+@pytest.fixture
+def sync_provider():
+    return SyncProvider(
+        ConfigResolver().with_dict({"provider_name": "sync", "domain": "example.com"})
+    )
+
+
+def test_sync_provider_is_executed_in_thread_pool(sync_provider):
+    asyncio.run(sync_provider.async_authenticate())
+
+    assert sync_provider.domain_id.startswith("lexicon-async")
+
+
+def test_sync_provider_concurrency_is_bounded(sync_provider, monkeypatch):
+    monkeypatch.setattr(base, "_ASYNC_EXECUTOR", ThreadPoolExecutor(max_workers=2))
+
+    async def list_many():
+        return await asyncio.gather(
+            *[sync_provider.async_list_records("TXT", str(i)) for i in range(6)]
+        )
+
+    results = asyncio.run(list_many())
+
+    assert [result[0]["name"] for result in results] == [str(i) for i in range(6)]
+    assert sync_provider.max_running == 2
+
+
+@pytest.mark.parametrize(
+    "provider_module,domain",
+    [
+        (cloudflare, "pacalis.net"),
+        (digitalocean, "foxwoodswebsites.com"),
+        (hetzner, "hetzner-api-test.de"),
+    ],
+)
+def test_native_async_providers_list_records(provider_module, domain, monkeypatch):
+    pytest.importorskip("aiohttp")
+    provider_name = provider_module.__name__.split(".")[-1]
+    provider = provider_module.Provider(
+        ConfigResolver().with_dict(
+            {
+                "provider_name": provider_name,
+                "domain": domain,
+                provider_name: {"auth_token": "placeholder_auth_token"},
+            }
+        )
+    )
+    cassette = "{0}/IntegrationTests/{1}.yaml".format(
+        provider_name,
+        "test_provider_when_calling_list_records_with_no_arguments_should_list_all",
+    )
+
+    async def list_records():
+        try:
+            await provider.async_authenticate()
+            return await provider.async_list_records()
+        finally:
+            await provider.async_close()
+
+    # Synchronous HTTP requests must not be used by native implementations.
+    monkeypatch.setattr(provider, "_request", None)
+    with PROVIDER_VCR.use_cassette(cassette) as recorded:
+        records = asyncio.run(list_records())
+
+    assert provider._has_native_async()
+    assert recorded.play_count > 0
+    assert isinstance(records, list)
+    assert records
+
+
+def test_async_http_requests_use_configured_timeout():
+    pytest.importorskip("aiohttp")
+    provider = base.Provider(
+        ConfigResolver().with_dict(
+            {"provider_name": "fake", "domain": "example.com", "http_timeout": "7.5"}
+        )
+    )
+
+    timeout = provider._get_async_http_timeout()
+
+    assert timeout.sock_connect == 7.5
+    assert timeout.sock_read == 7.5
+
+
+class _AsyncToSyncProvider(object):
+    """
+    Expose the synchronous Provider API of a native asynchronous provider, executing it
+    through the asynchronous API, so the integration tests can be replayed with it.
+    """
+
+    def __init__(self, provider):
+        assert provider._has_native_async()
+        # Synchronous HTTP requests must not be used by native implementations.
+        provider._request = None
+        self._provider = provider
+        self._loop = asyncio.new_event_loop()
+
+    def __getattr__(self, name):
+        return getattr(self._provider, name)
+
+    def authenticate(self):
+        return self._run(self._provider.async_authenticate())
+
+    def create_record(self, *args, **kwargs):
+        return self._run(self._provider.async_create_record(*args, **kwargs))
+
+    def list_records(self, *args, **kwargs):
+        return self._run(self._provider.async_list_records(*args, **kwargs))
+
+    def update_record(self, *args, **kwargs):
+        return self._run(self._provider.async_update_record(*args, **kwargs))
+
+    def delete_record(self, *args, **kwargs):
+        return self._run(self._provider.async_delete_record(*args, **kwargs))
+
+    def close(self):
+        self._run(self._provider.async_close())
+        self._loop.close()
+
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+
+class _AsyncIntegrationTests(object):
+    """Replay the integration tests of a provider through its native asynchronous API"""
+
+    def setup_method(self, method):
+        pytest.importorskip("aiohttp")
+        super(_AsyncIntegrationTests, self).setup_method(method)
+        self._async_providers = []
+        provider_class = self.provider_module.Provider
+
+        def create_provider(config):
+            self._async_providers.append(_AsyncToSyncProvider(provider_class(config)))
+            return self._async_providers[-1]
+
+        self.provider_module = type(
+            "AsyncProviderModule", (object,), {"Provider": staticmethod(create_provider)}
+        )
+
+    def teardown_method(self, _):
+        for provider in self._async_providers:
+            provider.close()
+
+
+class TestCloudflareAsyncProvider(
+    _AsyncIntegrationTests, test_cloudflare.CloudflareProviderTests
+):
+    pass
+
+
+class TestDigitalOceanAsyncProvider(
+    _AsyncIntegrationTests, test_digitalocean.DigitalOceanProviderTests
+):
+    pass
+
+
+class TestHetznerAsyncProvider(
+    _AsyncIntegrationTests, test_hetzner.HetznerProviderTests
+):
+    pass
@@ -0,0 +1,223 @@
+"""Unit tests for the HTTP session shared by the requests of a provider"""
+from __future__ import absolute_import
+
+import gc
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from lexicon.config import ConfigResolver
+from lexicon.providers.base import Provider
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super(_KeepAliveHandler, self).setup()
+        self.server.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests += 1
+        if self.server.failures:
+            self.server.failures -= 1
+            body = b'{"ok": false}'
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        else:
+            body = b'{"ok": true}'
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def server():
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    http_server.daemon_threads = True
+    http_server.connections = 0
+    http_server.requests = 0
+    http_server.failures = 0
+    thread = threading.Thread(target=http_server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield http_server
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
+
+
+@pytest.fixture
+def provider_factory(server):
+    providers = []
+
+    def factory(**options):
+        providers.append(_provider(**options))
+        return providers[-1]
+
+    factory.url = "http://127.0.0.1:{0}/".format(server.server_address[1])
+    try:
+        yield factory
+    finally:
+        # Close the kept-alive connections before the server is shut down.
+        for provider in providers:
+            provider.close()
+
+
+def _provider(**options):
+    options.update({"provider_name": "fake", "domain": "example.com"})
+    return Provider(ConfigResolver().with_dict(options))
+
+
+def test_provider_requests_reuse_connections(server, provider_factory):
+    provider = provider_factory()
+    url = provider_factory.url
+
+    for _ in range(3):
+        assert provider._get_http_session().get(url).json() == {"ok": True}
+
+    assert provider._get_http_session() is provider._get_http_session()
+    assert server.connections == 1
+
+
+def test_provider_session_uses_configured_pool_size_and_timeout():
+    provider = _provider(http_pool_size="3", http_timeout="7.5")
+
+    adapter = provider._get_http_session().get_adapter("https://example.com")
+
+    assert adapter.timeout == 7.5
+    assert adapter._pool_maxsize == 3
+
+
+def test_provider_session_has_no_timeout_by_default():
+    adapter = _provider()._get_http_session().get_adapter("https://example.com")
+
+    assert adapter.timeout is None
+
+
+def test_provider_session_retries_rate_limited_requests(server, provider_factory):
+    provider = provider_factory()
+    url = provider_factory.url
+    server.failures = 2
+
+    assert provider._get_http_session().get(url).json() == {"ok": True}
+    assert server.requests == 3
+    assert server.connections == 1
+
+
+def test_provider_session_gives_up_after_max_retries(server, provider_factory):
+    provider = provider_factory(http_max_retries="1")
+    url = provider_factory.url
+    server.failures = 5
+
+    assert provider._get_http_session().get(url).status_code == 429
+    assert server.requests == 2
+
+
+def test_provider_retry_policy_uses_provider_defaults_and_options():
+    provider = _provider(http_backoff_factor="2", http_rate_limit="4")
+
+    policy = provider._get_retry_policy()
+
+    assert policy.max_retries == Provider.HTTP_MAX_RETRIES
+    assert policy.backoff_factor == 2
+    assert policy.rate_limiter.rate == 4
+    assert _provider()._get_retry_policy().rate_limiter is None
+
+
+def test_provider_is_released_with_its_session():
+    provider = _provider()
+    provider._get_http_session()
+    reference = weakref.ref(provider)
+
+    gc.disable()
+    try:
+        del provider
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+def test_provider_close_releases_the_session():
+    provider = _provider()
+    session = provider._get_http_session()
+
+    provider.close()
+
+    assert provider._http_session is None
+    assert provider._get_http_session() is not session
+
+
+def test_provider_retries_unavailable_responses_only_for_idempotent_methods():
+    provider = _provider()
+    response = requests.Response()
+    response.status_code = 503
+
+    for method, retryable in (("GET", True), ("DELETE", True), ("POST", False)):
+        response.request = requests.Request(method, "https://example.com").prepare()
+        assert provider._is_retryable_response(response) is retryable
+
+    response.status_code = 429
+    assert provider._is_retryable_response(response)
+
+
+def test_provider_session_retries_network_errors():
+    provider = _provider(http_max_retries="3")
+
+    adapter = provider._get_http_session().get_adapter("https://example.com")
+
+    assert adapter.max_retries.connect == 3
+    assert adapter.max_retries.read == 3
+    assert adapter.max_retries.status == 0
+
+
+def provider_parser(subparser):
+    """Parser of _SecretProvider, found by the base Provider in this module"""
+    subparser.add_argument("--auth-secret")
+
+
+class _SecretProvider(Provider):
+    pass
+
+
+def test_provider_rate_limit_key_includes_provider_credentials():
+    def _key(**options):
+        config = ConfigResolver().with_dict(
+            {"provider_name": "secret", "domain": "example.com", "secret": options}
+        )
+        return _SecretProvider(config)._rate_limit_key()
+
+    assert _key(auth_secret="a") != _key(auth_secret="b")
+    assert _key(auth_secret="a") == _key(auth_secret="a")
+
+
+def test_provider_fetches_pages_concurrently_in_order():
+    provider = Provider(ConfigResolver().with_dict({"page_fetch_concurrency": "3"}))
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch_page(page):
+        barrier.wait()
+        return page * 10
+
+    assert provider._fetch_pages(fetch_page, [2, 3, 4]) == [20, 30, 40]
+
+
+def test_provider_fetches_pages_one_by_one_when_concurrency_is_disabled():
+    provider = Provider(ConfigResolver().with_dict({"page_fetch_concurrency": "1"}))
+    threads = set()
+
+    def fetch_page(page):
+        threads.add(threading.current_thread())
+        return page
+
+    assert provider._fetch_pages(fetch_page, range(2, 6)) == [2, 3, 4, 5]
+    assert threads == {threading.current_thread()}
@@ -0,0 +1,92 @@
+"""Unit tests for the retry policy and rate limiter of HTTP requests"""
+from __future__ import absolute_import
+
+import email.utils
+import time
+
+import requests
+
+from lexicon import retry
+
+
+def _response(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+def _policy(**kwargs):
+    return retry.RetryPolicy(lambda response: response.status_code == 429, **kwargs)
+
+
+def test_policy_retries_retryable_responses_up_to_max_retries():
+    policy = _policy(max_retries=2)
+
+    assert policy.should_retry(0, _response(429))
+    assert policy.should_retry(1, _response(429))
+    assert not policy.should_retry(2, _response(429))
+    assert not policy.should_retry(0, _response(400))
+
+
+def test_policy_backoff_is_exponential_with_jitter_and_bounded():
+    policy = _policy(backoff_factor=1, backoff_max=5)
+
+    for attempt, upper in ((0, 1), (1, 2), (2, 4), (10, 5)):
+        delays = [policy.delay(attempt, _response(429)) for _ in range(50)]
+        assert all(0 <= delay <= upper for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_policy_backoff_without_jitter_waits_the_whole_delay():
+    policy = _policy(backoff_factor=0.6, backoff_max=310, jitter=False)
+
+    assert [policy.delay(attempt, _response(429)) for attempt in (0, 1, 9, 10)] == [
+        0.6,
+        1.2,
+        307.2,
+        310,
+    ]
+
+
+def test_policy_honours_retry_after_header():
+    policy = _policy(backoff_factor=100)
+
+    assert policy.delay(3, _response(429, retry_after="2")) == 2
+    assert policy.delay(0, _response(429, retry_after="3600")) == retry.RETRY_AFTER_MAX
+
+
+def test_parse_retry_after():
+    http_date = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+    assert retry.parse_retry_after("1.5") == 1.5
+    assert 55 < retry.parse_retry_after(http_date) <= 60
+    assert retry.parse_retry_after("garbage") is None
+    assert retry.parse_retry_after(None) is None
+
+
+def test_token_bucket_allows_burst_then_delays():
+    bucket = retry.TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_rate_limiters_are_shared_by_key():
+    limiter = retry.get_rate_limiter(("test", "key"), 1)
+
+    assert retry.get_rate_limiter(("test", "key"), 5) is limiter
+    assert retry.get_rate_limiter(("test", "other"), 1) is not limiter
+
+
+def test_policy_retries_network_errors_of_unsent_or_idempotent_requests():
+    policy = _policy(max_retries=1)
+
+    assert policy.should_retry_error(0, "POST", request_sent=False)
+    assert policy.should_retry_error(0, "get")
+    assert not policy.should_retry_error(0, "POST")
+    assert not policy.should_retry_error(1, "GET", request_sent=False)
+    assert 0 <= policy.delay(0) <= policy.backoff_factor
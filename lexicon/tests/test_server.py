@@ -0,0 +1,211 @@
+"""Unit tests for the Lexicon server, using the fake provider of the library tests"""
+from __future__ import absolute_import
+
+import json
+import os
+import socket
+import stat
+import threading
+import time
+
+import mock
+import pytest
+import requests
+
+from lexicon.config import ConfigResolver
+from lexicon.client import operation_group_key
+from lexicon.server import ProviderPool, create_server
+from lexicon.tests.test_library import Provider, mock_fake_provider
+
+
+@pytest.fixture
+def server():
+    with mock_fake_provider():
+        lexicon_server = create_server(ConfigResolver(), token=TOKEN, idle_timeout=60)
+        thread = threading.Thread(target=lexicon_server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            yield lexicon_server
+        finally:
+            lexicon_server.shutdown()
+            lexicon_server.server_close()
+
+
+TOKEN = "secret-token"
+AUTHORIZATION = {"Authorization": "Bearer " + TOKEN}
+
+
+def _url(server):
+    return "http://{0}:{1}/".format(*server.server_address)
+
+
+def _post(server, **kwargs):
+    return requests.post(_url(server), headers=AUTHORIZATION, **kwargs)
+
+
+def test_server_reuses_authenticated_provider(server, capsys):
+    operation = {
+        "action": "create",
+        "provider_name": "fakeprovider",
+        "domain": "example.com",
+        "type": "TXT",
+        "name": "fake",
+        "content": "fake-content",
+    }
+
+    first = _post(server, json=operation)
+    second = _post(server, json=dict(operation, action="list"))
+
+    out, _ = capsys.readouterr()
+
+    assert first.status_code == 200
+    assert first.json()["result"]["action"] == "create"
+    assert second.json()["result"]["action"] == "list"
+    assert out.count("Authenticate action") == 1
+    assert len(server.pool) == 1
+
+
+def test_server_rejects_invalid_requests(server):
+    response = _post(server, data="not json")
+    assert response.status_code == 400
+
+    response = _post(
+        server, json={"provider_name": "fakeprovider", "domain": "example.com"}
+    )
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_server_rejects_unauthenticated_requests(server, capsys):
+    operation = {
+        "action": "list",
+        "provider_name": "fakeprovider",
+        "domain": "example.com",
+        "type": "TXT",
+    }
+
+    missing = requests.post(_url(server), json=operation)
+    invalid = requests.post(
+        _url(server), json=operation, headers={"Authorization": "Bearer wrong"}
+    )
+
+    assert missing.status_code == 401
+    assert invalid.status_code == 401
+    assert "Authenticate action" not in capsys.readouterr()[0]
+
+
+def test_server_requires_token_on_tcp_port():
+    with pytest.raises(ValueError):
+        create_server(ConfigResolver(), host="0.0.0.0")
+
+
+def test_pool_does_not_use_evicted_entries():
+    operation = {
+        "action": "list",
+        "provider_name": "fakeprovider",
+        "domain": "example.com",
+        "type": "TXT",
+    }
+
+    with mock_fake_provider():
+        pool = ProviderPool(ConfigResolver())
+        pool.execute(operation)
+        key = operation_group_key(pool.config, operation)
+        evicted = pool._entries[key]
+
+        # Entry is evicted while an operation waits for its lock.
+        evicted.lock.acquire()
+        thread = threading.Thread(target=pool.execute, args=(operation,))
+        thread.start()
+        time.sleep(0.1)
+        with pool._lock:
+            del pool._entries[key]
+        evicted.session = None
+        evicted.lock.release()
+        thread.join()
+
+    assert evicted.session is None
+    assert pool._entries[key] is not evicted
+    assert len(pool) == 1
+
+
+def test_server_evicts_idle_providers(server):
+    operation = {
+        "action": "list",
+        "provider_name": "fakeprovider",
+        "domain": "example.com",
+        "type": "TXT",
+    }
+    _post(server, json=operation)
+
+    server.pool.evict_idle(now=time.time() + 30)
+    assert len(server.pool) == 1
+
+    with mock.patch.object(Provider, "close") as mock_close:
+        server.pool.evict_idle(now=time.time() + 61)
+    assert len(server.pool) == 0
+    mock_close.assert_called_once_with()
+
+
+def test_server_reports_provider_errors_as_server_errors(server):
+    operation = {
+        "action": "list",
+        "provider_name": "fakeprovider",
+        "domain": "example.com",
+        "type": "TXT",
+    }
+
+    with mock.patch.object(
+        Provider, "_list_records", side_effect=AttributeError("bug")
+    ), mock.patch.object(Provider, "close") as mock_close:
+        response = _post(server, json=operation)
+
+    assert response.status_code == 500
+    assert response.json() == {"error": "bug"}
+    mock_close.assert_called_once_with()
+    assert len(server.pool) == 0
+
+    response = _post(server, json=dict(operation, action="unknown"))
+    assert response.status_code == 400
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Requires Unix sockets.")
+def test_server_listens_on_unix_socket(tmp_path):
+    socket_path = str(tmp_path / "lexicon.sock")
+    body = json.dumps(
+        {
+            "action": "list",
+            "provider_name": "fakeprovider",
+            "domain": "example.com",
+            "type": "TXT",
+        }
+    ).encode("utf-8")
+
+    with mock_fake_provider():
+        lexicon_server = create_server(ConfigResolver(), socket_path=socket_path)
+        thread = threading.Thread(target=lexicon_server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(socket_path)
+            client.sendall(
+                b"POST / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                + "Content-Length: {0}\r\n\r\n".format(len(body)).encode("utf-8")
+                + body
+            )
+            response = b""
+            chunk = client.recv(65535)
+            while chunk:
+                response += chunk
+                chunk = client.recv(65535)
+            client.close()
+        finally:
+            lexicon_server.shutdown()
+            lexicon_server.server_close()
+
+    status_line, _, content = response.partition(b"\r\n\r\n")
+    assert status_line.startswith(b"HTTP/1.1 200")
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    assert json.loads(content.decode("utf-8"))["result"]["action"] == "list"
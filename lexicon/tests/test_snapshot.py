@@ -0,0 +1,134 @@
+"""Unit tests for the zone snapshots reused by the providers between operations"""
+from __future__ import absolute_import
+
+import time
+
+from lexicon import snapshot
+from lexicon.config import ConfigResolver
+from lexicon.providers.base import Provider
+
+
+def _record(identifier, rtype, name, content="127.0.0.1"):
+    return {"id": identifier, "type": rtype, "name": name, "content": content}
+
+
+class _SnapshotProvider(Provider):
+    """Provider storing its zone in memory, and counting the zone listings"""
+
+    def __init__(self, config, write_through=False):
+        super(_SnapshotProvider, self).__init__(config)
+        self.zone = [_record("1", "A", "www.example.com")]
+        self.fetches = 0
+        self.write_through = write_through
+
+    def _fetch_zone_records(self):
+        self.fetches += 1
+        return list(self.zone)
+
+    def _list_records(self, rtype=None, name=None, content=None):
+        return self._get_zone_snapshot().find(rtype=rtype, name=name)
+
+    def _create_record(self, rtype, name, content):
+        if self._list_records(rtype, name):
+            self._keep_zone_snapshot()
+            return True
+        record = _record(str(len(self.zone) + 1), rtype, name, content)
+        self.zone.append(record)
+        zone_snapshot = self._update_zone_snapshot() if self.write_through else None
+        if zone_snapshot:
+            zone_snapshot.add(record)
+        return True
+
+    def _delete_record(self, identifier=None, rtype=None, name=None, content=None):
+        self.zone = [record for record in self.zone if record["id"] != identifier]
+        return True
+
+
+def _provider(write_through=False, **options):
+    options.update({"provider_name": "fake", "domain": "example.com"})
+    return _SnapshotProvider(ConfigResolver().with_dict(options), write_through)
+
+
+def test_snapshot_finds_records_by_name_and_type():
+    zone_snapshot = snapshot.ZoneSnapshot(
+        [
+            _record("1", "A", "www.example.com"),
+            _record("2", "TXT", "www.example.com"),
+            _record("3", "A", "mail.example.com"),
+        ]
+    )
+
+    assert [r["id"] for r in zone_snapshot.find("A", "WWW.example.com.")] == ["1"]
+    assert [r["id"] for r in zone_snapshot.find(name="www.example.com")] == ["1", "2"]
+    assert [r["id"] for r in zone_snapshot.find("A")] == ["1", "3"]
+    assert len(zone_snapshot.find()) == 3
+    assert not zone_snapshot.find("A", "ftp.example.com")
+
+
+def test_snapshot_is_updated_by_add_and_remove():
+    zone_snapshot = snapshot.ZoneSnapshot([_record("1", "A", "www.example.com")])
+
+    zone_snapshot.add(_record("2", "A", "www.example.com", "127.0.0.2"))
+    zone_snapshot.remove("1")
+
+    assert [r["id"] for r in zone_snapshot.find("A", "www.example.com")] == ["2"]
+    assert len(zone_snapshot) == 1
+
+
+def test_snapshot_returns_copies_of_its_records():
+    zone_snapshot = snapshot.ZoneSnapshot([_record("1", "A", "www.example.com")])
+
+    zone_snapshot.find("A", "www.example.com")[0]["content"] = "127.0.0.2"
+
+    assert zone_snapshot.find("A")[0]["content"] == "127.0.0.1"
+
+
+def test_snapshot_expires_after_its_ttl():
+    assert not snapshot.ZoneSnapshot([]).is_expired()
+    assert not snapshot.ZoneSnapshot([], ttl=60).is_expired()
+
+    zone_snapshot = snapshot.ZoneSnapshot([], ttl=0.01)
+    time.sleep(0.02)
+
+    assert zone_snapshot.is_expired()
+
+
+def test_provider_reuses_its_zone_snapshot_between_lookups():
+    provider = _provider()
+
+    provider.list_records("A", "www")
+    provider.list_records("A", "www.example.com")
+
+    assert provider.fetches == 1
+
+
+def test_provider_discards_its_zone_snapshot_after_a_write():
+    provider = _provider()
+
+    provider.create_record("A", "mail.example.com", "127.0.0.2")
+    assert provider.list_records("A", "mail.example.com")
+    provider.delete_record("2")
+
+    assert not provider.list_records("A", "mail.example.com")
+    assert provider.fetches == 3
+
+
+def test_provider_keeps_its_zone_snapshot_updated_by_a_write():
+    provider = _provider(write_through=True)
+
+    provider.create_record("A", "mail.example.com", "127.0.0.2")
+    provider.create_record("A", "mail.example.com", "127.0.0.2")
+
+    assert provider.list_records("A", "mail.example.com")
+    assert provider.fetches == 1
+
+
+def test_provider_zone_snapshot_ttl_is_configurable():
+    provider = _provider(zone_snapshot_ttl="0")
+
+    provider.list_records("A", "www.example.com")
+    provider.list_records("A", "www.example.com")
+
+    assert provider.fetches == 2
+    assert provider._get_zone_snapshot_ttl() == 0
+    assert _provider()._get_zone_snapshot_ttl() == Provider.ZONE_SNAPSHOT_TTL
@@ -0,0 +1,72 @@
+"""Unit tests for the store of the access tokens obtained by providers"""
+from __future__ import absolute_import
+
+import os
+import stat
+import time
+
+import pytest
+
+from lexicon import cache, token_store
+from lexicon.config import ConfigResolver
+from lexicon.providers.base import Provider
+
+
+@pytest.fixture
+def store():
+    previous = token_store.get_token_store()
+    store = token_store.FileTokenStore()
+    token_store.set_token_store(store)
+    yield store
+    token_store.set_token_store(previous)
+
+
+def _provider(**options):
+    config = ConfigResolver().with_dict(
+        {"provider_name": "fake", "domain": "example.com", "fake": options}
+    )
+    return Provider(config)
+
+
+def test_file_store_returns_tokens_until_they_expire(store):
+    store.set("valid", "token1", time.time() + 3600)
+    store.set("expiring", "token2", time.time() + token_store.EXPIRY_MARGIN / 2)
+
+    assert store.get("valid") == "token1"
+    assert store.get("expiring") is None
+    assert store.get("unknown") is None
+
+
+def test_file_store_persists_tokens_readable_only_by_owner(store):
+    store.set("key", "token", time.time() + 3600)
+
+    assert token_store.FileTokenStore().get("key") == "token"
+    mode = os.stat(os.path.join(cache.cache_dir(), "tokens.json")).st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_file_store_deletes_tokens_and_drops_expired_ones(store):
+    store.set("expired", "token1", time.time() - 1)
+    store.set("revoked", "token2", time.time() + 3600)
+    store.delete("revoked")
+
+    assert store.get("revoked") is None
+    assert cache.load("tokens") == {}
+
+
+def test_null_store_does_not_store_tokens():
+    store = token_store.NullTokenStore()
+    store.set("key", "token", time.time() + 3600)
+
+    assert store.get("key") is None
+
+
+def test_provider_tokens_are_shared_by_the_same_account_only(store):
+    _provider(auth_token="secret")._store_token("access", 3600)
+
+    assert _provider(auth_token="secret")._get_stored_token() == "access"
+    assert _provider(auth_token="other")._get_stored_token() is None
+
+    _provider(auth_token="secret")._discard_stored_token()
+
+    assert _provider(auth_token="secret")._get_stored_token() is None
@@ -0,0 +1,80 @@
+"""
+This module handles the access tokens that some providers obtain by exchanging their
+credentials (eg. OAuth), so they can be reused by the next invocations of Lexicon
+until they expire, instead of doing the exchange again.
+
+By default tokens are stored in a cache file readable only by its owner (see
+lexicon.cache). Another store can be registered with set_token_store(), for instance
+NullTokenStore to never persist tokens, or any object implementing TokenStore.
+"""
+import threading
+
+from lexicon import cache
+
+# Tokens are not returned by the store if they expire in less than this number of
+# seconds, so that a token is not used by an operation that would outlive it.
+EXPIRY_MARGIN = 60
+
+_TOKEN_STORE = None
+_TOKEN_STORE_LOCK = threading.Lock()
+
+
+class TokenStore(object):
+    """Interface of the stores of access tokens, identified by a key"""
+
+    def get(self, key):
+        """Return the token with the given key, or None if missing or expired"""
+        raise NotImplementedError("Token stores must implement this!")
+
+    def set(self, key, token, expires_at):
+        """Store the token with the given key, valid until the given epoch time"""
+        raise NotImplementedError("Token stores must implement this!")
+
+    def delete(self, key):
+        """Remove the token with the given key, eg. if it has been revoked"""
+        raise NotImplementedError("Token stores must implement this!")
+
+
+class NullTokenStore(TokenStore):
+    """Token store that does not store anything"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, token, expires_at):
+        pass
+
+    def delete(self, key):
+        pass
+
+
+class FileTokenStore(TokenStore):
+    """Token store keeping the tokens in the given cache file, with their expiry"""
+
+    def __init__(self, name="tokens"):
+        self._name = name
+
+    def get(self, key):
+        return cache.get_entry(self._name, key, margin=EXPIRY_MARGIN)
+
+    def set(self, key, token, expires_at):
+        cache.set_entry(self._name, key, token, expires_at)
+
+    def delete(self, key):
+        cache.delete_entry(self._name, key)
+
+
+def get_token_store():
+    """Return the token store used by the providers of the process"""
+    global _TOKEN_STORE  # pylint: disable=global-statement
+    with _TOKEN_STORE_LOCK:
+        if not _TOKEN_STORE:
+            _TOKEN_STORE = FileTokenStore()
+        return _TOKEN_STORE
+
+
+def set_token_store(store):
+    """Register the token store used by the providers of the process"""
+    global _TOKEN_STORE  # pylint: disable=global-statement
+    with _TOKEN_STORE_LOCK:
+        _TOKEN_STORE = store